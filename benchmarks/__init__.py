@@ -0,0 +1,11 @@
+"""Performance benchmarks; run with ``python -m benchmarks.<module>``.
+
+Settings are read at import time by ``src``, so sensible defaults are put
+in place here before any benchmark module imports the application.
+"""
+
+import os
+
+os.environ.setdefault('DATABASE_URL', 'sqlite+aiosqlite:///:memory:')
+os.environ.setdefault('JWT_SECRET_KEY', 'benchmark-secret')
+os.environ.setdefault('JWT_EXPIRATION_MINUTES', '30')
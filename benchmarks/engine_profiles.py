@@ -0,0 +1,126 @@
+"""Concurrent read/write throughput of each SQLite engine profile.
+
+Each profile gets a fresh on-disk database (WAL has no effect in memory)
+seeded with ``--users`` rows. ``--readers`` tasks then look users up by id
+while ``--writers`` tasks update them, each on its own session, for
+``--duration`` seconds. Writes that still hit "database is locked" after
+the busy timeout are counted as errors.
+
+    python -m benchmarks.engine_profiles --users 10000 --duration 5
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from benchmarks.support import PASSWORD_HASH
+from src.adapters.repositories.user_repository_implementation import (
+    UserRepositoryImplementation,
+)
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.engine import create_engine
+from src.infrastructure.database.seed import seed_users
+from src.infrastructure.database.sqlite_db import Base, UserORM
+
+PROFILES = ('default', 'production')
+
+
+async def reader(session_factory, user_ids, deadline, counters):
+    while time.perf_counter() < deadline:
+        async with session_factory() as session:
+            await UserRepositoryImplementation(session).get_user_by_id(
+                random.choice(user_ids)
+            )
+        counters['reads'] += 1
+
+
+async def writer(session_factory, user_ids, deadline, counters):
+    while time.perf_counter() < deadline:
+        async with session_factory() as session:
+            try:
+                await UserRepositoryImplementation(session).update_user(
+                    random.choice(user_ids),
+                    {'password_hash': f'hash-{random.random()}'},
+                )
+                counters['writes'] += 1
+            except OperationalError:
+                counters['errors'] += 1
+
+
+async def run_profile(
+    profile: str,
+    users: int,
+    readers: int,
+    writers: int,
+    duration: float,
+) -> dict:
+    config = settings.model_copy(update={'DATABASE_PROFILE': profile})
+
+    with tempfile.TemporaryDirectory() as directory:
+        url = f'sqlite+aiosqlite:///{Path(directory) / "users.db"}'
+        engine = create_engine(url, config)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        await seed_users(engine, users, PASSWORD_HASH)
+        async with session_factory() as session:
+            user_ids = list((await session.scalars(select(UserORM.id))).all())
+
+        counters = {'reads': 0, 'writes': 0, 'errors': 0}
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            *(
+                reader(session_factory, user_ids, deadline, counters)
+                for _ in range(readers)
+            ),
+            *(
+                writer(session_factory, user_ids, deadline, counters)
+                for _ in range(writers)
+            ),
+        )
+        await engine.dispose()
+
+    return {
+        'reads_per_second': counters['reads'] / duration,
+        'writes_per_second': counters['writes'] / duration,
+        'write_errors': counters['errors'],
+    }
+
+
+async def run(
+    users: int,
+    readers: int,
+    writers: int,
+    duration: float,
+) -> dict:
+    return {
+        profile: await run_profile(profile, users, readers, writers, duration)
+        for profile in PROFILES
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--duration', type=float, default=5.0)
+    args = parser.parse_args()
+
+    results = asyncio.run(
+        run(args.users, args.readers, args.writers, args.duration)
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""Cost of building ``User`` entities from database reads.
+
+``legacy`` reproduces the original repository reads, which rebuilt every
+user with the validating constructor (``User(**user_orm.__dict__)``,
+including ``EmailStr`` checks). ``trusted`` is the current path through
+``User.from_row``. ``get`` reads one user by id, ``list`` a batch of
+``--page-size`` users by id, as lookups and the id loader do.
+
+    python -m benchmarks.entity_construction --users 10000 --iterations 500
+"""
+
+import argparse
+import asyncio
+import json
+import random
+
+from sqlalchemy import select
+
+from benchmarks.support import PASSWORD_HASH, Stopwatch, create_database
+from src.adapters.repositories.user_repository_implementation import (
+    UserRepositoryImplementation,
+)
+from src.domain.entities.user import User
+from src.infrastructure.database.seed import seed_users
+from src.infrastructure.database.sqlite_db import UserORM
+
+
+async def legacy_get(session, user_ids):
+    result = await session.execute(
+        select(UserORM).where(UserORM.id == user_ids[0])
+    )
+    return User(**result.scalar_one().__dict__)
+
+
+async def trusted_get(session, user_ids):
+    return await UserRepositoryImplementation(session).get_user_by_id(
+        user_ids[0]
+    )
+
+
+async def legacy_list(session, user_ids):
+    result = await session.execute(
+        select(UserORM).where(UserORM.id.in_(user_ids))
+    )
+    return [User(**user_orm.__dict__) for user_orm in result.scalars()]
+
+
+async def trusted_list(session, user_ids):
+    return await UserRepositoryImplementation(session).get_users_by_ids(
+        user_ids
+    )
+
+
+async def time_reads(session_factory, read, batches) -> Stopwatch:
+    stopwatch = Stopwatch()
+    for user_ids in batches:
+        # A fresh session per read, as in a request.
+        async with session_factory() as session:
+            with stopwatch:
+                await read(session, user_ids)
+    return stopwatch
+
+
+async def run(users: int, iterations: int, page_size: int) -> dict:
+    engine, session_factory = await create_database()
+    await seed_users(engine, users, PASSWORD_HASH)
+
+    async with session_factory() as session:
+        ids = list((await session.execute(select(UserORM.id))).scalars())
+
+    results = {}
+    for operation, rows, readers in (
+        ('get', 1, (('legacy', legacy_get), ('trusted', trusted_get))),
+        (
+            'list',
+            page_size,
+            (('legacy', legacy_list), ('trusted', trusted_list)),
+        ),
+    ):
+        batches = [random.sample(ids, rows) for _ in range(iterations)]
+        timings = {}
+        for name, read in readers:
+            stopwatch = await time_reads(session_factory, read, batches)
+            timings[name] = {
+                'per_read_us': stopwatch.elapsed / iterations * 1_000_000,
+                'per_row_us': (
+                    stopwatch.elapsed / (iterations * rows) * 1_000_000
+                ),
+            }
+        timings['saved_per_row_us'] = (
+            timings['legacy']['per_row_us'] - timings['trusted']['per_row_us']
+        )
+        timings['speedup'] = (
+            timings['legacy']['per_row_us'] / timings['trusted']['per_row_us']
+        )
+        results[operation] = timings
+
+    await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--page-size', type=int, default=100)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.users, args.iterations, args.page_size))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Per-row cost of the list read path, before and after projection.
+
+``legacy`` reproduces the original path: select full UserORM entities,
+rebuild a validating ``User`` from ``__dict__`` and ``model_validate`` a
+``UserResponse`` per row. ``projected`` is the current repository path:
+select only the response columns with Core and ``model_construct`` the
+response from the row.
+
+    python -m benchmarks.list_projection --users 10000 --iterations 200
+"""
+
+import argparse
+import asyncio
+import json
+
+from sqlalchemy import select
+
+from benchmarks.support import PASSWORD_HASH, Stopwatch, create_database
+from src.adapters.api.schemas.user import UserResponse
+from src.adapters.repositories.user_repository_implementation import (
+    UserRepositoryImplementation,
+)
+from src.domain.entities.user import User
+from src.domain.ports.user_repository import ListUsersConfig
+from src.infrastructure.database.seed import seed_users
+from src.infrastructure.database.sqlite_db import UserORM
+
+
+async def legacy_page(session, page: int, page_size: int):
+    query = (
+        select(UserORM)
+        .order_by(UserORM.created_at, UserORM.id)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )
+    result = await session.execute(query)
+    users = [User(**user.__dict__) for user in result.scalars().all()]
+    return [UserResponse.model_validate(user) for user in users]
+
+
+async def projected_page(session, page: int, page_size: int):
+    repository = UserRepositoryImplementation(session)
+    users = await repository.list_users(
+        ListUsersConfig(page=page, page_size=page_size)
+    )
+    return [UserResponse.model_construct(**user._asdict()) for user in users]
+
+
+async def run(users: int, iterations: int, page_size: int) -> dict:
+    engine, session_factory = await create_database()
+    await seed_users(engine, users, PASSWORD_HASH)
+
+    pages = max(users // page_size, 1)
+    results = {}
+    for name, read_page in (
+        ('legacy', legacy_page),
+        ('projected', projected_page),
+    ):
+        stopwatch = Stopwatch()
+        for i in range(iterations):
+            # A fresh session per page, as in a request, so the identity
+            # map never short-circuits the ORM hydration being measured.
+            async with session_factory() as session:
+                with stopwatch:
+                    await read_page(session, i % pages + 1, page_size)
+
+        rows = iterations * page_size
+        results[name] = {
+            'per_page_ms': stopwatch.elapsed / iterations * 1_000,
+            'per_row_us': stopwatch.elapsed / rows * 1_000_000,
+        }
+
+    await engine.dispose()
+
+    results['speedup'] = (
+        results['legacy']['per_row_us'] / results['projected']['per_row_us']
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--page-size', type=int, default=100)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.users, args.iterations, args.page_size))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
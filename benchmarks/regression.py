@@ -0,0 +1,280 @@
+"""Performance regression gate over ``benchmarks.routes``.
+
+Loads a baseline written by ``benchmarks.routes --output``, runs the same
+scenarios again with the baseline's settings (users, requests, warmup,
+concurrency) against a fresh temporary SQLite file, and prints a
+per-scenario diff. Exits with status 1 when a scenario's p95 latency or
+SQL statements per request grew beyond the tolerance, when it returned
+unexpected statuses, or when it is missing from the new run. A stored
+run given with ``--current`` is rejected unless it used the baseline's
+settings.
+
+The scenarios are run ``--runs`` times and every figure is the median
+over the runs, so one slow run (a GC pause, a busy neighbour) does not
+fail the gate.
+
+Latency is machine dependent: record the baseline on the machine that
+runs the gate (``--update`` rewrites it from the new run).
+
+    python -m benchmarks.regression --baseline benchmarks/baseline.json
+    python -m benchmarks.regression --baseline benchmarks/baseline.json \\
+        --current results.json --latency-tolerance 1.0
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import median
+
+from benchmarks import routes
+
+SETTINGS = ('users', 'requests', 'warmup', 'concurrency')
+RUNS = 3
+
+
+@dataclass(frozen=True)
+class Tolerance:
+    # Allowed relative growth of p95 latency (0.5 is 50%); even the
+    # median p95 of a few runs moves by up to 30% between identical trees.
+    latency: float = 0.5
+    # Latency growth below this many milliseconds is treated as noise.
+    latency_floor_ms: float = 2.0
+    # Allowed relative growth of SQL statements per request.
+    queries: float = 0.0
+
+
+@dataclass
+class ScenarioDiff:
+    name: str
+    baseline: dict
+    current: dict
+    problems: list[str] = field(default_factory=list)
+
+    @property
+    def regressed(self) -> bool:
+        return bool(self.problems)
+
+
+def _change(baseline: float, current: float) -> float:
+    if baseline == 0:
+        return 0.0 if current == 0 else float('inf')
+    return current / baseline - 1
+
+
+def compare(
+    baseline: dict, current: dict, tolerance: Tolerance
+) -> list[ScenarioDiff]:
+    """Diff of every baseline scenario, in baseline order."""
+    diffs = []
+    for name, before in baseline['scenarios'].items():
+        after = current['scenarios'].get(name)
+        if after is None:
+            # A scenario that crashed or was removed must not pass.
+            diffs.append(
+                ScenarioDiff(name, before, {}, ['missing from the new run'])
+            )
+            continue
+
+        diff = ScenarioDiff(name, before, after)
+        if after['errors']:
+            diff.problems.append(
+                f'{after["errors"]} requests returned an unexpected status'
+            )
+
+        p95_growth = after['p95_ms'] - before['p95_ms']
+        if (
+            _change(before['p95_ms'], after['p95_ms']) > tolerance.latency
+            and p95_growth > tolerance.latency_floor_ms
+        ):
+            diff.problems.append(
+                f'p95 latency grew {p95_growth:.2f} ms, beyond '
+                f'{tolerance.latency:.0%}'
+            )
+
+        if (
+            _change(
+                before['queries_per_request'], after['queries_per_request']
+            )
+            > tolerance.queries
+        ):
+            diff.problems.append(
+                'queries per request grew from '
+                f'{before["queries_per_request"]:.2f} to '
+                f'{after["queries_per_request"]:.2f}'
+            )
+
+        diffs.append(diff)
+
+    return diffs
+
+
+def settings_mismatch(baseline: dict, current: dict) -> list[str]:
+    """The settings ``current`` was run with that differ from the
+    baseline's; figures from different settings are not comparable."""
+    return [
+        f'{name}: baseline {baseline.get(name)}, current {current.get(name)}'
+        for name in SETTINGS
+        if baseline.get(name) != current.get(name)
+    ]
+
+
+def format_report(diffs: list[ScenarioDiff]) -> str:
+    rows = [
+        (
+            'scenario',
+            'p95 base',
+            'p95 now',
+            'change',
+            'queries base',
+            'queries now',
+            'status',
+        )
+    ]
+    for diff in diffs:
+        before, after = diff.baseline, diff.current
+        if not after:
+            rows.append((
+                diff.name,
+                f'{before["p95_ms"]:.2f} ms',
+                '-',
+                '-',
+                f'{before["queries_per_request"]:.2f}',
+                '-',
+                'MISSING',
+            ))
+            continue
+
+        change = _change(before['p95_ms'], after['p95_ms'])
+        rows.append((
+            diff.name,
+            f'{before["p95_ms"]:.2f} ms',
+            f'{after["p95_ms"]:.2f} ms',
+            f'{change:+.0%}',
+            f'{before["queries_per_request"]:.2f}',
+            f'{after["queries_per_request"]:.2f}',
+            'REGRESSED' if diff.regressed else 'ok',
+        ))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = [
+        '  '.join(
+            cell.ljust(width) for cell, width in zip(row, widths)
+        ).rstrip()
+        for row in rows
+    ]
+    lines.extend(
+        f'{diff.name}: {problem}'
+        for diff in diffs
+        for problem in diff.problems
+    )
+    return '\n'.join(lines)
+
+
+def median_run(runs: list[dict]) -> dict:
+    """One run with the median of every figure over ``runs``.
+
+    Errors are the worst run's, so a failure in any run is reported.
+    """
+    scenarios = {}
+    for name in runs[0]['scenarios']:
+        # A scenario missing from any run is left out, and so reported
+        # missing by compare.
+        if any(name not in run['scenarios'] for run in runs):
+            continue
+        results = [run['scenarios'][name] for run in runs]
+        scenarios[name] = {
+            metric: (
+                max(result[metric] for result in results)
+                if metric == 'errors'
+                else median(result[metric] for result in results)
+            )
+            for metric in results[0]
+        }
+
+    return {
+        **{name: runs[0][name] for name in SETTINGS},
+        'runs': len(runs),
+        'scenarios': scenarios,
+    }
+
+
+def rerun(baseline: dict, runs: int = RUNS) -> dict:
+    args = argparse.Namespace(
+        **{name: baseline[name] for name in SETTINGS},
+        scenarios=list(baseline['scenarios']),
+    )
+    return median_run([asyncio.run(routes.run(args)) for _ in range(runs)])
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--baseline', type=Path, required=True)
+    parser.add_argument(
+        '--current',
+        type=Path,
+        help='compare this stored run instead of running the scenarios',
+    )
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=RUNS,
+        help='compare the median of this many runs of the scenarios',
+    )
+    parser.add_argument(
+        '--latency-tolerance', type=float, default=Tolerance.latency
+    )
+    parser.add_argument(
+        '--latency-floor-ms', type=float, default=Tolerance.latency_floor_ms
+    )
+    parser.add_argument(
+        '--query-tolerance', type=float, default=Tolerance.queries
+    )
+    parser.add_argument(
+        '--update',
+        action='store_true',
+        help='write the new run to --baseline after comparing',
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    if args.current:
+        current = json.loads(args.current.read_text())
+        mismatch = settings_mismatch(baseline, current)
+        if mismatch:
+            sys.exit(
+                f'{args.current} was not run with the baseline settings:\n'
+                + '\n'.join(mismatch)
+            )
+    else:
+        current = rerun(baseline, args.runs)
+
+    diffs = compare(
+        baseline,
+        current,
+        Tolerance(
+            args.latency_tolerance,
+            args.latency_floor_ms,
+            args.query_tolerance,
+        ),
+    )
+    print(format_report(diffs))
+
+    if args.update:
+        if any(not diff.current or diff.current['errors'] for diff in diffs):
+            # A run with failing or missing scenarios would hide them.
+            print('baseline not updated: the new run has failures')
+        else:
+            args.baseline.write_text(json.dumps(current, indent=2) + '\n')
+    if any(diff.regressed for diff in diffs):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Per-request setup cost: building services per request vs. a container.
+
+``per_request`` reproduces the original wiring of an authenticated signup:
+the factory builds a repository, a ``PwdlibPasswordHasher`` (which runs
+``PasswordHash.recommended()``) and a ``JWTAuthenticationService``, and
+``get_current_user`` builds another auth service. ``container`` builds only
+the session-bound repository and reuses the application's singletons.
+
+    python -m benchmarks.request_setup --iterations 100000
+"""
+
+import argparse
+import asyncio
+import json
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.support import Stopwatch
+from src.adapters.auth.jwt_auth_service import JWTAuthenticationService
+from src.adapters.auth.pwdlib_password_hasher import PwdlibPasswordHasher
+from src.adapters.repositories.user_repository_implementation import (
+    UserRepositoryImplementation,
+)
+from src.application.use_cases.authenticate_user import AuthenticateUserUseCase
+from src.factories.authenticate_user_factory import authenticate_user_factory
+from src.factories.container import Container, create_container
+
+
+def per_request_setup(session: AsyncSession):
+    JWTAuthenticationService()
+    return AuthenticateUserUseCase(
+        UserRepositoryImplementation(session),
+        PwdlibPasswordHasher(),
+        JWTAuthenticationService(),
+    )
+
+
+def container_setup(session: AsyncSession, container: Container):
+    return authenticate_user_factory(session, container)
+
+
+def run(iterations: int) -> dict:
+    session = AsyncSession()
+    container = create_container()
+
+    results = {}
+    for name, setup in (
+        ('per_request', lambda: per_request_setup(session)),
+        ('container', lambda: container_setup(session, container)),
+    ):
+        stopwatch = Stopwatch()
+        with stopwatch:
+            for _ in range(iterations):
+                setup()
+        results[name] = {
+            'per_request_us': stopwatch.elapsed / iterations * 1_000_000,
+        }
+
+    asyncio.run(container.close())
+
+    results['speedup'] = (
+        results['per_request']['per_request_us']
+        / results['container']['per_request_us']
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.iterations), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""Cost of turning a page of users into JSON, and of the get/list routes.
+
+``serialization`` compares, per page size, the original response path with
+the current one on the same rows. ``legacy`` builds a validating
+``UserListResponse`` and hands it to FastAPI's ``response_model`` handling
+(dump, validate again, serialize, ``json.dumps``). ``fast`` dumps the
+rows as dicts through the precompiled ``user_list_serializer`` straight to
+JSON bytes. ``routes`` times full requests over ASGI.
+
+    python -m benchmarks.response_serialization --users 10000
+"""
+
+import argparse
+import asyncio
+import json
+from statistics import median
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from benchmarks.support import (
+    PASSWORD_HASH,
+    Stopwatch,
+    asgi_client,
+    create_database,
+)
+from src.adapters.api.responses import json_response, user_list_serializer
+from src.adapters.api.schemas.user import UserListResponse, UserResponse
+from src.adapters.repositories.user_repository_implementation import (
+    UserRepositoryImplementation,
+)
+from src.domain.ports.user_repository import ListUsersConfig
+from src.infrastructure.database.seed import seed_users
+
+PAGE_SIZES = (10, 100)
+
+response_field = create_model_field(
+    'Response', UserListResponse, mode='serialization'
+)
+
+
+async def legacy_body(users, page_size: int) -> bytes:
+    response = UserListResponse(
+        items=[
+            UserResponse.model_construct(**user._asdict()) for user in users
+        ],
+        total_items=len(users),
+        page=1,
+        page_size=page_size,
+    )
+    content = await serialize_response(
+        field=response_field, response_content=response
+    )
+    return JSONResponse(content).body
+
+
+async def fast_body(users, page_size: int) -> bytes:
+    return json_response(
+        user_list_serializer,
+        {
+            'items': [user._asdict() for user in users],
+            'total_items': len(users),
+            'page': 1,
+            'page_size': page_size,
+            'next_cursor': None,
+        },
+    ).body
+
+
+async def time_serialization(session_factory, iterations: int) -> dict:
+    results = {}
+    for page_size in PAGE_SIZES:
+        async with session_factory() as session:
+            users = await UserRepositoryImplementation(session).list_users(
+                ListUsersConfig(page=1, page_size=page_size)
+            )
+
+        timings = {}
+        for name, body in (('legacy', legacy_body), ('fast', fast_body)):
+            stopwatch = Stopwatch()
+            with stopwatch:
+                for _ in range(iterations):
+                    await body(users, page_size)
+            timings[name] = {
+                'per_response_us': stopwatch.elapsed / iterations * 1_000_000,
+            }
+
+        timings['speedup'] = (
+            timings['legacy']['per_response_us']
+            / timings['fast']['per_response_us']
+        )
+        results[f'page_size_{page_size}'] = timings
+
+    return results
+
+
+async def time_route(client, url: str, requests: int) -> dict:
+    latencies = []
+    for _ in range(requests):
+        stopwatch = Stopwatch()
+        with stopwatch:
+            response = await client.get(url)
+        response.raise_for_status()
+        latencies.append(stopwatch.elapsed)
+
+    return {
+        'mean_ms': sum(latencies) / requests * 1_000,
+        'p50_ms': median(latencies) * 1_000,
+        'rps': requests / sum(latencies),
+    }
+
+
+async def time_routes(session_factory, requests: int) -> dict:
+    async with asgi_client(session_factory) as client:
+        first = await client.get('/api/v1/users/?page_size=1')
+        user_id = first.json()['items'][0]['id']
+
+        results = {
+            'get': await time_route(
+                client, f'/api/v1/users/{user_id}', requests
+            )
+        }
+        for page_size in PAGE_SIZES:
+            results[f'list_page_size_{page_size}'] = await time_route(
+                client, f'/api/v1/users/?page_size={page_size}', requests
+            )
+
+    return results
+
+
+async def run(users: int, iterations: int, requests: int) -> dict:
+    engine, session_factory = await create_database()
+    await seed_users(engine, users, PASSWORD_HASH)
+
+    results = {
+        'serialization': await time_serialization(session_factory, iterations),
+        'routes': await time_routes(session_factory, requests),
+    }
+
+    await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--iterations', type=int, default=2_000)
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.users, args.iterations, args.requests))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
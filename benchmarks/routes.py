@@ -0,0 +1,303 @@
+"""Per-route latency and throughput of the application, over ASGI.
+
+Drives ``src.main:app`` in-process through an ASGI transport against a
+fresh SQLite file seeded with ``--users`` users, using the production
+engine profile. Every seeded user has the password ``PASSWORD``, so
+``auth_token`` performs real logins. Each scenario sends ``--warmup``
+unrecorded requests, then ``--requests`` timed ones from ``--concurrency``
+concurrent clients, and reports p50/p95/p99 latency, requests/second and
+the SQL statements sent per request.
+
+Scenarios run in order and ``delete`` runs last, since it removes users.
+
+    python -m benchmarks.routes --users 10000 --requests 500
+    python -m benchmarks.routes --users 1000000 --output results.json
+
+``benchmarks.regression`` compares a run against a stored baseline.
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from pathlib import Path
+from statistics import fmean, quantiles
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+)
+
+from benchmarks.support import asgi_client
+from src.adapters.auth.pwdlib_password_hasher import PwdlibPasswordHasher
+from src.infrastructure.database.engine import create_engine
+from src.infrastructure.database.seed import seed_users
+from src.infrastructure.database.sqlite_db import UserORM
+
+PASSWORD = 'benchmark-password'
+PAGE_SIZE = 20
+MIN_REQUESTS = 2
+
+# A request of a scenario: method, URL and httpx keyword arguments.
+RequestSpec = tuple[str, str, dict]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    request: Callable[[int], RequestSpec]
+    expected_status: HTTPStatus
+
+
+def build_scenarios(
+    users: int, read_ids: list[UUID], delete_ids: list[UUID]
+) -> list[Scenario]:
+    def read_id(i: int) -> UUID:
+        return read_ids[i % len(read_ids)]
+
+    last_page = max(users // PAGE_SIZE, 1)
+
+    return [
+        Scenario(
+            'create',
+            lambda i: (
+                'POST',
+                '/api/v1/users/',
+                {
+                    'json': {
+                        'username': f'created{i}',
+                        'email': f'created{i}@example.com',
+                        'password': PASSWORD,
+                    }
+                },
+            ),
+            HTTPStatus.CREATED,
+        ),
+        Scenario(
+            'get',
+            lambda i: ('GET', f'/api/v1/users/{read_id(i)}', {}),
+            HTTPStatus.OK,
+        ),
+        Scenario(
+            'update',
+            lambda i: (
+                'PUT',
+                f'/api/v1/users/{read_id(i)}',
+                {'json': {'username': f'updated{i}'}},
+            ),
+            HTTPStatus.OK,
+        ),
+        Scenario(
+            'list_shallow',
+            lambda i: (
+                'GET',
+                '/api/v1/users/',
+                {'params': {'page': 1, 'page_size': PAGE_SIZE}},
+            ),
+            HTTPStatus.OK,
+        ),
+        Scenario(
+            'list_deep',
+            lambda i: (
+                'GET',
+                '/api/v1/users/',
+                {'params': {'page': last_page, 'page_size': PAGE_SIZE}},
+            ),
+            HTTPStatus.OK,
+        ),
+        Scenario(
+            'list_query',
+            lambda i: (
+                'GET',
+                '/api/v1/users/',
+                {
+                    'params': {
+                        'query': f'user{i % 1000}',
+                        'page_size': PAGE_SIZE,
+                    }
+                },
+            ),
+            HTTPStatus.OK,
+        ),
+        Scenario(
+            'auth_token',
+            lambda i: (
+                'POST',
+                '/api/v1/auth/token',
+                {
+                    'data': {
+                        'username': f'user{i % users}@example.com',
+                        'password': PASSWORD,
+                    }
+                },
+            ),
+            HTTPStatus.CREATED,
+        ),
+        Scenario(
+            'delete',
+            lambda i: ('DELETE', f'/api/v1/users/{delete_ids[i]}', {}),
+            HTTPStatus.OK,
+        ),
+    ]
+
+
+class QueryCounter:
+    """Counts the statements an engine sends to the database."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.count = 0
+        event.listen(engine.sync_engine, 'before_cursor_execute', self._count)
+
+    def _count(self, *_args) -> None:
+        self.count += 1
+
+
+def summarize(
+    latencies: list[float], elapsed: float, errors: int, queries: int
+) -> dict:
+    cuts = quantiles(latencies, n=100, method='inclusive')
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / elapsed,
+        'queries_per_request': queries / len(latencies),
+        'mean_ms': fmean(latencies) * 1_000,
+        'p50_ms': cuts[49] * 1_000,
+        'p95_ms': cuts[94] * 1_000,
+        'p99_ms': cuts[98] * 1_000,
+    }
+
+
+async def run_scenario(
+    client,
+    scenario: Scenario,
+    queries: QueryCounter,
+    args: argparse.Namespace,
+) -> dict:
+    latencies = []
+    errors = []
+    indexes = iter(range(args.warmup + args.requests))
+
+    async def send(i: int) -> tuple[float, bool]:
+        method, url, kwargs = scenario.request(i)
+        start = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        latency = time.perf_counter() - start
+        return latency, response.status_code == scenario.expected_status
+
+    for _ in range(args.warmup):
+        await send(next(indexes))
+
+    async def worker() -> None:
+        # Workers share the iterator, so every index is sent once.
+        for i in indexes:
+            latency, ok = await send(i)
+            latencies.append(latency)
+            if not ok:
+                errors.append(i)
+
+    queries_before = queries.count
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return summarize(
+        latencies, elapsed, len(errors), queries.count - queries_before
+    )
+
+
+async def sample_ids(session_factory, count: int) -> list[UUID]:
+    async with session_factory() as session:
+        result = await session.execute(
+            select(UserORM.id).order_by(func.random()).limit(count)
+        )
+        return list(result.scalars())
+
+
+async def run(args: argparse.Namespace) -> dict:
+    per_scenario = args.warmup + args.requests
+
+    with tempfile.TemporaryDirectory() as directory:
+        url = f'sqlite+aiosqlite:///{Path(directory) / "benchmark.db"}'
+        engine = create_engine(url)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession)
+
+        password_hash = PwdlibPasswordHasher().hash_password(PASSWORD)
+        await seed_users(engine, args.users, password_hash)
+
+        ids = await sample_ids(session_factory, per_scenario * 2)
+        scenarios = build_scenarios(
+            args.users,
+            read_ids=ids[per_scenario:],
+            delete_ids=ids[:per_scenario],
+        )
+
+        queries = QueryCounter(engine)
+        results = {}
+        async with asgi_client(session_factory) as client:
+            for scenario in scenarios:
+                if args.scenarios and scenario.name not in args.scenarios:
+                    continue
+                results[scenario.name] = await run_scenario(
+                    client, scenario, queries, args
+                )
+
+        await engine.dispose()
+
+    return {
+        'users': args.users,
+        'requests': args.requests,
+        'warmup': args.warmup,
+        'concurrency': args.concurrency,
+        'scenarios': results,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument(
+        '--scenarios',
+        type=lambda value: value.split(','),
+        help='comma-separated subset of scenarios to run',
+    )
+    parser.add_argument('--output', type=Path, help='also write JSON here')
+    args = parser.parse_args()
+
+    per_scenario = args.warmup + args.requests
+    if args.requests < MIN_REQUESTS:
+        parser.error(
+            f'--requests must be at least {MIN_REQUESTS} to compute '
+            'percentiles'
+        )
+    if args.users < per_scenario * 2:
+        parser.error(
+            f'--users must be at least {per_scenario * 2} so that deleted '
+            'and read users do not overlap'
+        )
+
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+
+    results = asyncio.run(run(args))
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        args.output.write_text(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.adapters.api.dependencies.database import (
+    get_db_session,
+    get_session_factory,
+)
+from src.adapters.api.dependencies.loaders import get_user_loader
+from src.adapters.repositories.user_loader import UserLoader
+from src.infrastructure.database.sqlite_db import Base
+from src.main import app
+
+# Stored for seeded users whose password is never checked.
+PASSWORD_HASH = 'not-a-real-hash'
+
+
+async def create_database(
+    url: str = 'sqlite+aiosqlite:///:memory:',
+) -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    return engine, async_sessionmaker(engine, expire_on_commit=False)
+
+
+@asynccontextmanager
+async def asgi_client(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[httpx.AsyncClient]:
+    """The application served in-process over ASGI, reading
+    ``session_factory``'s database; requests carry a valid bearer token."""
+
+    async def session():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db_session] = session
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    user_loader = UserLoader(session_factory)
+    app.dependency_overrides[get_user_loader] = lambda: user_loader
+
+    try:
+        async with app.router.lifespan_context(app):
+            token = await app.state.container.auth_service.authenticate(
+                'user0@example.com', ''
+            )
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url='http://benchmark',
+                headers={'Authorization': f'Bearer {token}'},
+            ) as client:
+                yield client
+    finally:
+        app.dependency_overrides.clear()
+
+
+class Stopwatch:
+    def __init__(self):
+        self.elapsed = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.elapsed += time.perf_counter() - self._start
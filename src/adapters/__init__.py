@@ -1,5 +1,6 @@
 import importlib
 
+from .auth.executor_password_hasher import ExecutorPasswordHasher
 from .auth.pwdlib_password_hasher import PwdlibPasswordHasher
 from .repositories.user_repository_implementation import (
     UserRepositoryImplementation,
@@ -11,6 +12,7 @@ JWTAuthenticationService = importlib.import_module(
 ).JWTAuthenticationService
 
 __all__ = [
+    'ExecutorPasswordHasher',
     'JWTAuthenticationService',
     'PwdlibPasswordHasher',
     'UserRepositoryImplementation',
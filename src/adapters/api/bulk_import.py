@@ -0,0 +1,230 @@
+import csv
+import json
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable
+
+from pydantic import TypeAdapter, ValidationError
+
+from src.adapters.api.schemas.user import (
+    UserImportError,
+    UserImportItem,
+    UserImportResponse,
+)
+from src.application.use_cases.create_user import (
+    CreateUserRequest,
+    CreateUserUseCase,
+)
+from src.domain.errors.domain_exceptions import UserAlreadyExistsError
+
+user_import_adapter = TypeAdapter(list[UserImportItem])
+
+
+@dataclass
+class ImportRecord:
+    """One row of an upload: its parsed fields or why it could not be
+    parsed."""
+
+    line: int
+    data: dict | None = None
+    error: str | None = None
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, bytes]]:
+    """Numbered lines of a body, as its chunks arrive."""
+    line_number = 0
+    pending = b''
+    async for chunk in chunks:
+        *lines, pending = (pending + chunk).split(b'\n')
+        for line in lines:
+            line_number += 1
+            yield line_number, line
+
+    if pending:
+        yield line_number + 1, pending
+
+
+async def ndjson_records(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[ImportRecord]:
+    async for line_number, line in iter_lines(chunks):
+        if not line.strip():
+            continue
+
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield ImportRecord(line_number, error='Invalid JSON')
+            continue
+
+        if isinstance(data, dict):
+            yield ImportRecord(line_number, data=data)
+        else:
+            yield ImportRecord(line_number, error='Expected a JSON object')
+
+
+async def csv_records(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[ImportRecord]:
+    """Rows keyed by the header on the first line; empty cells are left
+    out, so a row can carry either ``password`` or ``password_hash``."""
+    header = None
+    async for line_number, line in iter_lines(chunks):
+        if not line.strip():
+            continue
+
+        try:
+            values = next(csv.reader([line.decode().rstrip('\r')]))
+        except (UnicodeDecodeError, csv.Error):
+            yield ImportRecord(line_number, error='Invalid CSV row')
+            continue
+
+        if header is None:
+            header = values
+        elif len(values) != len(header):
+            yield ImportRecord(
+                line_number, error=f'Expected {len(header)} fields'
+            )
+        else:
+            yield ImportRecord(
+                line_number,
+                data={
+                    key: value for key, value in zip(header, values) if value
+                },
+            )
+
+
+IMPORT_FORMATS: dict[
+    str, Callable[[AsyncIterator[bytes]], AsyncIterator[ImportRecord]]
+] = {
+    'application/x-ndjson': ndjson_records,
+    'text/csv': csv_records,
+}
+
+
+def validate_records(
+    records: list[ImportRecord],
+) -> tuple[list[tuple[int, UserImportItem]], list[UserImportError]]:
+    """Validate a chunk of records in one pass over the list adapter.
+
+    Returns the valid items with their line and an error per invalid one.
+    """
+    errors = [
+        UserImportError(line=record.line, detail=record.error)
+        for record in records
+        if record.error is not None
+    ]
+    parsed = [record for record in records if record.error is None]
+
+    try:
+        items = user_import_adapter.validate_python([
+            record.data for record in parsed
+        ])
+    except ValidationError as e:
+        invalid = {}
+        for error in e.errors():
+            index, *field = error['loc']
+            invalid.setdefault(index, _describe(field, error['msg']))
+
+        errors.extend(
+            UserImportError(line=parsed[index].line, detail=detail)
+            for index, detail in invalid.items()
+        )
+        parsed = [
+            record
+            for index, record in enumerate(parsed)
+            if index not in invalid
+        ]
+        # Items are validated independently, so the rest now passes.
+        items = user_import_adapter.validate_python([
+            record.data for record in parsed
+        ])
+
+    return [(record.line, item) for record, item in zip(parsed, items)], errors
+
+
+def _describe(field: list, message: str) -> str:
+    if not field:
+        return message
+    return f'{".".join(str(part) for part in field)}: {message}'
+
+
+async def _chunks(
+    records: AsyncIterator[ImportRecord], size: int
+) -> AsyncIterator[list[ImportRecord]]:
+    chunk = []
+    async for record in records:
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+async def run_import(
+    records: AsyncIterator[ImportRecord],
+    create_user: CreateUserUseCase,
+    batch_size: int,
+    max_reported_errors: int,
+) -> UserImportResponse:
+    """Create the users of an upload, ``batch_size`` rows per transaction.
+
+    Only one chunk of the upload is held at a time; the response counts
+    every row but lists at most ``max_reported_errors`` failures. An
+    unexpected error stops the import after the failing chunk: the
+    chunks before it stay committed, so the summary is still returned,
+    with ``aborted`` set.
+    """
+    summary = UserImportResponse(created=0, failed=0)
+
+    async for chunk in _chunks(records, batch_size):
+        valid, errors = validate_records(chunk)
+        try:
+            errors.extend(await _create(create_user, valid))
+        except Exception as e:
+            errors.extend(
+                UserImportError(line=line, detail=f'Not imported: {e}')
+                for line, _ in valid
+            )
+            summary.aborted = f'Import stopped at line {chunk[0].line}: {e}'
+
+        summary.created += len(chunk) - len(errors)
+        summary.failed += len(errors)
+        room = max_reported_errors - len(summary.errors)
+        summary.errors.extend(
+            sorted(errors, key=lambda error: error.line)[: max(room, 0)]
+        )
+
+        if summary.aborted:
+            break
+
+    return summary
+
+
+async def _create(
+    create_user: CreateUserUseCase,
+    valid: list[tuple[int, UserImportItem]],
+) -> list[UserImportError]:
+    if not valid:
+        return []
+
+    try:
+        results = await create_user.execute_many([
+            CreateUserRequest(
+                item.username, item.email, item.password, item.password_hash
+            )
+            for _, item in valid
+        ])
+    except UserAlreadyExistsError as e:
+        # A concurrent create took one of the rows; the chunk's
+        # transaction was rolled back as a whole.
+        return [UserImportError(line=line, detail=str(e)) for line, _ in valid]
+
+    return [
+        UserImportError(line=valid[result.index][0], detail=result.error)
+        for result in results
+        if result.error
+    ]
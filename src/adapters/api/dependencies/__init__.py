@@ -1,8 +1,13 @@
 from .auth import get_current_user, get_current_user_optional
-from .database import get_db_session
+from .container import get_container
+from .database import get_db_session, get_session_factory
+from .loaders import get_user_loader
 
 __all__ = [
+    'get_container',
     'get_current_user',
     'get_current_user_optional',
     'get_db_session',
+    'get_session_factory',
+    'get_user_loader',
 ]
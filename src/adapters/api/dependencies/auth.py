@@ -4,7 +4,8 @@ from typing import Optional
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 
-from src.adapters.auth.jwt_auth_service import JWTAuthenticationService
+from src.adapters.api.dependencies.container import get_container
+from src.factories.container import Container
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl='/api/v1/auth/token',
@@ -18,9 +19,9 @@ oauth2_scheme_optional = OAuth2PasswordBearer(
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
+    container: Container = Depends(get_container),
 ) -> str:
-    auth_service = JWTAuthenticationService()
-    email = await auth_service.validate_token(token)
+    email = await container.auth_service.validate_token(token)
 
     if email is None:
         raise HTTPException(
@@ -34,11 +35,9 @@ async def get_current_user(
 
 async def get_current_user_optional(
     token: Optional[str] = Depends(oauth2_scheme_optional),
+    container: Container = Depends(get_container),
 ) -> Optional[str]:
     if token is None:
         return None
 
-    auth_service = JWTAuthenticationService()
-    email = await auth_service.validate_token(token)
-
-    return email
+    return await container.auth_service.validate_token(token)
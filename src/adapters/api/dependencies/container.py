@@ -0,0 +1,8 @@
+from fastapi import Request
+
+from src.factories.container import Container
+
+
+def get_container(request: Request) -> Container:
+    """The container created by the app's lifespan handler."""
+    return request.app.state.container
@@ -2,9 +2,15 @@ from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.database.sqlite_db import get_db
+from src.adapters.repositories.user_loader import SessionFactory
+from src.infrastructure.database.sqlite_db import AsyncSessionLocal, get_db
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async for session in get_db():
         yield session
+
+
+def get_session_factory() -> SessionFactory:
+    """Factory for work that outlives or spans requests (e.g. batching)."""
+    return AsyncSessionLocal
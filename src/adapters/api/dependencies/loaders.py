@@ -0,0 +1,12 @@
+from fastapi import Depends
+
+from src.adapters.api.dependencies.container import get_container
+from src.adapters.repositories.user_loader import UserLoader
+from src.factories.container import Container
+
+
+def get_user_loader(
+    container: Container = Depends(get_container),
+) -> UserLoader:
+    """The loader shared by all requests, from the application container."""
+    return container.user_loader
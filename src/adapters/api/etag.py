@@ -0,0 +1,91 @@
+import dataclasses
+import hashlib
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Iterable, Optional
+
+from fastapi import Header, Response
+
+from src.application.use_cases.list_users import ListUsersRequest
+from src.domain.entities.user import User, UserSummary, UserVersion
+
+
+def user_etag(user: User, fields: Optional[list[str]] = None) -> str:
+    """Strong ETag of a single user; every update bumps ``updated_at``.
+
+    A sparse fieldset is a different representation, so it gets its own
+    ETag.
+    """
+    changed_at = user.updated_at or user.created_at
+    etag = f'{user.id.hex}-{changed_at.isoformat()}'
+    if fields:
+        etag = f'{etag}-{"+".join(fields)}'
+    return f'"{etag}"'
+
+
+def collection_etag(
+    request: ListUsersRequest,
+    versions: Iterable[UserVersion | UserSummary],
+    total_items: Optional[int],
+) -> str:
+    """Strong ETag of a list page.
+
+    Covers the parameters that select the page, the size of the whole
+    result (when it is part of the response) and the id/updated_at of every
+    user on it, which is all a page's representation depends on.
+    """
+    digest = hashlib.sha256(
+        repr((dataclasses.astuple(request), total_items)).encode()
+    )
+    for version in versions:
+        digest.update(version.id.bytes)
+        digest.update(
+            version.updated_at.isoformat().encode()
+            if version.updated_at
+            else b'-'
+        )
+
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether ``If-None-Match`` names ``etag`` (RFC 9110, section 13.1.2).
+
+    The comparison is weak, as required for If-None-Match, so ``W/``
+    prefixes added by intermediaries still match.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == '*':
+        return True
+
+    return any(
+        candidate.strip().removeprefix('W/') == etag
+        for candidate in if_none_match.split(',')
+    )
+
+
+@dataclass
+class ConditionalGet:
+    """ETag handling for a GET route: compare with the request's
+    ``If-None-Match``. Routes return their own response, carrying the
+    ETag, when the client's copy is stale."""
+
+    if_none_match: Optional[str]
+
+    def matches(self, etag: str) -> bool:
+        return etag_matches(self.if_none_match, etag)
+
+    @staticmethod
+    def not_modified(etag: str) -> Response:
+        return Response(
+            status_code=HTTPStatus.NOT_MODIFIED,
+            headers={'ETag': etag},
+        )
+
+
+def get_conditional(
+    if_none_match: Optional[str] = Header(None),
+) -> ConditionalGet:
+    return ConditionalGet(if_none_match=if_none_match)
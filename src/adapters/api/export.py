@@ -0,0 +1,89 @@
+import csv
+import io
+import json
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable
+
+from src.domain.entities.user import UserSummary
+
+# Rows encoded into one chunk of the response body.
+EXPORT_CHUNK_ROWS = 500
+
+
+def _user_record(user: UserSummary) -> dict:
+    return {
+        'id': str(user.id),
+        'username': user.username,
+        'email': user.email,
+        'created_at': user.created_at.isoformat(),
+        'updated_at': (
+            user.updated_at.isoformat() if user.updated_at else None
+        ),
+    }
+
+
+async def ndjson_chunks(
+    users: AsyncIterator[UserSummary],
+) -> AsyncIterator[str]:
+    """One JSON object per line, ``EXPORT_CHUNK_ROWS`` lines per chunk."""
+    lines = []
+    async for user in users:
+        lines.append(json.dumps(_user_record(user)) + '\n')
+        if len(lines) == EXPORT_CHUNK_ROWS:
+            yield ''.join(lines)
+            lines.clear()
+
+    if lines:
+        yield ''.join(lines)
+
+
+async def csv_chunks(users: AsyncIterator[UserSummary]) -> AsyncIterator[str]:
+    """A header row followed by one row per user, chunked like NDJSON."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=UserSummary._fields)
+    writer.writeheader()
+
+    rows = 0
+    async for user in users:
+        record = _user_record(user)
+        writer.writerow({**record, 'updated_at': record['updated_at'] or ''})
+        rows += 1
+        if rows == EXPORT_CHUNK_ROWS:
+            yield _drain(buffer)
+            rows = 0
+
+    yield _drain(buffer)
+
+
+def _drain(buffer: io.StringIO) -> str:
+    chunk = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return chunk
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    media_type: str
+    extension: str
+    encode: Callable[[AsyncIterator[UserSummary]], AsyncIterator[str]]
+
+
+EXPORT_FORMATS = {
+    'ndjson': ExportFormat('application/x-ndjson', 'ndjson', ndjson_chunks),
+    'csv': ExportFormat('text/csv', 'csv', csv_chunks),
+}
+
+
+async def export_body(
+    users: AsyncIterator[UserSummary],
+    export_format: ExportFormat,
+    close: Callable[[], Awaitable[None]],
+) -> AsyncIterator[str]:
+    """Encoded ``users``; ``close`` runs once the body is sent or the client
+    goes away, releasing the session the rows are read from."""
+    try:
+        async for chunk in export_format.encode(users):
+            yield chunk
+    finally:
+        await close()
@@ -0,0 +1,58 @@
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, Query
+from fastapi.responses import JSONResponse
+
+from src.adapters.api.schemas.user import UserResponse
+from src.infrastructure import server_timing
+
+USER_FIELDS = list(UserResponse.model_fields)
+
+FIELDS_DESCRIPTION = (
+    'Comma-separated fields to return '
+    f'({", ".join(USER_FIELDS)}); all of them by default'
+)
+
+
+def split_fields(fields: Optional[str]) -> list[str] | None:
+    """Field names of a ``fields`` parameter, in order and deduplicated."""
+    if fields is None:
+        return None
+
+    names = [name.strip() for name in fields.split(',') if name.strip()]
+    return list(dict.fromkeys(names)) or None
+
+
+def get_fields(
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+) -> list[str] | None:
+    names = split_fields(fields)
+    if names and not set(names) <= set(USER_FIELDS):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=f'Fields must be {USER_FIELDS}',
+        )
+    return names
+
+
+def sparse_user(user: Any, fields: list[str]) -> dict:
+    """Only ``fields`` of a user, ready for JSON encoding."""
+    return {name: _json_value(getattr(user, name)) for name in fields}
+
+
+def sparse_response(content: dict, etag: str) -> JSONResponse:
+    # Sparse payloads do not match UserResponse, so they skip the
+    # response model and carry their ETag themselves.
+    with server_timing.timed(server_timing.SERIALIZE):
+        return JSONResponse(content=content, headers={'ETag': etag})
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
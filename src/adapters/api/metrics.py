@@ -0,0 +1,52 @@
+import time
+from http import HTTPStatus
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics import Histogram, http_request_duration
+
+# Label for requests no route matched, so unknown paths cannot grow the
+# number of series.
+UNMATCHED_ROUTE = '<unmatched>'
+
+
+class MetricsMiddleware:
+    """Records every HTTP request's latency by route template and status.
+
+    A plain ASGI middleware: it only wraps ``send`` to read the status,
+    with none of the request/response objects or extra task that
+    ``BaseHTTPMiddleware`` adds. The route template comes from the scope
+    the router fills in, so ``/users/{user_id}`` is a single series. The
+    latency covers the whole response, streamed bodies included.
+    """
+
+    def __init__(
+        self, app: ASGIApp, histogram: Histogram = http_request_duration
+    ):
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = HTTPStatus.INTERNAL_SERVER_ERROR
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get('route')
+            self.histogram.observe(
+                time.perf_counter() - start,
+                scope['method'],
+                route.path if route is not None else UNMATCHED_ROUTE,
+                str(int(status)),
+            )
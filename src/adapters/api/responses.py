@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+
+from src.infrastructure import server_timing
+
+
+class UserPayload(TypedDict):
+    """Serialized shape of ``UserResponse``."""
+
+    id: UUID
+    username: str
+    email: str
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+
+class UserListPayload(TypedDict):
+    """Serialized shape of ``UserListResponse``."""
+
+    items: list[UserPayload]
+    total_items: Optional[int]
+    page: int
+    page_size: int
+    next_cursor: Optional[str]
+
+
+# Serializers are compiled once; dumping a plain dict through them writes
+# JSON bytes directly, without building a model per user.
+user_serializer = TypeAdapter(UserPayload)
+user_list_serializer = TypeAdapter(UserListPayload)
+
+
+def json_response(
+    serializer: TypeAdapter,
+    content: Any,
+    headers: Optional[dict[str, str]] = None,
+) -> Response:
+    """JSON response serialized straight from trusted data to bytes.
+
+    Returning a ``Response`` skips FastAPI's ``response_model`` handling,
+    which would dump, validate again and re-serialize the content. The
+    route's ``response_model`` still documents the payload.
+    """
+    with server_timing.timed(server_timing.SERIALIZE):
+        body = serializer.dump_json(content)
+
+    return Response(
+        content=body,
+        media_type='application/json',
+        headers=headers,
+    )
@@ -5,10 +5,12 @@ from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.api.dependencies.container import get_container
 from src.adapters.api.dependencies.database import get_db_session
 from src.adapters.api.schemas.token import TokenRequest, TokenResponse
 from src.domain.errors.domain_exceptions import CredentialsError
 from src.factories.authenticate_user_factory import authenticate_user_factory
+from src.factories.container import Container
 
 router = APIRouter(prefix='/auth', tags=['auth'])
 
@@ -29,9 +31,10 @@ router = APIRouter(prefix='/auth', tags=['auth'])
 async def authenticate_user(
     form_data: OAuth2PasswordRequestForm = Depends(),
     session: AsyncSession = Depends(get_db_session),
+    container: Container = Depends(get_container),
 ):
     try:
-        authenticate_user = authenticate_user_factory(session)
+        authenticate_user = authenticate_user_factory(session, container)
 
         token_request = TokenRequest(
             email=form_data.username,
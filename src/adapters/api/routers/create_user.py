@@ -3,9 +3,11 @@ from http import HTTPStatus
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.api.dependencies.container import get_container
 from src.adapters.api.dependencies.database import get_db_session
 from src.adapters.api.schemas.user import UserCreate, UserResponse
 from src.domain.errors.domain_exceptions import UserAlreadyExistsError
+from src.factories.container import Container
 from src.factories.create_user_factory import create_user_factory
 
 router = APIRouter(prefix='/users', tags=['users'])
@@ -27,9 +29,10 @@ router = APIRouter(prefix='/users', tags=['users'])
 async def create_user(
     user: UserCreate,
     session: AsyncSession = Depends(get_db_session),
+    container: Container = Depends(get_container),
 ):
     try:
-        create_user = create_user_factory(session)
+        create_user = create_user_factory(session, container)
 
         user = await create_user.execute(
             user.username,
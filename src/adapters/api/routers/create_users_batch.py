@@ -0,0 +1,80 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.api.dependencies.auth import get_current_user
+from src.adapters.api.dependencies.container import get_container
+from src.adapters.api.dependencies.database import get_db_session
+from src.adapters.api.schemas.user import (
+    UserBatchCreate,
+    UserBatchCreateResponse,
+    UserBatchItemResult,
+    UserResponse,
+)
+from src.application.use_cases.create_user import CreateUserRequest
+from src.domain.errors.domain_exceptions import UserAlreadyExistsError
+from src.factories.container import Container
+from src.factories.create_user_factory import create_user_factory
+
+router = APIRouter(prefix='/users', tags=['users'])
+
+
+@router.post(
+    ':batch',
+    response_model=UserBatchCreateResponse,
+    status_code=HTTPStatus.OK,
+    responses={
+        HTTPStatus.OK: {'description': 'Batch processed, see item results'},
+        HTTPStatus.CONFLICT: {
+            'description': 'Batch raced with a concurrent create',
+        },
+        HTTPStatus.UNAUTHORIZED: {'description': 'Not authenticated'},
+        HTTPStatus.INTERNAL_SERVER_ERROR: {
+            'description': 'Internal server error',
+        },
+    },
+)
+async def create_users_batch(
+    batch: UserBatchCreate,
+    session: AsyncSession = Depends(get_db_session),
+    container: Container = Depends(get_container),
+    current_user: str = Depends(get_current_user),
+):
+    try:
+        create_user = create_user_factory(session, container)
+
+        results = await create_user.execute_many([
+            CreateUserRequest(item.username, item.email, item.password)
+            for item in batch.items
+        ])
+
+        return _to_response(results)
+    except UserAlreadyExistsError as e:
+        raise HTTPException(status_code=HTTPStatus.CONFLICT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
+def _to_response(results) -> UserBatchCreateResponse:
+    items = [
+        UserBatchItemResult(
+            index=result.index,
+            status='conflict' if result.error else 'created',
+            user=UserResponse.model_validate(result.user)
+            if result.user
+            else None,
+            detail=result.error,
+        )
+        for result in results
+    ]
+    created = sum(1 for item in items if item.status == 'created')
+
+    return UserBatchCreateResponse(
+        items=items,
+        created=created,
+        failed=len(items) - created,
+    )
@@ -5,8 +5,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.api.dependencies.auth import get_current_user
+from src.adapters.api.dependencies.container import get_container
 from src.adapters.api.dependencies.database import get_db_session
 from src.domain.errors.domain_exceptions import UserNotFoundError
+from src.factories.container import Container
 from src.factories.delete_user_factory import delete_user_factory
 
 router = APIRouter(prefix='/users', tags=['users'])
@@ -27,10 +29,11 @@ router = APIRouter(prefix='/users', tags=['users'])
 async def delete_user(
     user_id: UUID,
     session: AsyncSession = Depends(get_db_session),
+    container: Container = Depends(get_container),
     current_user: str = Depends(get_current_user),
 ):
     try:
-        delete_user = delete_user_factory(session)
+        delete_user = delete_user_factory(session, container)
 
         await delete_user.execute(user_id)
 
@@ -0,0 +1,87 @@
+from contextlib import AsyncExitStack
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+
+from src.adapters.api.dependencies.auth import get_current_user
+from src.adapters.api.dependencies.container import get_container
+from src.adapters.api.dependencies.database import get_session_factory
+from src.adapters.api.export import EXPORT_FORMATS, export_body
+from src.adapters.api.schemas.user import UserExportQueryParams
+from src.adapters.repositories.user_loader import SessionFactory
+from src.application.use_cases.list_users import ExportUsersRequest
+from src.domain.errors.domain_exceptions import (
+    InvalidFilterError,
+    InvalidOrderByError,
+    InvalidOrderDirectionError,
+)
+from src.factories.container import Container
+from src.factories.list_users_factory import list_users_factory
+
+router = APIRouter(prefix='/users', tags=['users'])
+
+
+@router.get(
+    '/export',
+    status_code=HTTPStatus.OK,
+    response_class=StreamingResponse,
+    dependencies=[Depends(get_current_user)],
+    responses={
+        HTTPStatus.OK: {
+            'description': 'All matching users, as NDJSON or CSV',
+            'content': {'application/x-ndjson': {}, 'text/csv': {}},
+        },
+        HTTPStatus.BAD_REQUEST: {'description': 'Invalid parameters'},
+        HTTPStatus.UNAUTHORIZED: {'description': 'Not authenticated'},
+    },
+)
+async def export_users(
+    params: UserExportQueryParams = Depends(),
+    session_factory: SessionFactory = Depends(get_session_factory),
+    container: Container = Depends(get_container),
+):
+    export_request = _to_export_users_request(params)
+    export_format = EXPORT_FORMATS[params.format]
+
+    # The body is sent after the route's dependencies are torn down, so it
+    # reads from a session of its own, closed by the body once it is done.
+    resources = AsyncExitStack()
+    session = await resources.enter_async_context(session_factory())
+
+    try:
+        users = list_users_factory(session, container).stream(export_request)
+    except (
+        InvalidOrderDirectionError,
+        InvalidOrderByError,
+        InvalidFilterError,
+    ) as e:
+        await resources.aclose()
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+
+    return StreamingResponse(
+        export_body(users, export_format, resources.aclose),
+        media_type=export_format.media_type,
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename="users.{export_format.extension}"'
+            ),
+        },
+    )
+
+
+def _to_export_users_request(
+    params: UserExportQueryParams,
+) -> ExportUsersRequest:
+    filters = {}
+    if params.username:
+        filters['username'] = params.username
+    if params.email:
+        filters['email'] = params.email
+
+    return ExportUsersRequest(
+        query=params.query,
+        order_by=params.order_by,
+        order_direction=params.order_direction,
+        filters=filters if filters else None,
+    )
@@ -5,20 +5,47 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.api.dependencies.auth import get_current_user
+from src.adapters.api.dependencies.container import get_container
 from src.adapters.api.dependencies.database import get_db_session
+from src.adapters.api.dependencies.loaders import get_user_loader
+from src.adapters.api.etag import (
+    ConditionalGet,
+    get_conditional,
+    user_etag,
+)
+from src.adapters.api.fields import get_fields, sparse_response, sparse_user
+from src.adapters.api.responses import json_response, user_serializer
 from src.adapters.api.schemas.user import UserResponse
+from src.adapters.repositories.user_loader import UserLoader
+from src.application.use_cases.get_user import GetUserUseCase
 from src.domain.errors.domain_exceptions import UserNotFoundError
+from src.factories.container import Container
 from src.factories.get_user_factory import get_user_factory
 
 router = APIRouter(prefix='/users', tags=['users'])
 
+USER_PAYLOAD_FIELDS = set(UserResponse.model_fields)
+
+
+def get_user_use_case(
+    session: AsyncSession = Depends(get_db_session),
+    container: Container = Depends(get_container),
+    user_loader: UserLoader = Depends(get_user_loader),
+) -> GetUserUseCase:
+    return get_user_factory(session, container, user_loader)
+
 
 @router.get(
     '/{user_id}',
     response_model=UserResponse,
     status_code=HTTPStatus.OK,
+    dependencies=[Depends(get_current_user)],
     responses={
         HTTPStatus.OK: {'description': 'User retrieved successfully'},
+        HTTPStatus.NOT_MODIFIED: {
+            'description': 'User unchanged since the given ETag',
+        },
+        HTTPStatus.BAD_REQUEST: {'description': 'Invalid fields'},
         HTTPStatus.NOT_FOUND: {'description': 'User not found'},
         HTTPStatus.UNAUTHORIZED: {'description': 'Not authenticated'},
         HTTPStatus.INTERNAL_SERVER_ERROR: {
@@ -28,15 +55,27 @@ router = APIRouter(prefix='/users', tags=['users'])
 )
 async def get_user(
     user_id: UUID,
-    session: AsyncSession = Depends(get_db_session),
-    current_user: str = Depends(get_current_user),
+    fields: list[str] | None = Depends(get_fields),
+    get_user: GetUserUseCase = Depends(get_user_use_case),
+    conditional: ConditionalGet = Depends(get_conditional),
 ):
     try:
-        get_user = get_user_factory(session)
-
         user = await get_user.execute(user_id)
 
-        return UserResponse.model_validate(user)
+        etag = user_etag(user, fields)
+        if conditional.matches(etag):
+            return conditional.not_modified(etag)
+
+        if fields:
+            # Users are read whole through the cache, so only the payload
+            # is narrowed here.
+            return sparse_response(sparse_user(user, fields), etag)
+
+        return json_response(
+            user_serializer,
+            user.model_dump(include=USER_PAYLOAD_FIELDS),
+            {'ETag': etag},
+        )
     except UserNotFoundError as e:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=str(e))
     except Exception as e:
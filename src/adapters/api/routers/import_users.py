@@ -0,0 +1,83 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.api.bulk_import import IMPORT_FORMATS, run_import
+from src.adapters.api.dependencies.auth import get_current_user
+from src.adapters.api.dependencies.container import get_container
+from src.adapters.api.dependencies.database import get_db_session
+from src.adapters.api.schemas.user import UserImportResponse
+from src.factories.container import Container
+from src.factories.create_user_factory import create_user_factory
+from src.infrastructure.config.settings import settings
+
+router = APIRouter(prefix='/users', tags=['users'])
+
+
+@router.post(
+    ':import',
+    response_model=UserImportResponse,
+    status_code=HTTPStatus.OK,
+    dependencies=[Depends(get_current_user)],
+    responses={
+        HTTPStatus.OK: {'description': 'Import processed, see errors'},
+        HTTPStatus.UNAUTHORIZED: {'description': 'Not authenticated'},
+        HTTPStatus.UNSUPPORTED_MEDIA_TYPE: {
+            'description': 'Body is neither NDJSON nor CSV',
+        },
+        HTTPStatus.INTERNAL_SERVER_ERROR: {
+            'model': UserImportResponse,
+            'description': (
+                'Import stopped by an error; the body reports the rows '
+                'created before it'
+            ),
+        },
+    },
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                media_type: {'schema': {'type': 'string'}}
+                for media_type in IMPORT_FORMATS
+            },
+        },
+    },
+)
+async def import_users(
+    request: Request,
+    session: AsyncSession = Depends(get_db_session),
+    container: Container = Depends(get_container),
+):
+    media_type = request.headers.get('content-type', '').split(';')[0]
+    parse = IMPORT_FORMATS.get(media_type.strip().lower())
+    if parse is None:
+        raise HTTPException(
+            status_code=HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+            detail=f'Content-Type must be one of {list(IMPORT_FORMATS)}',
+        )
+
+    try:
+        # The body is parsed as it arrives, one chunk of rows at a time.
+        summary = await run_import(
+            parse(request.stream()),
+            create_user_factory(session, container),
+            settings.IMPORT_BATCH_SIZE,
+            settings.IMPORT_MAX_REPORTED_ERRORS,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+    if summary.aborted:
+        # Earlier chunks are committed: the client needs the summary to
+        # know which rows exist.
+        return JSONResponse(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            content=summary.model_dump(mode='json'),
+        )
+
+    return summary
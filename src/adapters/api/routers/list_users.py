@@ -1,23 +1,36 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.api.dependencies.auth import get_current_user
+from src.adapters.api.dependencies.container import get_container
 from src.adapters.api.dependencies.database import get_db_session
+from src.adapters.api.etag import (
+    ConditionalGet,
+    collection_etag,
+    get_conditional,
+)
+from src.adapters.api.fields import sparse_response, sparse_user, split_fields
+from src.adapters.api.responses import json_response, user_list_serializer
 from src.adapters.api.schemas.user import (
     UserListQueryParams,
     UserListResponse,
-    UserResponse,
 )
-from src.application.use_cases.list_users import ListUsersRequest
+from src.application.use_cases.list_users import (
+    ListUsersRequest,
+    ListUsersUseCase,
+)
 from src.domain.errors.domain_exceptions import (
+    InvalidCursorError,
+    InvalidFieldsError,
     InvalidFilterError,
     InvalidOrderByError,
     InvalidOrderDirectionError,
     InvalidPageError,
     InvalidPageSizeError,
 )
+from src.factories.container import Container
 from src.factories.list_users_factory import list_users_factory
 
 router = APIRouter(prefix='/users', tags=['users'])
@@ -29,6 +42,9 @@ router = APIRouter(prefix='/users', tags=['users'])
     response_model=UserListResponse,
     responses={
         HTTPStatus.OK: {'description': 'Users retrieved successfully'},
+        HTTPStatus.NOT_MODIFIED: {
+            'description': 'Page unchanged since the given ETag',
+        },
         HTTPStatus.BAD_REQUEST: {'description': 'Invalid parameters'},
         HTTPStatus.UNAUTHORIZED: {'description': 'Not authenticated'},
         HTTPStatus.INTERNAL_SERVER_ERROR: {
@@ -38,38 +54,24 @@ router = APIRouter(prefix='/users', tags=['users'])
 )
 async def list_users(
     session: AsyncSession = Depends(get_db_session),
+    container: Container = Depends(get_container),
     params: UserListQueryParams = Depends(),
     current_user: str = Depends(get_current_user),
+    conditional: ConditionalGet = Depends(get_conditional),
 ):
+    list_users_request = _to_list_users_request(params)
+
     try:
-        list_users = list_users_factory(session)
-
-        # Convert individual filter parameters to a dictionary
-        filters = {}
-        if params.username:
-            filters['username'] = params.username
-        if params.email:
-            filters['email'] = params.email
-
-        list_users_request = ListUsersRequest(
-            page=params.page,
-            page_size=params.page_size,
-            query=params.query,
-            order_by=params.order_by,
-            order_direction=params.order_direction,
-            filters=filters if filters else None,
-        )
+        list_users = list_users_factory(session, container)
+
+        if conditional.if_none_match:
+            etag = await _current_etag(list_users, list_users_request)
+            if conditional.matches(etag):
+                return conditional.not_modified(etag)
 
         response = await list_users.execute(list_users_request)
 
-        return UserListResponse(
-            items=[
-                UserResponse.model_validate(user) for user in response['items']
-            ],
-            total_items=response['total_items'],
-            page=response['page'],
-            page_size=response['page_size'],
-        )
+        return _to_list_response(list_users_request, response)
     except InvalidPageSizeError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
     except InvalidOrderDirectionError as e:
@@ -80,8 +82,69 @@ async def list_users(
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
     except InvalidOrderByError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+    except InvalidFieldsError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
             detail=str(e),
         )
+
+
+def _to_list_users_request(params: UserListQueryParams) -> ListUsersRequest:
+    # Convert individual filter parameters to a dictionary
+    filters = {}
+    if params.username:
+        filters['username'] = params.username
+    if params.email:
+        filters['email'] = params.email
+
+    return ListUsersRequest(
+        page=params.page,
+        page_size=params.page_size,
+        query=params.query,
+        order_by=params.order_by,
+        order_direction=params.order_direction,
+        filters=filters if filters else None,
+        cursor=params.cursor,
+        include_total=params.include_total,
+        fields=split_fields(params.fields),
+    )
+
+
+async def _current_etag(
+    list_users: ListUsersUseCase, request: ListUsersRequest
+) -> str:
+    # Revalidation only needs the page's ids and updated_at, not its rows.
+    versions = await list_users.execute_versions(request)
+    return collection_etag(request, versions['items'], versions['total_items'])
+
+
+def _to_list_response(
+    request: ListUsersRequest,
+    response: dict,
+) -> Response:
+    etag = collection_etag(request, response['items'], response['total_items'])
+
+    if request.fields:
+        return sparse_response(
+            {
+                **response,
+                'items': [
+                    sparse_user(user, request.fields)
+                    for user in response['items']
+                ],
+            },
+            etag,
+        )
+
+    return json_response(
+        user_list_serializer,
+        {
+            **response,
+            'items': [user._asdict() for user in response['items']],
+        },
+        {'ETag': etag},
+    )
@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.api.dependencies.auth import get_current_user
+from src.adapters.api.dependencies.container import get_container
+from src.adapters.api.dependencies.database import get_db_session
+from src.adapters.api.schemas.user import (
+    UserLookupRequest,
+    UserLookupResponse,
+    UserResponse,
+)
+from src.factories.container import Container
+from src.factories.get_user_factory import get_user_factory
+
+router = APIRouter(prefix='/users', tags=['users'])
+
+
+@router.post(
+    ':lookup',
+    response_model=UserLookupResponse,
+    status_code=HTTPStatus.OK,
+    responses={
+        HTTPStatus.OK: {'description': 'Users retrieved successfully'},
+        HTTPStatus.UNAUTHORIZED: {'description': 'Not authenticated'},
+        HTTPStatus.INTERNAL_SERVER_ERROR: {
+            'description': 'Internal server error',
+        },
+    },
+)
+async def lookup_users(
+    lookup: UserLookupRequest,
+    session: AsyncSession = Depends(get_db_session),
+    container: Container = Depends(get_container),
+    current_user: str = Depends(get_current_user),
+):
+    try:
+        get_user = get_user_factory(session, container)
+
+        users = await get_user.execute_many(lookup.ids)
+
+        found = {user.id for user in users}
+        return UserLookupResponse(
+            items=[UserResponse.model_validate(user) for user in users],
+            missing=[
+                user_id
+                for user_id in dict.fromkeys(lookup.ids)
+                if user_id not in found
+            ],
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
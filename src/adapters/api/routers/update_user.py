@@ -5,12 +5,14 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.api.dependencies.auth import get_current_user
+from src.adapters.api.dependencies.container import get_container
 from src.adapters.api.dependencies.database import get_db_session
 from src.adapters.api.schemas.user import UserResponse, UserUpdate
 from src.domain.errors.domain_exceptions import (
     UserAlreadyExistsError,
     UserNotFoundError,
 )
+from src.factories.container import Container
 from src.factories.update_user_factory import update_user_factory
 
 router = APIRouter(prefix='/users', tags=['users'])
@@ -34,10 +36,11 @@ async def update_user(
     user_id: UUID,
     user: UserUpdate,
     session: AsyncSession = Depends(get_db_session),
+    container: Container = Depends(get_container),
     current_user: str = Depends(get_current_user),
 ):
     try:
-        update_user = update_user_factory(session)
+        update_user = update_user_factory(session, container)
 
         user = await update_user.execute(
             user_id,
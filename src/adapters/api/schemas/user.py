@@ -1,8 +1,14 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, model_validator
+
+# PHC string of an Argon2 hash, as produced by pwdlib/argon2-cffi.
+ARGON2_HASH_PATTERN = (
+    r'^\$argon2(id|i|d)\$v=\d+\$m=\d+,t=\d+,p=\d+'
+    r'\$[A-Za-z0-9+/]+\$[A-Za-z0-9+/]+$'
+)
 
 
 class UserCreate(BaseModel):
@@ -34,11 +40,86 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+class UserBatchCreate(BaseModel):
+    items: List[UserCreate] = Field(..., min_length=1, max_length=1000)
+
+
+class UserBatchItemResult(BaseModel):
+    index: int = Field(..., description='Position of the item in the request')
+    status: Literal['created', 'conflict']
+    user: Optional[UserResponse] = None
+    detail: Optional[str] = None
+
+
+class UserBatchCreateResponse(BaseModel):
+    items: List[UserBatchItemResult]
+    created: int = Field(..., ge=0)
+    failed: int = Field(..., ge=0)
+
+
+class UserImportItem(BaseModel):
+    username: str = Field(..., min_length=3, max_length=50)
+    email: EmailStr
+    password: Optional[str] = Field(None, min_length=8)
+    password_hash: Optional[str] = Field(
+        None,
+        pattern=ARGON2_HASH_PATTERN,
+        description='Argon2 hash to store as is, instead of a password',
+    )
+
+    @model_validator(mode='after')
+    def check_one_password(self) -> 'UserImportItem':
+        if (self.password is None) == (self.password_hash is None):
+            raise ValueError('Provide either password or password_hash')
+        return self
+
+
+class UserImportError(BaseModel):
+    line: int = Field(..., description='Line of the row in the upload')
+    detail: str
+
+
+class UserImportResponse(BaseModel):
+    created: int = Field(..., ge=0)
+    failed: int = Field(..., ge=0)
+    errors: List[UserImportError] = Field(
+        default_factory=list,
+        description='Failed rows, up to IMPORT_MAX_REPORTED_ERRORS',
+    )
+    aborted: Optional[str] = Field(
+        None,
+        description=(
+            'Error that stopped the import: earlier rows are counted above, '
+            'later ones were not read'
+        ),
+    )
+
+
+class UserLookupRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=100)
+
+
+class UserLookupResponse(BaseModel):
+    items: List[UserResponse]
+    missing: List[UUID] = Field(
+        default_factory=list,
+        description='Requested ids that do not exist',
+    )
+
+
 class UserListResponse(BaseModel):
     items: List[UserResponse]
-    total_items: int = Field(..., ge=0)
+    total_items: Optional[int] = Field(
+        None,
+        ge=0,
+        description='Total matching users; omitted when include_total=false',
+    )
     page: int = Field(..., ge=1)
     page_size: int = Field(..., ge=1, le=100)
+    next_cursor: Optional[str] = Field(
+        None,
+        description='Opaque cursor for the next page, if any',
+    )
 
 
 class UserListQueryParams(BaseModel):
@@ -61,3 +142,42 @@ class UserListQueryParams(BaseModel):
     )
     username: Optional[str] = Field(None, description='Filter by username')
     email: Optional[str] = Field(None, description='Filter by email')
+    include_total: bool = Field(
+        True,
+        description='Compute total_items (set false to skip the count)',
+    )
+    cursor: Optional[str] = Field(
+        None,
+        description=(
+            'Opaque cursor from a previous next_cursor; '
+            'takes precedence over page'
+        ),
+    )
+    fields: Optional[str] = Field(
+        None,
+        description=(
+            'Comma-separated fields to return '
+            '(id, username, email, created_at, updated_at)'
+        ),
+    )
+
+
+class UserExportQueryParams(BaseModel):
+    format: Literal['ndjson', 'csv'] = Field(
+        'ndjson',
+        description='Output format (ndjson, csv)',
+    )
+    query: Optional[str] = Field(
+        None,
+        description='Search query for name or email',
+    )
+    order_by: Optional[str] = Field(
+        None,
+        description='Field to order by (name, email, created_at)',
+    )
+    order_direction: Optional[str] = Field(
+        None,
+        description='Order direction (asc, desc)',
+    )
+    username: Optional[str] = Field(None, description='Filter by username')
+    email: Optional[str] = Field(None, description='Filter by email')
@@ -0,0 +1,54 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure import server_timing
+from src.infrastructure.config.settings import settings
+
+# Request header a client sends to ask for the breakdown.
+REQUEST_HEADER = b'x-server-timing'
+
+
+class ServerTimingMiddleware:
+    """Adds a ``Server-Timing`` header to responses that opted in.
+
+    With ``mode='always'`` every response carries it; with ``'header'``
+    only requests sending ``X-Server-Timing`` do, and ``'off'`` disables
+    it. The header is written when the response starts, so a streamed
+    body's own time is not part of it.
+    """
+
+    def __init__(self, app: ASGIApp, mode: str = settings.SERVER_TIMING):
+        self.app = app
+        self.mode = mode
+
+    def _requested(self, scope: Scope) -> bool:
+        if self.mode == 'always':
+            return True
+        if self.mode == 'header':
+            return any(name == REQUEST_HEADER for name, _ in scope['headers'])
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http' or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        timing, token = server_timing.start()
+
+        async def send_with_timing(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                message = {
+                    **message,
+                    'headers': [
+                        *message.get('headers', ()),
+                        (
+                            b'server-timing',
+                            timing.header_value().encode('latin-1'),
+                        ),
+                    ],
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            server_timing.stop(token)
@@ -0,0 +1,61 @@
+from http import HTTPStatus
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.adapters.api.metrics import UNMATCHED_ROUTE
+from src.infrastructure.tracing import Tracer, parse_traceparent, tracer
+
+
+class TracingMiddleware:
+    """Opens the root span of every HTTP request.
+
+    The span is named after the route template once routing has run
+    (``GET /api/v1/users/{user_id}``), so it stands for the router;
+    use case, repository, hasher and token spans opened while serving the
+    request become its children. An incoming W3C ``traceparent`` header
+    makes the request part of the caller's trace and carries its sampling
+    decision.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer = tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http' or not self.tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status = HTTPStatus.INTERNAL_SERVER_ERROR
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        parent = parse_traceparent(
+            dict(scope['headers']).get(b'traceparent', b'').decode('latin-1')
+        )
+        method = scope['method']
+        with self.tracer.span(
+            method,
+            parent,
+            **{
+                'http.request.method': method,
+                'url.path': scope['path'],
+            },
+        ) as span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                if span is not None:
+                    route = scope.get('route')
+                    path = route.path if route is not None else UNMATCHED_ROUTE
+                    span.name = f'{method} {path}'
+                    span.set_attribute('http.route', path)
+                    span.set_attribute(
+                        'http.response.status_code', int(status)
+                    )
+                    if status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                        span.set_error(f'HTTP {int(status)}')
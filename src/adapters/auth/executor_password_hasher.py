@@ -0,0 +1,139 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+from src.adapters.auth.pwdlib_password_hasher import PwdlibPasswordHasher
+from src.domain.ports.hash_service import AsyncHashService
+from src.infrastructure import server_timing
+from src.infrastructure.config.settings import settings
+from src.infrastructure.metrics import password_hash_duration
+from src.infrastructure.tracing import traced
+
+
+@lru_cache(maxsize=1)
+def _get_worker_hasher() -> PwdlibPasswordHasher:
+    return PwdlibPasswordHasher()
+
+
+# Workers time the hasher themselves and send the duration back with the
+# result: metrics recorded inside a pool process would never reach the
+# application's registry, and timing around the executor would include
+# the wait for a free worker.
+def _hash_password(password: str) -> tuple[str, float]:
+    start = time.perf_counter()
+    hashed_password = _get_worker_hasher().hash_password(password)
+    return hashed_password, time.perf_counter() - start
+
+
+def _verify_password(
+    password: str, hashed_password: str
+) -> tuple[bool, float]:
+    start = time.perf_counter()
+    valid = _get_worker_hasher().verify_password(password, hashed_password)
+    return valid, time.perf_counter() - start
+
+
+def _worker_context():
+    # Workers start lazily, once the process already runs aiosqlite and
+    # executor threads; forking a multithreaded process can deadlock, so
+    # they come from a fork server (or a fresh interpreter) instead.
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def create_hash_executor(
+    kind: str = settings.HASH_EXECUTOR,
+    max_workers: int | None = settings.HASH_MAX_WORKERS,
+) -> Executor:
+    if kind == 'process':
+        try:
+            return ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=_worker_context()
+            )
+        except (ImportError, NotImplementedError, OSError):
+            # e.g. platforms without working semaphores (AWS Lambda)
+            pass
+
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix='password-hasher',
+    )
+
+
+class HashExecutor:
+    """The executor password hashing runs on.
+
+    Owned by the application container, which shuts down whichever
+    executor is current when the application stops.
+    """
+
+    def __init__(self, executor: Executor):
+        self.current = executor
+
+    def replace_broken(self, broken: Executor) -> Executor:
+        """Swap a broken process pool for threads, once.
+
+        Every request in flight when a pool breaks reports the same pool;
+        only the first one replaces it, the others reuse the replacement.
+        """
+        if self.current is broken:
+            self.current = create_hash_executor('thread')
+            broken.shutdown(wait=False, cancel_futures=True)
+        return self.current
+
+    def shutdown(self) -> None:
+        self.current.shutdown(wait=False, cancel_futures=True)
+
+
+class ExecutorPasswordHasher(AsyncHashService):
+    def __init__(self, executor: HashExecutor):
+        self.executor = executor
+
+    @traced()
+    async def hash_password(self, password: str) -> str:
+        return await self._timed('hash', _hash_password, password)
+
+    @traced()
+    async def verify_password(
+        self, password: str, hashed_password: str
+    ) -> bool:
+        return await self._timed(
+            'verify', _verify_password, password, hashed_password
+        )
+
+    @traced()
+    async def hash_passwords(self, passwords: list[str]) -> list[str]:
+        # One task per password so the executor spreads them over workers.
+        return list(
+            await asyncio.gather(
+                *(
+                    self._timed('hash', _hash_password, password)
+                    for password in passwords
+                )
+            )
+        )
+
+    async def _timed(self, operation: str, func, *args):
+        result, seconds = await self._run(func, *args)
+        password_hash_duration.observe(seconds, operation)
+        server_timing.record(server_timing.HASH, seconds)
+        return result
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        executor = self.executor.current
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            # A worker died (OOM killer, fork issues); keep serving on
+            # threads instead of failing every subsequent login.
+            executor = self.executor.replace_broken(executor)
+            return await loop.run_in_executor(executor, func, *args)
@@ -1,18 +1,23 @@
 import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from jose import JWTError, jwt
 
+from src.adapters.auth.token_cache import VerifiedTokenCache
 from src.domain.ports.auth_service import AuthService
+from src.infrastructure import server_timing
 from src.infrastructure.config.settings import settings
+from src.infrastructure.tracing import traced
 
 
 class JWTAuthenticationService(AuthService):
-    def __init__(self):
+    def __init__(self, token_cache: Optional[VerifiedTokenCache] = None):
         self.secret_key = settings.JWT_SECRET_KEY
         self.algorithm = 'HS256'
         self.token_expiracy_minutes = settings.JWT_EXPIRATION_MINUTES
+        self.token_cache = token_cache
 
+    @traced()
     async def authenticate(self, email: str, password: str) -> str:
         payload = {
             'sub': email,
@@ -22,20 +27,44 @@ class JWTAuthenticationService(AuthService):
             ),
         }
 
-        return jwt.encode(
-            payload,
-            self.secret_key,
-            algorithm=self.algorithm,
-        )
-
-    async def validate_token(self, token: str) -> Optional[str]:
-        try:
-            payload = jwt.decode(
-                token,
+        with server_timing.timed(server_timing.JWT):
+            return jwt.encode(
+                payload,
                 self.secret_key,
-                algorithms=[self.algorithm],
+                algorithm=self.algorithm,
             )
 
-            return payload.get('sub')
-        except JWTError:
+    @traced()
+    async def validate_token(self, token: str) -> Optional[str]:
+        # Clients reuse the same token for many calls, so the signature is
+        # only verified the first time until the token expires.
+        if self.token_cache is not None:
+            email = self.token_cache.get(token)
+            if email is not None:
+                return email
+
+        payload = self.decode_token(token)
+        if payload is None:
             return None
+
+        email = payload.get('sub')
+        expires_at = payload.get('exp')
+        if (
+            self.token_cache is not None
+            and email is not None
+            and expires_at is not None
+        ):
+            self.token_cache.put(token, email, expires_at)
+
+        return email
+
+    def decode_token(self, token: str) -> Optional[dict[str, Any]]:
+        with server_timing.timed(server_timing.JWT):
+            try:
+                return jwt.decode(
+                    token,
+                    self.secret_key,
+                    algorithms=[self.algorithm],
+                )
+            except JWTError:
+                return None
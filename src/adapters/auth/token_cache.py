@@ -0,0 +1,99 @@
+import hashlib
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Optional
+
+from src.infrastructure.metrics import Gauge, Registry, registry
+
+METRICS = {
+    'hits': 'Bearer tokens found in the verified-token cache.',
+    'misses': 'Bearer tokens whose signature had to be verified.',
+    'size': 'Tokens held in the verified-token cache.',
+}
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of tokens whose signature has already been verified.
+
+    Entries are keyed by the token's SHA-256 digest, so raw bearer tokens
+    are never held in memory, and they are dropped once the token's ``exp``
+    claim has passed. Invalid tokens are never cached.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_size = max_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[str, float]] = OrderedDict()
+
+    def get(self, token: str) -> Optional[str]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        subject, expires_at = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return subject
+
+    def put(self, token: str, subject: str, expires_at: float) -> None:
+        if self.max_size <= 0 or expires_at <= self.clock():
+            return
+
+        key = self._key(token)
+        self._entries[key] = (subject, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+
+def instrument_token_cache(
+    cache: VerifiedTokenCache, metrics: Registry = registry
+) -> None:
+    """Expose the cache's hits, misses and size as gauges."""
+    for stat, documentation in METRICS.items():
+        metrics.register(
+            Gauge(
+                f'jwt_token_cache_{stat}',
+                documentation,
+                partial(_stat, cache, stat),
+            )
+        )
+
+
+def _stat(cache: VerifiedTokenCache, stat: str) -> dict[tuple, int]:
+    return {(): cache.stats()[stat]}
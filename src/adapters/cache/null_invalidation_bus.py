@@ -0,0 +1,18 @@
+from src.domain.ports.invalidation_bus import (
+    InvalidationBus,
+    InvalidationHandler,
+    UserInvalidation,
+)
+
+
+class NullInvalidationBus(InvalidationBus):
+    """For single-process deployments, where there is nobody to notify."""
+
+    async def start(self, handler: InvalidationHandler) -> None:
+        pass
+
+    async def publish(self, invalidation: UserInvalidation) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
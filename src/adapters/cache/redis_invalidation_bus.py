@@ -0,0 +1,141 @@
+import asyncio
+import contextlib
+import importlib
+import logging
+from typing import Any, AsyncIterator
+from uuid import uuid4
+
+from src.domain.ports.invalidation_bus import (
+    InvalidationBus,
+    InvalidationHandler,
+    UserInvalidation,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RedisInvalidationBus(InvalidationBus):
+    """Bus over a Redis pub/sub channel, for workers on several hosts.
+
+    ``client`` is anything with the ``redis.asyncio.Redis`` pub/sub API
+    (``publish`` and ``pubsub``), such as ``InMemoryRedis`` in tests.
+    """
+
+    def __init__(self, client: Any, channel: str):
+        self.client = client
+        self.channel = channel
+        self.origin = uuid4().hex
+        self._pubsub = None
+        self._listener: asyncio.Task | None = None
+
+    async def start(self, handler: InvalidationHandler) -> None:
+        self._pubsub = self.client.pubsub()
+        await self._pubsub.subscribe(self.channel)
+        self._listener = asyncio.get_running_loop().create_task(
+            self._listen(handler)
+        )
+
+    async def publish(self, invalidation: UserInvalidation) -> None:
+        message = UserInvalidation(
+            user_ids=invalidation.user_ids,
+            keys=invalidation.keys,
+            origin=self.origin,
+        )
+        try:
+            await self.client.publish(self.channel, message.dumps())
+        except Exception:
+            # The write has already been committed; other workers fall
+            # back to their cache TTL.
+            logger.exception('Could not publish cache invalidation')
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self.channel)
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+    async def _listen(self, handler: InvalidationHandler) -> None:
+        async for message in self._pubsub.listen():
+            if message['type'] != 'message':
+                continue
+            try:
+                invalidation = UserInvalidation.loads(message['data'])
+            except Exception:
+                logger.exception('Dropping malformed cache invalidation')
+                continue
+            if invalidation.origin != self.origin:
+                handler(invalidation)
+
+
+def create_redis_client(url: str) -> Any:
+    if url == 'memory://':
+        return InMemoryRedis()
+
+    try:
+        redis = importlib.import_module('redis.asyncio')
+    except ImportError as e:
+        raise ImportError(
+            'The redis invalidation bus requires the redis package '
+            '(pip install redis)'
+        ) from e
+
+    return redis.Redis.from_url(url)
+
+
+class InMemoryRedis:
+    """Local stand-in for the Redis pub/sub API used by the bus.
+
+    Only delivers messages within one process, which is enough to run the
+    Redis backend in tests and development without a server.
+    """
+
+    def __init__(self):
+        self.subscribers: dict[str, set[asyncio.Queue]] = {}
+
+    async def publish(self, channel: str, data: bytes) -> int:
+        queues = self.subscribers.get(channel, set())
+        for queue in queues:
+            queue.put_nowait({
+                'type': 'message',
+                'channel': channel,
+                'data': data,
+            })
+        return len(queues)
+
+    def pubsub(self) -> 'InMemoryPubSub':
+        return InMemoryPubSub(self)
+
+
+class InMemoryPubSub:
+    def __init__(self, client: InMemoryRedis):
+        self.client = client
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.channels: set[str] = set()
+
+    async def subscribe(self, *channels: str) -> None:
+        for channel in channels:
+            self.client.subscribers.setdefault(channel, set()).add(self.queue)
+            self.channels.add(channel)
+            self.queue.put_nowait({
+                'type': 'subscribe',
+                'channel': channel,
+                'data': len(self.channels),
+            })
+
+    async def unsubscribe(self, *channels: str) -> None:
+        for channel in channels or tuple(self.channels):
+            self.client.subscribers.get(channel, set()).discard(self.queue)
+            self.channels.discard(channel)
+
+    async def listen(self) -> AsyncIterator[dict]:
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self) -> None:
+        await self.unsubscribe()
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import os
+import socket
+from pathlib import Path
+from typing import Iterator
+from uuid import uuid4
+
+from src.domain.ports.invalidation_bus import (
+    InvalidationBus,
+    InvalidationHandler,
+    UserInvalidation,
+)
+
+logger = logging.getLogger(__name__)
+
+# Larger invalidations are split, well below the kernel's datagram limit.
+MAX_DATAGRAM_BYTES = 32 * 1024
+# A full peer queue is retried with a doubling delay: about 0.25 s in all.
+SEND_RETRIES = 8
+RETRY_DELAY = 0.001
+
+
+class _Receiver(asyncio.DatagramProtocol):
+    def __init__(self, handler: InvalidationHandler):
+        self.handler = handler
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        try:
+            self.handler(UserInvalidation.loads(data))
+        except Exception:
+            logger.exception('Dropping malformed cache invalidation')
+
+
+class UnixSocketInvalidationBus(InvalidationBus):
+    """Same-host bus over Unix datagram sockets, one per process.
+
+    Every process binds a socket in ``directory`` and publishing sends one
+    datagram to each of the other sockets found there, so workers started
+    by ``uvicorn --workers N`` see each other's writes without any broker.
+    The peer list is only re-read when the directory changes, and sockets
+    left behind by dead processes are removed on the first failed send.
+
+    Unix datagrams are not lost in transit, but a peer whose queue stays
+    full (a worker blocked for longer than the retries) misses the
+    invalidation; its cache TTL then bounds how stale it can get.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.path = self.directory / f'{os.getpid()}-{uuid4().hex[:8]}.sock'
+        self._transport: asyncio.DatagramTransport | None = None
+        self._sender: socket.socket | None = None
+        self._peers: list[Path] = []
+        self._scanned_at: int | None = None
+
+    async def start(self, handler: InvalidationHandler) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _Receiver(handler),
+            local_addr=str(self.path),
+            family=socket.AF_UNIX,
+        )
+
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sender.setblocking(False)
+
+    async def publish(self, invalidation: UserInvalidation) -> None:
+        if self._sender is None:
+            return
+
+        datagrams = list(_datagrams(invalidation))
+        for peer in self.peers():
+            for data in datagrams:
+                if not await self._send(data, peer):
+                    break
+
+    def peers(self) -> list[Path]:
+        """The other processes' sockets, re-listed only when a socket has
+        been created or removed since the last call."""
+        modified_at = self.directory.stat().st_mtime_ns
+        if modified_at != self._scanned_at:
+            self._scanned_at = modified_at
+            self._peers = [
+                peer
+                for peer in self.directory.glob('*.sock')
+                if peer != self.path
+            ]
+        return self._peers
+
+    async def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._sender is not None:
+            self._sender.close()
+            self._sender = None
+        self.path.unlink(missing_ok=True)
+
+    async def _send(self, data: bytes, peer: Path) -> bool:
+        delay = RETRY_DELAY
+        for _ in range(SEND_RETRIES):
+            if self._sender is None:
+                return False
+            try:
+                self._sender.sendto(data, str(peer))
+                return True
+            except (ConnectionRefusedError, FileNotFoundError):
+                peer.unlink(missing_ok=True)
+                return False
+            except BlockingIOError:
+                # The peer's queue is full; give it time to drain.
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        logger.warning('Cache invalidation to %s dropped', peer)
+        return False
+
+
+def _datagrams(invalidation: UserInvalidation) -> Iterator[bytes]:
+    data = invalidation.dumps()
+    entries = len(invalidation.user_ids) + len(invalidation.keys)
+    if len(data) <= MAX_DATAGRAM_BYTES or entries <= 1:
+        yield data
+        return
+
+    for half in invalidation.halves():
+        yield from _datagrams(half)
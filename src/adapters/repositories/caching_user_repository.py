@@ -0,0 +1,304 @@
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Optional,
+)
+from uuid import UUID
+
+from pydantic import EmailStr
+
+from src.domain.entities.user import User, UserSummary, UserVersion
+from src.domain.ports.invalidation_bus import InvalidationBus, UserInvalidation
+from src.domain.ports.user_repository import ListUsersConfig, UserRepository
+
+CacheKey = tuple[str, Hashable]
+
+MISSING = object()
+
+
+def user_keys(user: User) -> list[CacheKey]:
+    return [
+        ('id', user.id),
+        ('email', user.email),
+        ('username', user.username),
+    ]
+
+
+class UserCache:
+    """In-process LRU+TTL of users keyed by id, email and username.
+
+    A found user is stored under all three keys; a miss is stored under the
+    key that was looked up, with a shorter TTL (negative caching). Every
+    invalidation bumps ``version`` so that a read which raced with a write
+    does not put the value it loaded before the write back into the cache.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 30.0,
+        negative_ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[CacheKey, tuple[User | None, float]] = (
+            OrderedDict()
+        )
+        self._keys_by_id: dict[UUID, set[CacheKey]] = {}
+
+    def get(self, key: CacheKey) -> Any:
+        """The cached user, ``None`` for a cached miss, else ``MISSING``."""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return MISSING
+
+        user, expires_at = entry
+        if expires_at <= self.clock():
+            self._remove(key)
+            self.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return user
+
+    def put(self, key: CacheKey, user: User | None, version: int) -> None:
+        if self.max_size <= 0 or version != self.version:
+            return
+
+        if user is None:
+            self._store(key, None, self.clock() + self.negative_ttl)
+            return
+
+        expires_at = self.clock() + self.ttl
+        for user_key in user_keys(user):
+            self._store(user_key, user, expires_at)
+
+    def invalidate(
+        self,
+        user_ids: Iterable[UUID] = (),
+        keys: Iterable[CacheKey] = (),
+    ) -> None:
+        self.version += 1
+
+        for user_id in user_ids:
+            for key in list(self._keys_by_id.get(user_id, ())):
+                self._remove(key)
+        for key in keys:
+            self._remove(key)
+
+    def apply(self, invalidation: UserInvalidation) -> None:
+        """Invalidation received from another process."""
+        self.invalidate(invalidation.user_ids, invalidation.keys)
+
+    def clear(self) -> None:
+        self.version += 1
+        self._entries.clear()
+        self._keys_by_id.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(
+        self, key: CacheKey, user: User | None, expires_at: float
+    ) -> None:
+        self._remove(key)
+        self._entries[key] = (user, expires_at)
+        if user is not None:
+            self._keys_by_id.setdefault(user.id, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[0] is None:
+            return
+
+        user_id = entry[0].id
+        keys = self._keys_by_id.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_id[user_id]
+
+
+class CachingUserRepository(UserRepository):
+    """Read-through ``UserRepository`` decorator backed by a ``UserCache``.
+
+    Lookups by id, email and username are served from the cache without
+    touching the wrapped repository (and so without opening a connection);
+    writes go to the wrapped repository and then invalidate the users they
+    touched, here and, through ``bus``, in every other process.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        cache: UserCache,
+        bus: InvalidationBus | None = None,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.bus = bus
+
+    async def create_user(self, user: User) -> User:
+        created_user = await self.repository.create_user(user)
+        # Drops cached misses for the new id, email and username.
+        await self._invalidate([created_user.id], user_keys(created_user))
+        return created_user
+
+    async def get_user_by_id(self, user_id: UUID) -> User | None:
+        return await self._read(
+            ('id', user_id), self.repository.get_user_by_id, user_id
+        )
+
+    async def get_users_by_ids(self, user_ids: list[UUID]) -> list[User]:
+        users = []
+        missing_ids = []
+        for user_id in user_ids:
+            cached = self.cache.get(('id', user_id))
+            if cached is MISSING:
+                missing_ids.append(user_id)
+            elif cached is not None:
+                users.append(cached)
+
+        if not missing_ids:
+            return users
+
+        version = self.cache.version
+        loaded = await self.repository.get_users_by_ids(missing_ids)
+
+        loaded_ids = {user.id for user in loaded}
+        for user in loaded:
+            self.cache.put(('id', user.id), user, version)
+        for user_id in missing_ids:
+            if user_id not in loaded_ids:
+                self.cache.put(('id', user_id), None, version)
+
+        return users + loaded
+
+    async def get_user_by_email(self, email: EmailStr) -> User | None:
+        return await self._read(
+            ('email', email), self.repository.get_user_by_email, email
+        )
+
+    async def get_user_by_username(self, username: str) -> User | None:
+        return await self._read(
+            ('username', username),
+            self.repository.get_user_by_username,
+            username,
+        )
+
+    async def get_users_by_emails_or_usernames(
+        self,
+        emails: list[str],
+        usernames: list[str],
+    ) -> list[UserSummary]:
+        return await self.repository.get_users_by_emails_or_usernames(
+            emails, usernames
+        )
+
+    async def create_users(self, users: list[User]) -> list[User]:
+        created_users = await self.repository.create_users(users)
+        # One invalidation for the whole batch, not one per user.
+        await self._invalidate(
+            [user.id for user in created_users],
+            [key for user in created_users for key in user_keys(user)],
+        )
+        return created_users
+
+    async def update_user(
+        self, user_id: UUID, changes: dict[str, Any]
+    ) -> User:
+        try:
+            return await self.repository.update_user(user_id, changes)
+        finally:
+            # Also on failure: a missing row may have been deleted
+            # elsewhere while still cached here.
+            await self._invalidate(
+                [user_id],
+                [
+                    (field, changes[field])
+                    for field in ('email', 'username')
+                    if field in changes
+                ],
+            )
+
+    async def delete_user(self, user_id: UUID) -> None:
+        try:
+            await self.repository.delete_user(user_id)
+        finally:
+            await self._invalidate([user_id])
+
+    async def list_users(self, config: ListUsersConfig) -> list[UserSummary]:
+        return await self.repository.list_users(config)
+
+    async def list_users_with_total(
+        self, config: ListUsersConfig
+    ) -> tuple[list[UserSummary], int]:
+        return await self.repository.list_users_with_total(config)
+
+    async def list_user_versions(
+        self, config: ListUsersConfig, include_total: bool = True
+    ) -> tuple[list[UserVersion], int | None]:
+        return await self.repository.list_user_versions(config, include_total)
+
+    def stream_users(
+        self, config: ListUsersConfig
+    ) -> AsyncIterator[UserSummary]:
+        return self.repository.stream_users(config)
+
+    async def count_users(self, config: ListUsersConfig) -> int:
+        return await self.repository.count_users(config)
+
+    async def _read(
+        self,
+        key: CacheKey,
+        load: Callable[[Any], Awaitable[Optional[User]]],
+        value: Any,
+    ) -> User | None:
+        cached = self.cache.get(key)
+        if cached is not MISSING:
+            return cached
+
+        version = self.cache.version
+        user = await load(value)
+        self.cache.put(key, user, version)
+        return user
+
+    async def _invalidate(
+        self,
+        user_ids: list[UUID],
+        keys: list[CacheKey] | None = None,
+    ) -> None:
+        keys = keys or []
+        if not user_ids and not keys:
+            return
+        self.cache.invalidate(user_ids, keys)
+
+        if self.bus is not None:
+            await self.bus.publish(
+                UserInvalidation(user_ids=tuple(user_ids), keys=tuple(keys))
+            )
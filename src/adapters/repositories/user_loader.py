@@ -0,0 +1,89 @@
+import asyncio
+from typing import AsyncContextManager, Callable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.repositories.user_repository_implementation import (
+    UserRepositoryImplementation,
+)
+from src.domain.entities.user import User
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+class UserLoader:
+    """DataLoader-style batcher for lookups by id.
+
+    Every ``load`` issued during the same event-loop tick is answered by a
+    single ``IN`` query on a session of its own, so concurrent requests for
+    single users share one round trip.
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        max_batch_size: int = 500,
+    ):
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self._pending: dict[UUID, list[asyncio.Future]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, user_id: UUID) -> User | None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        if not self._pending:
+            loop.call_soon(self._dispatch)
+        self._pending.setdefault(user_id, []).append(future)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        user_ids = list(pending)
+
+        for start in range(0, len(user_ids), self.max_batch_size):
+            batch = {
+                user_id: pending[user_id]
+                for user_id in user_ids[start : start + self.max_batch_size]
+            }
+            task = asyncio.get_running_loop().create_task(
+                self._load_batch(batch)
+            )
+            # Keep a strong reference until the task is done.
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(
+        self, batch: dict[UUID, list[asyncio.Future]]
+    ) -> None:
+        try:
+            async with self.session_factory() as session:
+                users = await UserRepositoryImplementation(
+                    session
+                ).get_users_by_ids(list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        users_by_id = {user.id: user for user in users}
+        for user_id, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(users_by_id.get(user_id))
+
+
+class CoalescingUserRepository(UserRepositoryImplementation):
+    """Repository whose lookups by id go through a shared ``UserLoader``."""
+
+    def __init__(self, session: AsyncSession, user_loader: UserLoader):
+        super().__init__(session)
+        self.user_loader = user_loader
+
+    async def get_user_by_id(self, user_id: UUID) -> User | None:
+        return await self.user_loader.load(user_id)
@@ -1,26 +1,80 @@
+import dataclasses
+from datetime import datetime
+from typing import Any, AsyncIterator
 from uuid import UUID
 
 from pydantic import EmailStr
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Select,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.entities.user import User
-from src.domain.errors.domain_exceptions import UserNotFoundError
+from src.domain.entities.user import User, UserSummary, UserVersion
+from src.domain.errors.domain_exceptions import (
+    UserAlreadyExistsError,
+    UserNotFoundError,
+)
 from src.domain.ports.user_repository import ListUsersConfig, UserRepository
-from src.infrastructure.database.sqlite_db import UserORM
+from src.infrastructure.database.sqlite_db import UserORM, users_fts
+from src.infrastructure.tracing import traced
+
+users_table = UserORM.__table__
+
+# Only what list responses need; notably not password_hash.
+SUMMARY_COLUMNS = (
+    users_table.c.id,
+    users_table.c.username,
+    users_table.c.email,
+    users_table.c.created_at,
+    users_table.c.updated_at,
+)
+
+# Always selected for sparse fieldsets: identity, the ETag and the cursor
+# are built from them (plus the sort column).
+REQUIRED_SUMMARY_FIELDS = ('id', 'updated_at')
+
+# Enough to tell whether a listed user changed (see list_user_versions).
+VERSION_COLUMNS = (users_table.c.id, users_table.c.updated_at)
+
+# Rows fetched from the cursor per round trip while streaming.
+STREAM_BATCH_SIZE = 1000
+
+# The trigram tokenizer cannot match anything shorter than one trigram.
+FTS_MIN_QUERY_LENGTH = 3
 
 
 class UserRepositoryImplementation(UserRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @traced()
     async def create_user(self, user: User) -> User:
         user_orm = UserORM(**user.model_dump())
         self.session.add(user_orm)
-        await self.session.commit()
-        await self.session.refresh(user_orm)
-        return User(**user_orm.__dict__)
 
+        # The unique indexes are the source of truth for duplicates, so a
+        # signup is a single INSERT and concurrent signups cannot race.
+        # Defaults are computed in Python and set on the row by the flush,
+        # so the user is built from it without reading it back.
+        try:
+            await self.session.flush()
+            created = User.from_row(user_orm)
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise _already_exists(e, user.model_dump()) from e
+
+        return created
+
+    @traced()
     async def get_user_by_id(self, user_id: UUID) -> User | None:
         result = await self.session.execute(
             select(UserORM).where(UserORM.id == user_id)
@@ -28,8 +82,20 @@ class UserRepositoryImplementation(UserRepository):
         user_orm = result.scalar_one_or_none()
         if not user_orm:
             return None
-        return User(**user_orm.__dict__)
+        return User.from_row(user_orm)
 
+    @traced()
+    async def get_users_by_ids(self, user_ids: list[UUID]) -> list[User]:
+        if not user_ids:
+            return []
+
+        result = await self.session.execute(
+            select(UserORM).where(UserORM.id.in_(user_ids))
+        )
+
+        return [User.from_row(user_orm) for user_orm in result.scalars()]
+
+    @traced()
     async def get_user_by_email(self, email: EmailStr) -> User | None:
         result = await self.session.execute(
             select(UserORM).where(UserORM.email == email)
@@ -37,8 +103,9 @@ class UserRepositoryImplementation(UserRepository):
         user_orm = result.scalar_one_or_none()
         if not user_orm:
             return None
-        return User(**user_orm.__dict__)
+        return User.from_row(user_orm)
 
+    @traced()
     async def get_user_by_username(self, username: str) -> User | None:
         result = await self.session.execute(
             select(UserORM).where(UserORM.username == username)
@@ -46,42 +113,210 @@ class UserRepositoryImplementation(UserRepository):
         user_orm = result.scalar_one_or_none()
         if not user_orm:
             return None
-        return User(**user_orm.__dict__)
+        return User.from_row(user_orm)
 
-    async def update_user(self, user: User) -> User:
+    @traced()
+    async def get_users_by_emails_or_usernames(
+        self,
+        emails: list[str],
+        usernames: list[str],
+    ) -> list[UserSummary]:
         result = await self.session.execute(
-            select(UserORM).where(UserORM.id == user.id)
+            select(*SUMMARY_COLUMNS).where(
+                users_table.c.email.in_(emails)
+                | users_table.c.username.in_(usernames)
+            )
         )
+
+        return [UserSummary._make(row) for row in result]
+
+    @traced()
+    async def create_users(self, users: list[User]) -> list[User]:
+        if not users:
+            return []
+
+        # Mirror the ORM default applied by create_user.
+        now = datetime.utcnow()
+        rows = [
+            {**user.model_dump(), 'updated_at': user.updated_at or now}
+            for user in users
+        ]
+
+        try:
+            # A list of parameter sets runs as a single executemany.
+            await self.session.execute(insert(UserORM), rows)
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise UserAlreadyExistsError(
+                'One or more users already exist'
+            ) from e
+
+        return [
+            user.model_copy(update={'updated_at': row['updated_at']})
+            for user, row in zip(users, rows)
+        ]
+
+    @traced()
+    async def update_user(
+        self, user_id: UUID, changes: dict[str, Any]
+    ) -> User:
+        # One UPDATE ... RETURNING of only the changed columns; an empty
+        # result means the id matched no row. As for signups, the unique
+        # indexes have the last word on duplicates: the use case's checks
+        # cannot see a concurrent rename.
+        try:
+            result = await self.session.execute(
+                update(UserORM)
+                .where(UserORM.id == user_id)
+                .values(**changes)
+                .returning(UserORM)
+            )
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise _already_exists(e, changes) from e
         user_orm = result.scalar_one_or_none()
 
         if user_orm is None:
-            raise UserNotFoundError(f'User with id {user.id} not found')
-
-        for key, value in user.model_dump().items():
-            setattr(user_orm, key, value)
+            await self.session.rollback()
+            raise UserNotFoundError(f'User with id {user_id} not found')
 
+        user = User.from_row(user_orm)
         await self.session.commit()
-        await self.session.refresh(user_orm)
 
-        return User(**user_orm.__dict__)
+        return user
 
+    @traced()
     async def delete_user(self, user_id: UUID) -> None:
         result = await self.session.execute(
-            select(UserORM).where(UserORM.id == user_id)
+            delete(UserORM).where(UserORM.id == user_id)
         )
 
-        user_orm = result.scalar_one_or_none()
-
-        if user_orm is None:
+        if result.rowcount == 0:
+            await self.session.rollback()
             raise UserNotFoundError(f'User with id {user_id} not found')
 
-        await self.session.delete(user_orm)
         await self.session.commit()
 
-    async def list_users(self, config: ListUsersConfig) -> list[User]:
-        query = select(UserORM)
+    @traced()
+    async def list_users(self, config: ListUsersConfig) -> list[UserSummary]:
+        columns = self._summary_columns(config)
+        query = self._paginate(select(*columns), config)
+
+        result = await self.session.execute(query)
+
+        return _to_summaries(columns, result)
+
+    @traced()
+    async def list_users_with_total(
+        self, config: ListUsersConfig
+    ) -> tuple[list[UserSummary], int]:
+        columns = self._summary_columns(config)
+        rows, total = await self._page_with_total(columns, config)
+        return _to_summaries(columns, rows), total
+
+    @traced()
+    async def list_user_versions(
+        self, config: ListUsersConfig, include_total: bool = True
+    ) -> tuple[list[UserVersion], int | None]:
+        # Same page as list_users, but only the columns that tell whether
+        # it changed, so conditional requests skip loading full rows.
+        if include_total:
+            rows, total = await self._page_with_total(VERSION_COLUMNS, config)
+        else:
+            query = self._paginate(select(*VERSION_COLUMNS), config)
+            rows, total = (await self.session.execute(query)).all(), None
+
+        return [UserVersion._make(row) for row in rows], total
+
+    async def stream_users(
+        self, config: ListUsersConfig
+    ) -> AsyncIterator[UserSummary]:
+        # Same filters and ordering as list_users, without LIMIT/OFFSET;
+        # rows are pulled from the cursor in batches, so memory stays
+        # constant however many users match.
+        query = self._paginate(
+            select(*SUMMARY_COLUMNS),
+            dataclasses.replace(config, page=0, cursor=None),
+        ).execution_options(yield_per=STREAM_BATCH_SIZE)
+
+        result = await self.session.stream(query)
+        try:
+            async for row in result:
+                yield UserSummary._make(row)
+        finally:
+            await result.close()
 
-        if config.query:
+    @traced()
+    async def count_users(self, config: ListUsersConfig) -> int:
+        query = self._filter(select(func.count(UserORM.id)), config)
+
+        result = await self.session.execute(query)
+        return result.scalar()
+
+    async def _page_with_total(
+        self, columns: tuple, config: ListUsersConfig
+    ) -> tuple[list[tuple], int]:
+        if config.cursor is None:
+            # COUNT(*) OVER () is evaluated before LIMIT/OFFSET, so every
+            # row of the page carries the size of the whole filtered set.
+            total = func.count().over()
+        else:
+            # The keyset predicate would shrink a window count to "rows
+            # after the cursor"; count the filtered set in a subquery.
+            total = (
+                self
+                ._filter(select(func.count(UserORM.id)), config)
+                .correlate(None)
+                .scalar_subquery()
+            )
+
+        query = self._paginate(
+            select(*columns, total.label('total_items')), config
+        )
+        result = await self.session.execute(query)
+        rows = result.all()
+
+        if rows:
+            width = len(columns)
+            return [row[:width] for row in rows], rows[0].total_items
+
+        if config.cursor is None and config.page == 1:
+            return [], 0
+
+        # A page past the end has no row to carry the window total.
+        return [], await self.count_users(config)
+
+    def _summary_columns(self, config: ListUsersConfig) -> tuple:
+        if config.fields is None:
+            return SUMMARY_COLUMNS
+
+        order_column, _ = self._ordering(config)
+        needed = {
+            *config.fields,
+            *REQUIRED_SUMMARY_FIELDS,
+            order_column.key,
+        }
+        return tuple(
+            column for column in SUMMARY_COLUMNS if column.key in needed
+        )
+
+    def _uses_fts(self, config: ListUsersConfig) -> bool:
+        return (
+            bool(config.query)
+            and len(config.query) >= FTS_MIN_QUERY_LENGTH
+            and self.session.get_bind().dialect.name == 'sqlite'
+        )
+
+    def _filter(self, query: Select, config: ListUsersConfig) -> Select:
+        if self._uses_fts(config):
+            # Quote as an FTS5 string so the input is matched literally.
+            phrase = '"{}"'.format(config.query.replace('"', '""'))
+            query = query.join(
+                users_fts,
+                users_fts.c.rowid == literal_column('users.rowid'),
+            ).where(literal_column('users_fts').match(phrase))
+        elif config.query:
             query = query.where(
                 UserORM.username.ilike(f'%{config.query}%')
                 | UserORM.email.ilike(f'%{config.query}%')
@@ -91,31 +326,79 @@ class UserRepositoryImplementation(UserRepository):
             for key, value in config.filters.items():
                 query = query.where(getattr(UserORM, key) == value)
 
-        if config.order_by:
-            order_column = getattr(UserORM, config.order_by)
-            if config.order_direction == 'asc':
-                query = query.order_by(order_column.asc())
-            else:
-                query = query.order_by(order_column.desc())
+        return query
+
+    def _paginate(self, query: Select, config: ListUsersConfig) -> Select:
+        query = self._filter(query, config)
+
+        order_column, descending = self._ordering(config)
+        if self._ranks_by_relevance(config):
+            query = query.order_by(users_fts.c.rank, UserORM.id)
+        elif descending:
+            query = query.order_by(order_column.desc(), UserORM.id.desc())
+        else:
+            query = query.order_by(order_column.asc(), UserORM.id.asc())
 
-        if config.page and config.page_size:
+        if config.cursor:
+            # Keyset pagination: seek past the last row of the previous
+            # page instead of scanning and discarding OFFSET rows.
+            position = tuple_(order_column, UserORM.id)
+            last_seen = tuple_(config.cursor.value, config.cursor.id)
+            query = query.where(
+                position < last_seen if descending else position > last_seen
+            ).limit(config.page_size)
+        elif config.page and config.page_size:
             offset = (config.page - 1) * config.page_size
             query = query.offset(offset).limit(config.page_size)
 
-        result = await self.session.execute(query)
-        users_orm = result.scalars().all()
+        return query
 
-        return [User(**user.__dict__) for user in users_orm]
+    def _ranks_by_relevance(self, config: ListUsersConfig) -> bool:
+        return (
+            self._uses_fts(config)
+            and not config.order_by
+            and config.cursor is None
+        )
 
-    async def count_users(self, config: ListUsersConfig) -> int:
-        query = select(func.count(UserORM.id))
+    @staticmethod
+    def _ordering(config: ListUsersConfig):
+        if config.order_by:
+            return (
+                getattr(UserORM, config.order_by),
+                config.order_direction != 'asc',
+            )
+        return UserORM.created_at, config.order_direction == 'desc'
 
-        if config.query:
-            query = query.where(UserORM.username.ilike(f'%{config.query}%'))
 
-        if config.filters:
-            for key, value in config.filters.items():
-                query = query.where(getattr(UserORM, key) == value)
+def _to_summaries(columns: tuple, rows) -> list[UserSummary]:
+    if columns is SUMMARY_COLUMNS:
+        return [UserSummary._make(row) for row in rows]
 
-        result = await self.session.execute(query)
-        return result.scalar()
+    # Columns left out of a sparse fieldset are None on the summary.
+    keys = [column.key for column in columns]
+    empty = dict.fromkeys(UserSummary._fields)
+    return [UserSummary(**{**empty, **dict(zip(keys, row))}) for row in rows]
+
+
+def _already_exists(
+    error: IntegrityError, values: dict[str, Any]
+) -> UserAlreadyExistsError:
+    field = _conflicting_field(error)
+    if field is None:
+        return UserAlreadyExistsError()
+    return UserAlreadyExistsError(
+        f'User with {field} {values.get(field)} already exists'
+    )
+
+
+def _conflicting_field(error: IntegrityError) -> str | None:
+    # SQLite reports "UNIQUE constraint failed: users.email"; other
+    # backends name the index ("ix_users_email") or the key ("(email)").
+    message = str(error.orig)
+    for field in ('email', 'username'):
+        if any(
+            marker in message
+            for marker in (f'users.{field}', f'ix_users_{field}', f'({field})')
+        ):
+            return field
+    return None
@@ -1,6 +1,6 @@
 from src.domain.errors.domain_exceptions import CredentialsError
 from src.domain.ports.auth_service import AuthService
-from src.domain.ports.hash_service import HashService
+from src.domain.ports.hash_service import AsyncHashService
 from src.domain.ports.user_repository import UserRepository
 
 
@@ -8,7 +8,7 @@ class AuthenticateUserUseCase:
     def __init__(
         self,
         user_repository: UserRepository,
-        hash_service: HashService,
+        hash_service: AsyncHashService,
         auth_service: AuthService,
     ):
         self.user_repository = user_repository
@@ -20,7 +20,9 @@ class AuthenticateUserUseCase:
         if not user:
             raise CredentialsError('Invalid credentials')
 
-        if not self.hash_service.verify_password(password, user.password_hash):
+        if not await self.hash_service.verify_password(
+            password, user.password_hash
+        ):
             raise CredentialsError('Invalid credentials')
 
         return await self.auth_service.authenticate(email, password)
@@ -1,32 +1,39 @@
+from dataclasses import dataclass
+
 from src.domain.entities.user import User
-from src.domain.errors.domain_exceptions import UserAlreadyExistsError
-from src.domain.ports.hash_service import HashService
+from src.domain.ports.hash_service import AsyncHashService
 from src.domain.ports.user_repository import UserRepository
 
 
+@dataclass
+class CreateUserRequest:
+    username: str
+    email: str
+    password: str | None
+    # An already computed hash (e.g. migrated users) skips hashing.
+    password_hash: str | None = None
+
+
+@dataclass
+class CreateUserResult:
+    index: int
+    user: User | None = None
+    error: str | None = None
+
+
 class CreateUserUseCase:
     def __init__(
-        self, user_repository: UserRepository, hash_repository: HashService
+        self,
+        user_repository: UserRepository,
+        hash_repository: AsyncHashService,
     ):
         self.user_repository = user_repository
         self.hash_repository = hash_repository
 
     async def execute(self, username: str, email: str, password: str) -> User:
-        existing_user = await self.user_repository.get_user_by_email(email)
-        if existing_user:
-            raise UserAlreadyExistsError(
-                f'User with email {email} already exists'
-            )
-
-        existing_user = await self.user_repository.get_user_by_username(
-            username
-        )
-        if existing_user:
-            raise UserAlreadyExistsError(
-                f'User with username {username} already exists'
-            )
-
-        password_hash = self.hash_repository.hash_password(password)
+        # Duplicates are rejected by the repository's unique constraints
+        # (UserAlreadyExistsError), so there is no lookup before the INSERT.
+        password_hash = await self.hash_repository.hash_password(password)
 
         user = User(
             username=username,
@@ -35,3 +42,57 @@ class CreateUserUseCase:
         )
 
         return await self.user_repository.create_user(user)
+
+    async def execute_many(
+        self, requests: list[CreateUserRequest]
+    ) -> list[CreateUserResult]:
+        results = [CreateUserResult(index=i) for i in range(len(requests))]
+
+        existing = await self.user_repository.get_users_by_emails_or_usernames(
+            [request.email for request in requests],
+            [request.username for request in requests],
+        )
+        taken_emails = {user.email for user in existing}
+        taken_usernames = {user.username for user in existing}
+
+        accepted = []
+        for request, result in zip(requests, results):
+            # Earlier items of the same batch claim their email/username.
+            if request.email in taken_emails:
+                result.error = (
+                    f'User with email {request.email} already exists'
+                )
+            elif request.username in taken_usernames:
+                result.error = (
+                    f'User with username {request.username} already exists'
+                )
+            else:
+                taken_emails.add(request.email)
+                taken_usernames.add(request.username)
+                accepted.append((request, result))
+
+        computed_hashes = iter(
+            await self.hash_repository.hash_passwords([
+                request.password
+                for request, _ in accepted
+                if request.password_hash is None
+            ])
+        )
+        password_hashes = [
+            request.password_hash or next(computed_hashes)
+            for request, _ in accepted
+        ]
+
+        users = await self.user_repository.create_users([
+            User(
+                username=request.username,
+                email=request.email,
+                password_hash=password_hash,
+            )
+            for (request, _), password_hash in zip(accepted, password_hashes)
+        ])
+
+        for (_, result), user in zip(accepted, users):
+            result.user = user
+
+        return results
@@ -1,6 +1,5 @@
 from uuid import UUID
 
-from src.domain.errors.domain_exceptions import UserNotFoundError
 from src.domain.ports.user_repository import UserRepository
 
 
@@ -9,8 +8,5 @@ class DeleteUserUseCase:
         self.user_repository = user_repository
 
     async def execute(self, user_id: UUID) -> None:
-        user = await self.user_repository.get_user_by_id(user_id)
-        if not user:
-            raise UserNotFoundError(f'User with id {user_id} not found')
-
+        # Raises UserNotFoundError when the DELETE matches no row.
         await self.user_repository.delete_user(user_id)
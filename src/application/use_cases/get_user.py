@@ -14,3 +14,14 @@ class GetUserUseCase:
         if not user:
             raise UserNotFoundError(f'User with id {user_id} not found')
         return user
+
+    async def execute_many(self, user_ids: list[UUID]) -> list[User]:
+        user_ids = list(dict.fromkeys(user_ids))
+        users = await self.user_repository.get_users_by_ids(user_ids)
+
+        users_by_id = {user.id: user for user in users}
+        return [
+            users_by_id[user_id]
+            for user_id in user_ids
+            if user_id in users_by_id
+        ]
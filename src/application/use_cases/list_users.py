@@ -1,13 +1,28 @@
+import base64
+import binascii
+import json
 from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator
+from uuid import UUID
 
+from src.domain.entities.user import UserSummary
 from src.domain.errors.domain_exceptions import (
+    InvalidCursorError,
+    InvalidFieldsError,
     InvalidFilterError,
     InvalidOrderByError,
     InvalidOrderDirectionError,
     InvalidPageError,
     InvalidPageSizeError,
 )
-from src.domain.ports.user_repository import ListUsersConfig, UserRepository
+from src.domain.ports.user_repository import (
+    ListUsersConfig,
+    UserCursor,
+    UserRepository,
+)
+
+CURSOR_KEYS = {'o', 'd', 'v', 'id'}
 
 
 @dataclass
@@ -18,6 +33,17 @@ class ListUsersRequest:
     order_by: str | None = None
     order_direction: str | None = None
     filters: dict[str, str] | None = None
+    cursor: str | None = None
+    include_total: bool = True
+    fields: list[str] | None = None
+
+
+@dataclass
+class ExportUsersRequest:
+    query: str | None = None
+    order_by: str | None = None
+    order_direction: str | None = None
+    filters: dict[str, str] | None = None
 
 
 class ListUsersUseCase:
@@ -28,32 +54,91 @@ class ListUsersUseCase:
     ALLOWED_ORDER_BY = ['username', 'email', 'created_at']
     ALLOWED_ORDER_DIRECTION = ['asc', 'desc']
     ALLOWED_FILTERS = ['username', 'email']
+    ALLOWED_FIELDS = ['id', 'username', 'email', 'created_at', 'updated_at']
+    DEFAULT_ORDER_BY = 'created_at'
 
     async def execute(self, request: ListUsersRequest) -> dict:
+        config = self._build_config(request)
+
+        if request.include_total:
+            (
+                users,
+                total_items,
+            ) = await self.user_repository.list_users_with_total(config)
+        else:
+            users = await self.user_repository.list_users(config)
+            total_items = None
+
+        return {
+            'items': users,
+            'total_items': total_items,
+            'page': request.page,
+            'page_size': request.page_size,
+            'next_cursor': self._next_cursor(request, users),
+        }
+
+    async def execute_versions(self, request: ListUsersRequest) -> dict:
+        """The page ``execute`` would return, reduced to id/updated_at.
+
+        Every field of a listed user (and the page's next cursor) can only
+        change along with its ``updated_at``, so this is enough to decide
+        whether a page a client already has is still current.
+        """
+        config = self._build_config(request)
+
+        versions, total_items = await self.user_repository.list_user_versions(
+            config, request.include_total
+        )
+
+        return {
+            'items': versions,
+            'total_items': total_items,
+            'page': request.page,
+            'page_size': request.page_size,
+        }
+
+    def stream(
+        self, request: ExportUsersRequest
+    ) -> AsyncIterator[UserSummary]:
+        """Every user matching ``request``, unpaginated.
+
+        The request is validated here, before anything is read, so errors
+        surface before a response starts streaming.
+        """
+        self._validate_order_direction(request.order_direction)
+        self._validate_order_by(request.order_by)
+        self._validate_filters(request.filters)
+
+        return self.user_repository.stream_users(
+            ListUsersConfig(
+                page=1,
+                page_size=0,
+                query=request.query,
+                order_by=request.order_by,
+                order_direction=request.order_direction,
+                filters=request.filters,
+            )
+        )
+
+    def _build_config(self, request: ListUsersRequest) -> ListUsersConfig:
         self._validate_pagination(request.page, request.page_size)
         self._validate_order_direction(request.order_direction)
         self._validate_order_by(request.order_by)
         self._validate_filters(request.filters)
+        self._validate_fields(request.fields)
+        cursor = self._decode_cursor(request)
 
-        config = ListUsersConfig(
+        return ListUsersConfig(
             page=request.page,
             page_size=request.page_size,
             query=request.query,
             order_by=request.order_by,
             order_direction=request.order_direction,
             filters=request.filters,
+            cursor=cursor,
+            fields=tuple(request.fields) if request.fields else None,
         )
 
-        users = await self.user_repository.list_users(config)
-        total_items = await self.user_repository.count_users(config)
-
-        return {
-            'items': users,
-            'total_items': total_items,
-            'page': request.page,
-            'page_size': request.page_size,
-        }
-
     def _validate_pagination(self, page: int, page_size: int) -> None:
         if page <= 0:
             raise InvalidPageError('Page must be greater than 0')
@@ -89,3 +174,67 @@ class ListUsersUseCase:
                     raise InvalidFilterError(
                         f'Filter must be {self.ALLOWED_FILTERS}'
                     )
+
+    def _validate_fields(self, fields: list[str] | None) -> None:
+        if fields and not set(fields) <= set(self.ALLOWED_FIELDS):
+            raise InvalidFieldsError(f'Fields must be {self.ALLOWED_FIELDS}')
+
+    def _next_cursor(
+        self, request: ListUsersRequest, users: list[UserSummary]
+    ) -> str | None:
+        if len(users) < request.page_size:
+            return None
+
+        if request.query and not request.order_by:
+            # Search results are ranked by relevance, which has no stable
+            # key to seek on; clients page through them with `page`.
+            return None
+
+        last = users[-1]
+        value = getattr(last, request.order_by or self.DEFAULT_ORDER_BY)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+
+        payload = {
+            'o': request.order_by,
+            'd': request.order_direction,
+            'v': value,
+            'id': str(last.id),
+        }
+        raw = json.dumps(payload, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+    def _decode_cursor(self, request: ListUsersRequest) -> UserCursor | None:
+        if not request.cursor:
+            return None
+
+        payload = self._load_cursor_payload(request.cursor)
+
+        if (payload['o'], payload['d']) != (
+            request.order_by,
+            request.order_direction,
+        ):
+            raise InvalidCursorError(
+                'Cursor does not match the requested ordering'
+            )
+
+        try:
+            value = payload['v']
+            if (request.order_by or self.DEFAULT_ORDER_BY) == 'created_at':
+                value = datetime.fromisoformat(value)
+            return UserCursor(value=value, id=UUID(payload['id']))
+        except (TypeError, ValueError) as e:
+            raise InvalidCursorError('Cursor is malformed') from e
+
+    @staticmethod
+    def _load_cursor_payload(cursor: str) -> dict:
+        try:
+            padding = '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        except (binascii.Error, ValueError) as e:
+            raise InvalidCursorError('Cursor is malformed') from e
+
+        if not isinstance(payload, dict) or payload.keys() != CURSOR_KEYS:
+            raise InvalidCursorError('Cursor is malformed')
+
+        return payload
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, NamedTuple, Optional
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, EmailStr, Field
@@ -15,3 +15,37 @@ class User(BaseModel):
 
     class Config:
         from_attributes = True
+
+    @classmethod
+    def from_row(cls, row: Any) -> 'User':
+        """Build a user from stored data without validating it again.
+
+        For rows (or ORM objects) read back from the database, which were
+        validated on the way in; inbound data goes through the
+        constructor.
+        """
+        return cls.model_construct(**{
+            name: getattr(row, name) for name in cls.model_fields
+        })
+
+
+class UserSummary(NamedTuple):
+    """Read-only projection of a stored user, without the password hash.
+
+    Built straight from database rows on list reads, so it skips
+    re-validating data that was validated when it was written.
+    """
+
+    id: UUID
+    username: str
+    email: str
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+
+class UserVersion(NamedTuple):
+    """Identity and last modification of a user, enough to tell whether a
+    previously sent representation is still current."""
+
+    id: UUID
+    updated_at: Optional[datetime]
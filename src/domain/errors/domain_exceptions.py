@@ -45,3 +45,13 @@ class InvalidOrderByError(DomainException):
 class InvalidFilterError(DomainException):
     def __init__(self, message: str = 'Invalid filter'):
         super().__init__(message)
+
+
+class InvalidCursorError(DomainException):
+    def __init__(self, message: str = 'Invalid cursor'):
+        super().__init__(message)
+
+
+class InvalidFieldsError(DomainException):
+    def __init__(self, message: str = 'Invalid fields'):
+        super().__init__(message)
@@ -9,3 +9,19 @@ class HashService(ABC):
     @abstractmethod
     def verify_password(self, password: str, hashed_password: str) -> bool:
         pass
+
+
+class AsyncHashService(ABC):
+    @abstractmethod
+    async def hash_password(self, password: str) -> str:
+        pass
+
+    @abstractmethod
+    async def verify_password(
+        self, password: str, hashed_password: str
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def hash_passwords(self, passwords: list[str]) -> list[str]:
+        pass
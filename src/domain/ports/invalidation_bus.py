@@ -0,0 +1,69 @@
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from typing import Callable, Hashable
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class UserInvalidation:
+    """Cache entries another process must drop after a committed write.
+
+    One invalidation covers every user a write call touched.
+    """
+
+    user_ids: tuple[UUID, ...] = ()
+    # (kind, value) pairs with kind one of 'id', 'email' or 'username'.
+    keys: tuple[tuple[str, Hashable], ...] = ()
+    origin: str = ''
+
+    def dumps(self) -> bytes:
+        return json.dumps({
+            'origin': self.origin,
+            'user_ids': [str(user_id) for user_id in self.user_ids],
+            'keys': [[kind, str(value)] for kind, value in self.keys],
+        }).encode()
+
+    @classmethod
+    def loads(cls, data: bytes | str) -> 'UserInvalidation':
+        payload = json.loads(data)
+        return cls(
+            user_ids=tuple(UUID(user_id) for user_id in payload['user_ids']),
+            keys=tuple(
+                (kind, UUID(value) if kind == 'id' else value)
+                for kind, value in payload['keys']
+            ),
+            origin=payload['origin'],
+        )
+
+    def halves(self) -> tuple['UserInvalidation', 'UserInvalidation']:
+        """This invalidation split in two, for transports that limit the
+        message size."""
+        ids, keys = len(self.user_ids) // 2, len(self.keys) // 2
+        return (
+            replace(self, user_ids=self.user_ids[:ids], keys=self.keys[:keys]),
+            replace(self, user_ids=self.user_ids[ids:], keys=self.keys[keys:]),
+        )
+
+
+InvalidationHandler = Callable[[UserInvalidation], None]
+
+
+class InvalidationBus(ABC):
+    """Broadcasts cache invalidations to the other application processes.
+
+    ``publish`` must never deliver a message back to the publishing
+    process, which has already invalidated its own cache.
+    """
+
+    @abstractmethod
+    async def start(self, handler: InvalidationHandler) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(self, invalidation: UserInvalidation) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
@@ -1,11 +1,19 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 from uuid import UUID
 
 from pydantic import EmailStr
 
-from src.domain.entities.user import User
+from src.domain.entities.user import User, UserSummary, UserVersion
+
+
+@dataclass(frozen=True)
+class UserCursor:
+    """Position of the last row of a page: its sort value and id."""
+
+    value: Any
+    id: UUID
 
 
 @dataclass
@@ -16,6 +24,9 @@ class ListUsersConfig:
     order_by: str | None = None
     order_direction: str | None = None
     filters: dict[str, str] | None = None
+    cursor: UserCursor | None = None
+    # Summary fields the caller needs; None selects all of them.
+    fields: tuple[str, ...] | None = None
 
 
 class UserRepository(ABC):
@@ -27,6 +38,10 @@ class UserRepository(ABC):
     async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         pass
 
+    @abstractmethod
+    async def get_users_by_ids(self, user_ids: list[UUID]) -> list[User]:
+        pass
+
     @abstractmethod
     async def get_user_by_email(self, email: EmailStr) -> Optional[User]:
         pass
@@ -36,7 +51,21 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    async def update_user(self, user: User) -> User:
+    async def get_users_by_emails_or_usernames(
+        self,
+        emails: list[str],
+        usernames: list[str],
+    ) -> list[UserSummary]:
+        pass
+
+    @abstractmethod
+    async def create_users(self, users: list[User]) -> list[User]:
+        pass
+
+    @abstractmethod
+    async def update_user(
+        self, user_id: UUID, changes: dict[str, Any]
+    ) -> User:
         pass
 
     @abstractmethod
@@ -47,9 +76,29 @@ class UserRepository(ABC):
     async def list_users(
         self,
         config: ListUsersConfig,
-    ) -> list[User]:
+    ) -> list[UserSummary]:
+        pass
+
+    @abstractmethod
+    async def list_users_with_total(
+        self,
+        config: ListUsersConfig,
+    ) -> tuple[list[UserSummary], int]:
         pass
 
+    @abstractmethod
+    async def list_user_versions(
+        self, config: ListUsersConfig, include_total: bool = True
+    ) -> tuple[list[UserVersion], Optional[int]]:
+        pass
+
+    @abstractmethod
+    def stream_users(
+        self, config: ListUsersConfig
+    ) -> AsyncIterator[UserSummary]:
+        """Every user matching ``config``, ignoring its page, as rows are
+        read from a server-side cursor."""
+
     @abstractmethod
     async def count_users(
         self,
@@ -1,18 +1,21 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.adapters.auth.jwt_auth_service import JWTAuthenticationService
-from src.adapters.auth.pwdlib_password_hasher import PwdlibPasswordHasher
-from src.adapters.repositories.user_repository_implementation import (
-    UserRepositoryImplementation,
-)
 from src.application.use_cases.authenticate_user import AuthenticateUserUseCase
+from src.factories.container import Container
+from src.infrastructure.tracing import trace_methods
 
 
 def authenticate_user_factory(
     session: AsyncSession,
+    container: Container,
 ) -> AuthenticateUserUseCase:
-    user_repository = UserRepositoryImplementation(session)
-    hash_service = PwdlibPasswordHasher()
-    auth_service = JWTAuthenticationService()
+    user_repository = container.user_repository(session)
 
-    return AuthenticateUserUseCase(user_repository, hash_service, auth_service)
+    return trace_methods(
+        AuthenticateUserUseCase(
+            user_repository,
+            container.hash_service,
+            container.auth_service,
+        ),
+        'execute',
+    )
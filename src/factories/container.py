@@ -0,0 +1,116 @@
+import socket
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.auth.executor_password_hasher import (
+    ExecutorPasswordHasher,
+    HashExecutor,
+    create_hash_executor,
+)
+from src.adapters.auth.jwt_auth_service import JWTAuthenticationService
+from src.adapters.auth.token_cache import (
+    VerifiedTokenCache,
+    instrument_token_cache,
+)
+from src.adapters.cache.null_invalidation_bus import NullInvalidationBus
+from src.adapters.cache.redis_invalidation_bus import (
+    RedisInvalidationBus,
+    create_redis_client,
+)
+from src.adapters.cache.unix_socket_invalidation_bus import (
+    UnixSocketInvalidationBus,
+)
+from src.adapters.repositories.caching_user_repository import (
+    CachingUserRepository,
+    UserCache,
+)
+from src.adapters.repositories.user_loader import UserLoader
+from src.adapters.repositories.user_repository_implementation import (
+    UserRepositoryImplementation,
+)
+from src.domain.ports.hash_service import AsyncHashService
+from src.domain.ports.invalidation_bus import InvalidationBus
+from src.domain.ports.user_repository import UserRepository
+from src.infrastructure.config.settings import Settings, settings
+from src.infrastructure.database.sqlite_db import AsyncSessionLocal
+
+
+@dataclass(frozen=True)
+class Container:
+    """Stateless services shared by every request of the application.
+
+    Built once by the app's lifespan handler; factories combine these with
+    the request's session, which is the only per-request piece.
+    """
+
+    hash_executor: HashExecutor
+    hash_service: AsyncHashService
+    auth_service: JWTAuthenticationService
+    token_cache: VerifiedTokenCache
+    user_cache: UserCache
+    user_loader: UserLoader
+    invalidation_bus: InvalidationBus
+
+    def user_repository(
+        self,
+        session: AsyncSession,
+        repository: UserRepository | None = None,
+    ) -> UserRepository:
+        """The session's repository, read through the shared user cache."""
+        if repository is None:
+            repository = UserRepositoryImplementation(session)
+
+        return CachingUserRepository(
+            repository, self.user_cache, self.invalidation_bus
+        )
+
+    async def start(self) -> None:
+        await self.invalidation_bus.start(self.user_cache.apply)
+
+    async def close(self) -> None:
+        await self.invalidation_bus.close()
+        self.hash_executor.shutdown()
+
+
+def create_invalidation_bus(
+    kind: str | None = None,
+    config: Settings = settings,
+) -> InvalidationBus:
+    kind = kind or config.CACHE_INVALIDATION_BUS
+    if kind == 'redis':
+        return RedisInvalidationBus(
+            create_redis_client(config.CACHE_INVALIDATION_REDIS_URL),
+            config.CACHE_INVALIDATION_CHANNEL,
+        )
+
+    if kind == 'unix' and hasattr(socket, 'AF_UNIX'):
+        return UnixSocketInvalidationBus(config.CACHE_INVALIDATION_SOCKET_DIR)
+
+    return NullInvalidationBus()
+
+
+def create_container(config: Settings = settings) -> Container:
+    """Services built from ``config`` as it is when called, so tests can
+    change the settings before the application starts."""
+    hash_executor = HashExecutor(
+        create_hash_executor(config.HASH_EXECUTOR, config.HASH_MAX_WORKERS)
+    )
+    token_cache = VerifiedTokenCache(max_size=config.JWT_TOKEN_CACHE_SIZE)
+    instrument_token_cache(token_cache)
+
+    return Container(
+        hash_executor=hash_executor,
+        hash_service=ExecutorPasswordHasher(hash_executor),
+        auth_service=JWTAuthenticationService(token_cache),
+        token_cache=token_cache,
+        user_cache=UserCache(
+            max_size=config.USER_CACHE_SIZE,
+            ttl=config.USER_CACHE_TTL_SECONDS,
+            negative_ttl=config.USER_CACHE_NEGATIVE_TTL_SECONDS,
+        ),
+        # Batches concurrent lookups by id of all requests, on sessions
+        # of its own.
+        user_loader=UserLoader(AsyncSessionLocal),
+        invalidation_bus=create_invalidation_bus(config=config),
+    )
@@ -1,14 +1,18 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.adapters.auth.pwdlib_password_hasher import PwdlibPasswordHasher
-from src.adapters.repositories.user_repository_implementation import (
-    UserRepositoryImplementation,
-)
 from src.application.use_cases.create_user import CreateUserUseCase
+from src.factories.container import Container
+from src.infrastructure.tracing import trace_methods
 
 
-def create_user_factory(session: AsyncSession) -> CreateUserUseCase:
-    user_repository = UserRepositoryImplementation(session)
-    hash_repository = PwdlibPasswordHasher()
+def create_user_factory(
+    session: AsyncSession,
+    container: Container,
+) -> CreateUserUseCase:
+    user_repository = container.user_repository(session)
 
-    return CreateUserUseCase(user_repository, hash_repository)
+    return trace_methods(
+        CreateUserUseCase(user_repository, container.hash_service),
+        'execute',
+        'execute_many',
+    )
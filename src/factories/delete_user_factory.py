@@ -1,12 +1,14 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.adapters.repositories.user_repository_implementation import (
-    UserRepositoryImplementation,
-)
 from src.application.use_cases.delete_user import DeleteUserUseCase
+from src.factories.container import Container
+from src.infrastructure.tracing import trace_methods
 
 
-def delete_user_factory(session: AsyncSession) -> DeleteUserUseCase:
-    user_repository = UserRepositoryImplementation(session)
+def delete_user_factory(
+    session: AsyncSession,
+    container: Container,
+) -> DeleteUserUseCase:
+    user_repository = container.user_repository(session)
 
-    return DeleteUserUseCase(user_repository)
+    return trace_methods(DeleteUserUseCase(user_repository), 'execute')
@@ -1,12 +1,26 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.adapters.repositories.user_repository_implementation import (
-    UserRepositoryImplementation,
+from src.adapters.repositories.user_loader import (
+    CoalescingUserRepository,
+    UserLoader,
 )
 from src.application.use_cases.get_user import GetUserUseCase
+from src.factories.container import Container
+from src.infrastructure.tracing import trace_methods
 
 
-def get_user_factory(session: AsyncSession) -> GetUserUseCase:
-    user_repository = UserRepositoryImplementation(session)
+def get_user_factory(
+    session: AsyncSession,
+    container: Container,
+    user_loader: UserLoader | None = None,
+) -> GetUserUseCase:
+    if user_loader is None:
+        user_repository = container.user_repository(session)
+    else:
+        user_repository = container.user_repository(
+            session, CoalescingUserRepository(session, user_loader)
+        )
 
-    return GetUserUseCase(user_repository)
+    return trace_methods(
+        GetUserUseCase(user_repository), 'execute', 'execute_many'
+    )
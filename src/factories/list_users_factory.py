@@ -1,12 +1,16 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.adapters.repositories.user_repository_implementation import (
-    UserRepositoryImplementation,
-)
 from src.application.use_cases.list_users import ListUsersUseCase
+from src.factories.container import Container
+from src.infrastructure.tracing import trace_methods
 
 
-def list_users_factory(session: AsyncSession) -> ListUsersUseCase:
-    user_repository = UserRepositoryImplementation(session)
+def list_users_factory(
+    session: AsyncSession,
+    container: Container,
+) -> ListUsersUseCase:
+    user_repository = container.user_repository(session)
 
-    return ListUsersUseCase(user_repository)
+    return trace_methods(
+        ListUsersUseCase(user_repository), 'execute', 'execute_versions'
+    )
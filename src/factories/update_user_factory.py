@@ -1,12 +1,14 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.adapters.repositories.user_repository_implementation import (
-    UserRepositoryImplementation,
-)
 from src.application.use_cases.update_user import UpdateUserUseCase
+from src.factories.container import Container
+from src.infrastructure.tracing import trace_methods
 
 
-def update_user_factory(session: AsyncSession) -> UpdateUserUseCase:
-    user_repository = UserRepositoryImplementation(session)
+def update_user_factory(
+    session: AsyncSession,
+    container: Container,
+) -> UpdateUserUseCase:
+    user_repository = container.user_repository(session)
 
-    return UpdateUserUseCase(user_repository)
+    return trace_methods(UpdateUserUseCase(user_repository), 'execute')
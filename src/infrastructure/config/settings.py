@@ -1,3 +1,8 @@
+import tempfile
+from pathlib import Path
+from typing import Literal
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,6 +15,58 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     JWT_SECRET_KEY: str
     JWT_EXPIRATION_MINUTES: int
+    # Verified bearer tokens kept in memory; 0 disables the cache.
+    JWT_TOKEN_CACHE_SIZE: int = 10_000
+
+    # In-process cache of users looked up by id/email/username; misses are
+    # cached for USER_CACHE_NEGATIVE_TTL_SECONDS. A size of 0 disables it.
+    USER_CACHE_SIZE: int = 10_000
+    USER_CACHE_TTL_SECONDS: float = 300.0
+    USER_CACHE_NEGATIVE_TTL_SECONDS: float = 30.0
+
+    # Keeps the user caches of all workers coherent: 'unix' uses datagram
+    # sockets between processes on one host, 'redis' a pub/sub channel
+    # (a 'memory://' URL selects an in-process stand-in) and 'none'
+    # suits single-process deployments.
+    CACHE_INVALIDATION_BUS: Literal['unix', 'redis', 'none'] = 'unix'
+    CACHE_INVALIDATION_SOCKET_DIR: str = str(
+        Path(tempfile.gettempdir()) / 'user-management-api-cache'
+    )
+    CACHE_INVALIDATION_REDIS_URL: str = 'redis://localhost:6379/0'
+    CACHE_INVALIDATION_CHANNEL: str = 'user-cache-invalidation'
+
+    # Argon2 runs outside the event loop: 'process' uses a process pool
+    # (falling back to threads where processes are unavailable).
+    HASH_EXECUTOR: Literal['process', 'thread'] = 'process'
+    HASH_MAX_WORKERS: int | None = None
+
+    # Rows of a bulk import validated and inserted per transaction, and
+    # how many of its failed rows the response lists.
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_MAX_REPORTED_ERRORS: int = 1000
+
+    # Request tracing: 'none' disables it, 'memory' keeps spans in the
+    # process and 'file' appends them as JSON lines to TRACING_FILE_PATH.
+    # TRACING_SAMPLE_RATIO is the share of traces recorded (0.0 to 1.0).
+    TRACING_EXPORTER: Literal['none', 'memory', 'file'] = 'none'
+    TRACING_FILE_PATH: str = 'traces.jsonl'
+    TRACING_SAMPLE_RATIO: float = Field(default=1.0, ge=0.0, le=1.0)
+
+    # Server-Timing response header with per-phase durations: 'header'
+    # adds it when the request sends X-Server-Timing, 'always' to every
+    # response and 'off' never.
+    SERVER_TIMING: Literal['off', 'header', 'always'] = 'header'
+
+    # 'production' tunes SQLite for concurrent access (WAL, relaxed fsync,
+    # larger cache, mmap); 'default' keeps SQLite's built-in settings.
+    DATABASE_PROFILE: Literal['production', 'default'] = 'production'
+    DATABASE_ECHO: bool = False
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KIB: int = 64 * 1024
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
 
 
 settings = Settings()
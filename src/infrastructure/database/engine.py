@@ -0,0 +1,144 @@
+import time
+from functools import partial
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from .. import server_timing
+from ..config.settings import Settings, settings
+from ..metrics import (
+    Gauge,
+    Histogram,
+    Registry,
+    db_statement_duration,
+    registry,
+)
+
+
+def sqlite_pragmas(config: Settings = settings) -> dict[str, Any]:
+    if config.DATABASE_PROFILE == 'default':
+        return {}
+
+    return {
+        # Readers no longer block the writer (and vice versa).
+        'journal_mode': 'WAL',
+        # Durable across application crashes; only an OS crash can lose
+        # the last transactions, which is the usual trade-off under WAL.
+        'synchronous': 'NORMAL',
+        'busy_timeout': config.SQLITE_BUSY_TIMEOUT_MS,
+        # A negative cache_size is in KiB rather than pages.
+        'cache_size': -config.SQLITE_CACHE_SIZE_KIB,
+        'mmap_size': config.SQLITE_MMAP_SIZE,
+        'temp_store': 'MEMORY',
+    }
+
+
+def is_memory_database(url: str) -> bool:
+    database = make_url(url).database
+    return database in {None, '', ':memory:'} or 'mode=memory' in url
+
+
+def engine_options(url: str, config: Settings = settings) -> dict[str, Any]:
+    options: dict[str, Any] = {'echo': config.DATABASE_ECHO}
+
+    # In-memory SQLite uses a single static connection, which takes no
+    # pool sizing options.
+    if not is_memory_database(url):
+        options.update(
+            pool_size=config.DATABASE_POOL_SIZE,
+            max_overflow=config.DATABASE_MAX_OVERFLOW,
+            pool_timeout=config.DATABASE_POOL_TIMEOUT,
+        )
+
+    return options
+
+
+def create_engine(
+    url: str | None = None,
+    config: Settings = settings,
+) -> AsyncEngine:
+    url = url or config.DATABASE_URL
+    engine = create_async_engine(url, **engine_options(url, config))
+
+    pragmas = sqlite_pragmas(config)
+    if pragmas and engine.dialect.name == 'sqlite':
+        event.listen(
+            engine.sync_engine,
+            'connect',
+            partial(_apply_pragmas, pragmas),
+        )
+
+    return engine
+
+
+def _apply_pragmas(pragmas: dict[str, Any], dbapi_connection, _record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+    finally:
+        cursor.close()
+
+
+def instrument_engine(
+    engine: AsyncEngine,
+    histogram: Histogram = db_statement_duration,
+    metrics: Registry = registry,
+) -> None:
+    """Time the engine's statements and expose its pool as gauges.
+
+    Statement times also go to the current request's Server-Timing.
+    """
+    event.listen(engine.sync_engine, 'before_cursor_execute', _start_timer)
+    event.listen(
+        engine.sync_engine,
+        'after_cursor_execute',
+        partial(_stop_timer, histogram),
+    )
+    metrics.register(
+        Gauge(
+            'db_pool_connections',
+            'Connections of the database pool, by state.',
+            partial(_pool_connections, engine),
+            ('state',),
+        )
+    )
+
+
+def _start_timer(_conn, _cursor, _statement, _parameters, context, _many):
+    if context is not None:
+        context.statement_started = time.perf_counter()
+
+
+def _stop_timer(
+    histogram: Histogram,
+    _conn,
+    _cursor,
+    statement,
+    _parameters,
+    context,
+    _many,
+):
+    started = getattr(context, 'statement_started', None)
+    if started is not None:
+        seconds = time.perf_counter() - started
+        histogram.observe(
+            seconds, statement.lstrip().split(None, 1)[0].upper()
+        )
+        server_timing.record(server_timing.DB, seconds)
+
+
+def _pool_connections(engine: AsyncEngine) -> dict[tuple[str], int]:
+    # Read at scrape time; the pool is replaced when the engine is
+    # disposed, and single-connection pools keep no counts.
+    pool = engine.sync_engine.pool
+    if not hasattr(pool, 'checkedout'):
+        return {}
+
+    return {
+        ('checked_out',): pool.checkedout(),
+        ('idle',): pool.checkedin(),
+        ('overflow',): max(pool.overflow(), 0),
+    }
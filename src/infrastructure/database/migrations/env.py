@@ -18,12 +18,18 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    # users_fts (and its shadow tables) is managed by hand-written DDL.
+    return not (type_ == 'table' and name.startswith('users_fts'))
+
+
 def run_migrations_offline() -> None:
     url = config.get_main_option('sqlalchemy.url')
     context.configure(
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
+        include_object=include_object,
         dialect_opts={'paramstyle': 'named'},
     )
 
@@ -40,7 +46,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
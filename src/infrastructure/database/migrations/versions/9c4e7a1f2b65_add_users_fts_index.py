@@ -0,0 +1,73 @@
+"""add_users_fts_index
+
+Revision ID: 9c4e7a1f2b65
+Revises: 3b8f1c2d9a47
+Create Date: 2026-10-17 10:02:17.530961
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e7a1f2b65'
+down_revision: Union[str, Sequence[str], None] = '3b8f1c2d9a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE users_fts USING fts5(
+            username, email,
+            content='users', content_rowid='rowid', tokenize='trigram'
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER users_fts_ai AFTER INSERT ON users BEGIN
+            INSERT INTO users_fts(rowid, username, email)
+            VALUES (new.rowid, new.username, new.email);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER users_fts_ad AFTER DELETE ON users BEGIN
+            INSERT INTO users_fts(users_fts, rowid, username, email)
+            VALUES ('delete', old.rowid, old.username, old.email);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER users_fts_au
+        AFTER UPDATE OF username, email ON users BEGIN
+            INSERT INTO users_fts(users_fts, rowid, username, email)
+            VALUES ('delete', old.rowid, old.username, old.email);
+            INSERT INTO users_fts(rowid, username, email)
+            VALUES (new.rowid, new.username, new.email);
+        END
+        """
+    )
+    # Index the rows that existed before the triggers.
+    op.execute("INSERT INTO users_fts(users_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute('DROP TRIGGER IF EXISTS users_fts_au')
+    op.execute('DROP TRIGGER IF EXISTS users_fts_ad')
+    op.execute('DROP TRIGGER IF EXISTS users_fts_ai')
+    op.execute('DROP TABLE IF EXISTS users_fts')
@@ -0,0 +1,216 @@
+"""Bulk-load synthetic users into the configured ``DATABASE_URL``.
+
+Users are named ``user<n>`` with the email ``user<n>@example.com``,
+numbered from the current row count unless ``--start`` is given, and all
+share the hash of ``--password``, which is computed once, so seeded users
+can log in.
+
+The load runs in a single transaction, with rows going in through
+``executemany`` in batches of ``--batch-size``. When it at least doubles
+the table, the secondary indexes and the full-text insert trigger are
+dropped first and the indexes, trigger and full-text index are rebuilt
+once at the end, which is far cheaper than maintaining them row by row.
+A failure rolls everything back, schema included: on SQLite the
+transaction is begun explicitly, since the driver would otherwise commit
+each ``DROP``/``CREATE`` on its own. ``ANALYZE`` then refreshes the
+planner statistics.
+
+    python -m src.infrastructure.database.seed --users 1000000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Iterator
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from ...adapters.auth.pwdlib_password_hasher import PwdlibPasswordHasher
+from .engine import create_engine
+from .sqlite_db import USERS_FTS_INSERT_TRIGGER, Base, UserORM
+
+SEED_BATCH_SIZE = 10_000
+SEED_PASSWORD = 'seed-password'
+SEED_START_TIME = datetime(2024, 1, 1)
+
+users_table = UserORM.__table__
+
+
+def random_ids(count: int) -> list[str]:
+    """Random version 4 UUIDs as 32-digit hex, as ``Uuid`` stores them.
+
+    One ``os.urandom`` call per batch instead of one per ``uuid4()``.
+    """
+    digits = os.urandom(16 * count).hex()
+    ids = []
+    for offset in range(0, len(digits), 32):
+        value = digits[offset : offset + 32]
+        # Set the version (4) and variant (10xx) bits.
+        value = (
+            f'{value[:12]}4{value[13:16]}'
+            f'{"89ab"[int(value[16], 16) & 3]}{value[17:]}'
+        )
+        # The id column has NUMERIC affinity on SQLite, which stores a hex
+        # string that reads as a number (all digits, or digits around one
+        # 'e') as a REAL; two of those can collide, so they are skipped.
+        if not value.replace('e', '', 1).isdigit():
+            ids.append(value)
+    return ids
+
+
+def user_batches(
+    start: int,
+    count: int,
+    password_hash: str,
+    batch_size: int = SEED_BATCH_SIZE,
+) -> Iterator[list[tuple]]:
+    """Rows for ``executemany`` in the form SQLAlchemy stores them on
+    SQLite (hex ids, ``YYYY-MM-DD HH:MM:SS.ffffff`` timestamps), so they
+    skip the per-row parameter processing of a Core ``insert``."""
+    stop = start + count
+    for offset in range(start, stop, batch_size):
+        numbers = range(offset, min(offset + batch_size, stop))
+        ids = random_ids(len(numbers))
+        while len(ids) < len(numbers):
+            ids.extend(random_ids(len(numbers) - len(ids)))
+
+        batch = []
+        for user_id, i in zip(ids, numbers):
+            timestamp = (SEED_START_TIME + timedelta(seconds=i)).isoformat(
+                ' ', 'microseconds'
+            )
+            batch.append((
+                user_id,
+                f'user{i}',
+                f'user{i}@example.com',
+                password_hash,
+                timestamp,
+                timestamp,
+            ))
+        yield batch
+
+
+async def seed_users(
+    engine: AsyncEngine,
+    count: int,
+    password_hash: str,
+    start: int | None = None,
+    batch_size: int = SEED_BATCH_SIZE,
+) -> int:
+    """Insert ``count`` users and return the number of the first one."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with _transaction(engine) as conn:
+        existing = await conn.scalar(
+            select(func.count()).select_from(users_table)
+        )
+        if start is None:
+            start = existing
+
+        # Rebuilding covers the existing rows too, so it only pays off
+        # when the load at least doubles the table.
+        rebuild = count >= existing
+        if rebuild:
+            await _drop_indexes(conn)
+
+        insert = (
+            f'INSERT INTO {users_table.name} '
+            f'({", ".join(users_table.c.keys())}) '
+            f'VALUES ({", ".join("?" * len(users_table.c))})'
+        )
+        for batch in user_batches(start, count, password_hash, batch_size):
+            await conn.exec_driver_sql(insert, batch)
+
+        if rebuild:
+            await _create_indexes(conn)
+
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql('ANALYZE')
+
+    return start
+
+
+@asynccontextmanager
+async def _transaction(engine: AsyncEngine) -> AsyncIterator[AsyncConnection]:
+    """A transaction that covers DDL too.
+
+    pysqlite only opens a transaction before DML, so ``DROP INDEX`` and
+    ``CREATE INDEX`` would be committed as soon as they run. On SQLite the
+    driver is switched to autocommit for this connection and ``BEGIN`` is
+    emitted by hand, SQLAlchemy's recipe for transactional DDL.
+    """
+    if engine.dialect.name != 'sqlite':
+        async with engine.begin() as conn:
+            yield conn
+        return
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level='AUTOCOMMIT')
+        await conn.exec_driver_sql('BEGIN')
+        try:
+            yield conn
+        except BaseException:
+            await conn.exec_driver_sql('ROLLBACK')
+            raise
+        await conn.exec_driver_sql('COMMIT')
+
+
+async def _drop_indexes(conn: AsyncConnection) -> None:
+    for index in users_table.indexes:
+        await conn.execute(DropIndex(index, if_exists=True))
+    if conn.dialect.name == 'sqlite':
+        await conn.exec_driver_sql('DROP TRIGGER IF EXISTS users_fts_ai')
+
+
+async def _create_indexes(conn: AsyncConnection) -> None:
+    for index in users_table.indexes:
+        await conn.execute(CreateIndex(index))
+    if conn.dialect.name == 'sqlite':
+        await conn.exec_driver_sql(USERS_FTS_INSERT_TRIGGER)
+        # Index the rows inserted while the trigger was gone.
+        await conn.exec_driver_sql(
+            "INSERT INTO users_fts(users_fts) VALUES ('rebuild')"
+        )
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_engine()
+    password_hash = PwdlibPasswordHasher().hash_password(args.password)
+
+    began = time.perf_counter()
+    start = await seed_users(
+        engine, args.users, password_hash, args.start, args.batch_size
+    )
+    elapsed = time.perf_counter() - began
+    await engine.dispose()
+
+    print(
+        f'Seeded user{start}..user{start + args.users - 1} '
+        f'({args.users} users) in {elapsed:.1f}s, '
+        f'{args.users / elapsed:,.0f} rows/s'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, required=True)
+    parser.add_argument('--password', default=SEED_PASSWORD)
+    parser.add_argument(
+        '--start',
+        type=int,
+        help='number of the first user (default: current row count)',
+    )
+    parser.add_argument('--batch-size', type=int, default=SEED_BATCH_SIZE)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,26 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import (
+    DDL,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    event,
+)
 from sqlalchemy.dialects.postgresql import UUID as SQLAlchemyUUID
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-from ..config.settings import settings
+from .engine import create_engine, instrument_engine
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+engine = create_engine()
+instrument_engine(engine)
 
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession)
 
@@ -19,6 +31,7 @@ class Base(DeclarativeBase):
 
 class UserORM(Base):
     __tablename__ = 'users'
+    __table_args__ = (Index('ix_users_created_at_id', 'created_at', 'id'),)
 
     id = Column(SQLAlchemyUUID, primary_key=True, index=True, default=uuid4)
     username = Column(String(50), unique=True, index=True)
@@ -28,6 +41,64 @@ class UserORM(Base):
     updated_at = Column(DateTime, default=datetime.utcnow)
 
 
+# Trigram FTS5 index over users.username/email, kept in sync by triggers.
+# It lives outside Base.metadata because SQLAlchemy cannot create virtual
+# tables; the DDL below runs whenever the users table is created.
+users_fts = Table(
+    'users_fts',
+    MetaData(),
+    Column('rowid', Integer),
+    Column('username', String),
+    Column('email', String),
+    Column('rank', Float),
+)
+
+USERS_FTS_INSERT_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users BEGIN
+        INSERT INTO users_fts(rowid, username, email)
+        VALUES (new.rowid, new.username, new.email);
+    END
+"""
+
+USERS_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+        username, email,
+        content='users', content_rowid='rowid', tokenize='trigram'
+    )
+    """,
+    USERS_FTS_INSERT_TRIGGER,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users BEGIN
+        INSERT INTO users_fts(users_fts, rowid, username, email)
+        VALUES ('delete', old.rowid, old.username, old.email);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_fts_au
+    AFTER UPDATE OF username, email ON users BEGIN
+        INSERT INTO users_fts(users_fts, rowid, username, email)
+        VALUES ('delete', old.rowid, old.username, old.email);
+        INSERT INTO users_fts(rowid, username, email)
+        VALUES (new.rowid, new.username, new.email);
+    END
+    """,
+)
+
+for statement in USERS_FTS_DDL:
+    event.listen(
+        UserORM.__table__,
+        'after_create',
+        DDL(statement).execute_if(dialect='sqlite'),
+    )
+
+event.listen(
+    UserORM.__table__,
+    'before_drop',
+    DDL('DROP TABLE IF EXISTS users_fts').execute_if(dialect='sqlite'),
+)
+
+
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -0,0 +1,176 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+A small registry of histograms and gauges, enough for ``/metrics``
+without a client library. Observations take a lock and update a single
+bucket; cumulative bucket counts are only computed when the registry is
+rendered.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; from sub-millisecond statements up to slow requests.
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Argon2 is tuned to take tens to hundreds of milliseconds.
+HASH_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ','.join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return f'{{{pairs}}}' if pairs else ''
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        # Per label values: a count per bucket (plus +Inf) and the sum.
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[labelvalues] = series
+            series[0][index] += 1
+            series[1][0] += value
+
+    def render(self) -> list[str]:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} histogram',
+        ]
+        with self._lock:
+            series = {
+                labelvalues: (list(counts), total[0])
+                for labelvalues, (counts, total) in self._series.items()
+            }
+
+        bounds = (*self.buckets, float('inf'))
+        for labelvalues, (counts, total) in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                labels = _labels(
+                    (*self.labelnames, 'le'), (*labelvalues, _number(bound))
+                )
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _labels(self.labelnames, labelvalues)
+            lines.append(f'{self.name}_sum{labels} {_number(total)}')
+            lines.append(f'{self.name}_count{labels} {cumulative}')
+        return lines
+
+
+class Gauge:
+    """A gauge read when the registry is rendered.
+
+    ``collect`` returns the current value per label values, so nothing is
+    tracked between scrapes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], dict[LabelValues, float]],
+        labelnames: tuple[str, ...] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.collect = collect
+        self.labelnames = labelnames
+
+    def render(self) -> list[str]:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} gauge',
+        ]
+        for labelvalues, value in sorted(self.collect().items()):
+            labels = _labels(self.labelnames, labelvalues)
+            lines.append(f'{self.name}{labels} {_number(value)}')
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Histogram | Gauge] = {}
+
+    def register(self, metric: Histogram | Gauge) -> Histogram | Gauge:
+        """Add ``metric``, replacing any earlier one with its name."""
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+http_request_duration = registry.register(
+    Histogram(
+        'http_request_duration_seconds',
+        'Time to serve an HTTP request, by route template and status.',
+        ('method', 'route', 'status'),
+    )
+)
+db_statement_duration = registry.register(
+    Histogram(
+        'db_statement_duration_seconds',
+        'Time to execute a SQL statement, by statement kind.',
+        ('operation',),
+    )
+)
+password_hash_duration = registry.register(
+    Histogram(
+        'password_hash_duration_seconds',
+        'Time spent in Argon2, by operation (hash or verify).',
+        ('operation',),
+        HASH_BUCKETS,
+    )
+)
@@ -0,0 +1,90 @@
+"""Per-request phase durations for the ``Server-Timing`` response header.
+
+Adapters add the time they spend in a phase (database statements,
+password hashing, JWT signing and checking, response serialization) to
+the timings of the current request, kept in a context variable. Outside
+a request that asked for them the variable is unset and recording is a
+single lookup, so the instrumentation stays in place in production.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Iterator, Optional
+
+DB = 'db'
+HASH = 'hash'
+JWT = 'jwt'
+SERIALIZE = 'serialize'
+TOTAL = 'total'
+
+_DESCRIPTIONS = {
+    DB: 'statements',
+    HASH: 'hashes',
+    JWT: 'tokens',
+    SERIALIZE: 'responses',
+}
+
+
+class ServerTiming:
+    """Accumulated seconds and number of occurrences per phase."""
+
+    __slots__ = ('phases', 'started')
+
+    def __init__(self):
+        self.phases: dict[str, list] = {}
+        self.started = time.perf_counter()
+
+    def record(self, phase: str, seconds: float) -> None:
+        totals = self.phases.get(phase)
+        if totals is None:
+            self.phases[phase] = [seconds, 1]
+        else:
+            totals[0] += seconds
+            totals[1] += 1
+
+    def header_value(self) -> str:
+        """Every phase in milliseconds, with its count, then the total."""
+        metrics = [
+            f'{phase};desc="{count} {_DESCRIPTIONS.get(phase, phase)}"'
+            f';dur={seconds * 1000:.3f}'
+            for phase, (seconds, count) in self.phases.items()
+        ]
+        elapsed = time.perf_counter() - self.started
+        metrics.append(f'{TOTAL};dur={elapsed * 1000:.3f}')
+        return ', '.join(metrics)
+
+
+_server_timing: ContextVar[Optional[ServerTiming]] = ContextVar(
+    'server_timing', default=None
+)
+
+
+def start() -> tuple[ServerTiming, Token]:
+    """Collect the timings of the calls made in this context."""
+    timing = ServerTiming()
+    return timing, _server_timing.set(timing)
+
+
+def stop(token: Token) -> None:
+    _server_timing.reset(token)
+
+
+def record(phase: str, seconds: float) -> None:
+    timing = _server_timing.get()
+    if timing is not None:
+        timing.record(phase, seconds)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    timing = _server_timing.get()
+    if timing is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.record(phase, time.perf_counter() - started)
@@ -0,0 +1,282 @@
+"""Lightweight request tracing with OpenTelemetry-shaped spans.
+
+Spans carry W3C/OpenTelemetry identifiers (a 128-bit trace id and 64-bit
+span ids, hex encoded), Unix-nanosecond timestamps, attributes and an
+OK/ERROR status, and are exported one JSON object per span with
+OpenTelemetry's field names. The current span lives in a context
+variable, so spans opened by nested calls of one request, including
+across ``await``, become its children.
+
+Tracing is off unless an exporter is configured: ``TRACING_EXPORTER``
+selects ``memory`` (kept in process, for tests and local inspection) or
+``file`` (JSON lines appended to ``TRACING_FILE_PATH``). Whether a trace
+is recorded is decided once at its root from ``TRACING_SAMPLE_RATIO``,
+with the same trace-id ratio rule as OpenTelemetry's
+``TraceIdRatioBased`` sampler; spans of unsampled traces are not
+created at all.
+"""
+
+import functools
+import json
+import random
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional, Protocol, TypeVar
+
+from .config.settings import Settings, settings
+
+# W3C trace-context header: version-traceid-parentid-flags.
+TRACEPARENT = re.compile(r'^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$')
+SAMPLED_FLAG = 0x01
+INVALID_TRACE_ID = '0' * 32
+INVALID_SPAN_ID = '0' * 16
+
+_ID_SPACE = 2**64
+
+T = TypeVar('T')
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str] = None
+    sampled: bool = True
+    start_time_unix_nano: int = 0
+    end_time_unix_nano: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = 'UNSET'
+    status_message: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.status = 'ERROR'
+        self.status_message = message
+
+    def to_dict(self) -> dict[str, Any]:
+        status = {'code': self.status}
+        if self.status_message:
+            status['message'] = self.status_message
+
+        return {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'parentSpanId': self.parent_span_id or '',
+            'name': self.name,
+            'startTimeUnixNano': self.start_time_unix_nano,
+            'endTimeUnixNano': self.end_time_unix_nano,
+            'attributes': self.attributes,
+            'status': status,
+        }
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class InMemorySpanExporter:
+    """Keeps the last ``max_spans`` finished spans in memory."""
+
+    def __init__(self, max_spans: int = 10_000):
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+
+    @property
+    def spans(self) -> list[Span]:
+        return list(self._spans)
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+    def shutdown(self) -> None:
+        self.clear()
+
+
+class FileSpanExporter:
+    """Appends finished spans to ``path``, one JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def export(self, span: Span) -> None:
+        if self._file is None:
+            # Line buffered: every span reaches the file as it ends.
+            self._file = open(self.path, 'a', buffering=1, encoding='utf-8')
+        self._file.write(json.dumps(span.to_dict(), default=str) + '\n')
+
+    def shutdown(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Span]:
+    """The remote parent described by a ``traceparent`` header, if valid."""
+    if not header:
+        return None
+
+    match = TRACEPARENT.match(header.strip().lower())
+    if match is None:
+        return None
+
+    trace_id, span_id, flags = match.groups()
+    if trace_id == INVALID_TRACE_ID or span_id == INVALID_SPAN_ID:
+        return None
+
+    return Span(
+        name='remote',
+        trace_id=trace_id,
+        span_id=span_id,
+        sampled=bool(int(flags, 16) & SAMPLED_FLAG),
+    )
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    'current_span', default=None
+)
+
+
+def current_span() -> Optional[Span]:
+    """The span being recorded in this context, if any."""
+    span = _current_span.get()
+    return span if span is not None and span.sampled else None
+
+
+class Tracer:
+    def __init__(
+        self,
+        exporter: Optional[SpanExporter] = None,
+        sample_ratio: float = 1.0,
+    ):
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def configure(
+        self, exporter: Optional[SpanExporter], sample_ratio: float = 1.0
+    ) -> None:
+        """Replace the exporter, shutting down the previous one."""
+        if self.exporter is not None:
+            self.exporter.shutdown()
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    def shutdown(self) -> None:
+        self.configure(None, self.sample_ratio)
+
+    def _sampled(self, trace_id: str) -> bool:
+        # OpenTelemetry's TraceIdRatioBased rule: the low 64 bits of the
+        # trace id against the ratio, so every service that sees the
+        # trace makes the same decision.
+        return int(trace_id[16:], 16) < self.sample_ratio * _ID_SPACE
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        parent: Optional[Span] = None,
+        **attributes: Any,
+    ) -> Iterator[Optional[Span]]:
+        """Record ``name`` as a child of ``parent`` or of the current span.
+
+        Yields ``None`` when tracing is off or the trace is not sampled.
+        """
+        if parent is None:
+            parent = _current_span.get()
+
+        unsampled_parent = parent is not None and not parent.sampled
+        if self.exporter is None or unsampled_parent:
+            yield None
+            return
+
+        if parent is None:
+            trace_id = f'{random.getrandbits(128):032x}'
+            span = Span(name, trace_id, f'{random.getrandbits(64):016x}')
+            span.sampled = self._sampled(trace_id)
+        else:
+            span = Span(
+                name,
+                parent.trace_id,
+                f'{random.getrandbits(64):016x}',
+                parent_span_id=parent.span_id,
+            )
+
+        token = _current_span.set(span)
+        if not span.sampled:
+            try:
+                yield None
+            finally:
+                _current_span.reset(token)
+            return
+
+        span.attributes.update(attributes)
+        span.start_time_unix_nano = time.time_ns()
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(type(e).__name__)
+            raise
+        finally:
+            span.end_time_unix_nano = time.time_ns()
+            _current_span.reset(token)
+            if span.status == 'UNSET':
+                span.status = 'OK'
+            self.exporter.export(span)
+
+
+def create_exporter(config: Settings = settings) -> Optional[SpanExporter]:
+    if config.TRACING_EXPORTER == 'memory':
+        return InMemorySpanExporter()
+    if config.TRACING_EXPORTER == 'file':
+        return FileSpanExporter(config.TRACING_FILE_PATH)
+    return None
+
+
+tracer = Tracer(create_exporter(), settings.TRACING_SAMPLE_RATIO)
+
+
+def traced(name: Optional[str] = None) -> Callable[[T], T]:
+    """Run a coroutine function inside a span named ``name`` (by default
+    its qualified name). With tracing off it adds a single check."""
+
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if tracer.exporter is None:
+                return await func(*args, **kwargs)
+            with tracer.span(span_name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def trace_methods(obj: T, *names: str) -> T:
+    """Trace the given coroutine methods of ``obj``, for objects from
+    layers that must not depend on infrastructure."""
+    for name in names:
+        method = getattr(obj, name)
+        setattr(
+            obj,
+            name,
+            traced(f'{type(obj).__name__}.{name}')(method),
+        )
+    return obj
@@ -1,14 +1,44 @@
+from contextlib import asynccontextmanager
 from http import HTTPStatus
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
+from src.adapters.api.metrics import MetricsMiddleware
 from src.adapters.api.routers.auth import router as auth_router
 from src.adapters.api.routers.create_user import router as create_user_router
+from src.adapters.api.routers.create_users_batch import (
+    router as create_users_batch_router,
+)
 from src.adapters.api.routers.delete_user import router as delete_user_router
+from src.adapters.api.routers.export_users import (
+    router as export_users_router,
+)
 from src.adapters.api.routers.get_user import router as get_user_router
+from src.adapters.api.routers.import_users import (
+    router as import_users_router,
+)
 from src.adapters.api.routers.list_users import router as list_users_router
+from src.adapters.api.routers.lookup_users import router as lookup_users_router
 from src.adapters.api.routers.update_user import router as update_user_router
+from src.adapters.api.server_timing import ServerTimingMiddleware
+from src.adapters.api.tracing import TracingMiddleware
+from src.factories.container import create_container
+from src.infrastructure.config.settings import settings
 from src.infrastructure.database.sqlite_db import init_db
+from src.infrastructure.metrics import CONTENT_TYPE, registry
+from src.infrastructure.tracing import create_exporter, tracer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_db()
+    tracer.configure(create_exporter(), settings.TRACING_SAMPLE_RATIO)
+    app.state.container = create_container()
+    await app.state.container.start()
+    yield
+    await app.state.container.close()
+    tracer.shutdown()
+
 
 app = FastAPI(
     title='User Management API',
@@ -20,21 +50,26 @@ app = FastAPI(
     },
     openapi_url='/openapi.json',
     docs_url='/docs',
+    lifespan=lifespan,
 )
 
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(ServerTimingMiddleware)
+
 app.include_router(create_user_router, prefix='/api/v1', tags=['users'])
+app.include_router(create_users_batch_router, prefix='/api/v1', tags=['users'])
+app.include_router(import_users_router, prefix='/api/v1', tags=['users'])
+# Before get_user_router, whose /users/{user_id} would match /users/export.
+app.include_router(export_users_router, prefix='/api/v1', tags=['users'])
 app.include_router(get_user_router, prefix='/api/v1', tags=['users'])
 app.include_router(delete_user_router, prefix='/api/v1', tags=['users'])
 app.include_router(update_user_router, prefix='/api/v1', tags=['users'])
 app.include_router(list_users_router, prefix='/api/v1', tags=['users'])
+app.include_router(lookup_users_router, prefix='/api/v1', tags=['users'])
 app.include_router(auth_router, prefix='/api/v1', tags=['auth'])
 
 
-@app.on_event('startup')
-async def startup_event():
-    await init_db()
-
-
 @app.get(
     '/',
     tags=['root'],
@@ -56,3 +91,19 @@ async def root():
 )
 async def health_check():
     return 'OK'
+
+
+@app.get(
+    '/metrics',
+    tags=['health'],
+    status_code=HTTPStatus.OK,
+    response_class=Response,
+    responses={
+        HTTPStatus.OK: {
+            'description': 'Metrics in the Prometheus text format',
+            'content': {CONTENT_TYPE: {}},
+        }
+    },
+)
+async def metrics():
+    return Response(registry.render(), media_type=CONTENT_TYPE)
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from datetime import datetime
 from typing import Awaitable, Callable
 from uuid import UUID, uuid4
@@ -7,11 +8,17 @@ from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from src.adapters.api.dependencies.database import get_db_session
+from src.adapters.api.dependencies.database import (
+    get_db_session,
+    get_session_factory,
+)
+from src.adapters.api.dependencies.loaders import get_user_loader
 from src.adapters.api.schemas.user import UserResponse
+from src.adapters.repositories.user_loader import UserLoader
 from src.adapters.repositories.user_repository_implementation import (
     UserRepositoryImplementation,
 )
+from src.infrastructure.config.settings import settings
 from src.infrastructure.database.sqlite_db import Base, UserORM
 from src.main import app
 
@@ -32,13 +39,34 @@ async def async_session():
     await engine.dispose()
 
 
+async def init_test_db():
+    """The test engine's tables are created by ``async_session``."""
+
+
 @pytest.fixture
-async def client(async_session):
+async def client(async_session, monkeypatch):
+    # Keep the lifespan off the configured database, the process pool
+    # and the shared invalidation socket directory.
+    monkeypatch.setattr('src.main.init_db', init_test_db)
+    monkeypatch.setattr(settings, 'HASH_EXECUTOR', 'thread')
+    monkeypatch.setattr(settings, 'CACHE_INVALIDATION_BUS', 'none')
+
     def override_get_db():
         return async_session
 
+    def session_factory():
+        # Batched work shares the test session instead of opening new ones.
+        return nullcontext(async_session)
+
     app.dependency_overrides[get_db_session] = override_get_db
-    return TestClient(app)
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    user_loader = UserLoader(session_factory)
+    app.dependency_overrides[get_user_loader] = lambda: user_loader
+
+    # Entering the client runs the lifespan handler, which builds the
+    # application container the routes depend on.
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture
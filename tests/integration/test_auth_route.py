@@ -3,6 +3,8 @@ from unittest.mock import patch
 
 import pytest
 
+from src.adapters.auth.jwt_auth_service import JWTAuthenticationService
+
 
 @pytest.mark.asyncio
 async def test_authenticate_user_success(async_session, client, make_user_api):
@@ -228,3 +230,53 @@ async def test_authenticate_user_case_sensitive_email(
 
     assert response.status_code == HTTPStatus.UNAUTHORIZED
     assert response.json()['detail'] == 'Invalid credentials'
+
+
+@pytest.fixture
+def token_cache(client):
+    return client.app.state.container.token_cache
+
+
+@pytest.mark.asyncio
+async def test_repeated_calls_with_same_token_skip_verification(
+    async_session,
+    client,
+    make_user_api,
+    make_token_api,
+    token_cache,
+):
+    await make_user_api(
+        username='testuser',
+        email='testuser@example.com',
+        password_hash='testpassword123',
+    )
+    token = make_token_api('testuser@example.com', 'testpassword123')
+    token_cache.clear()
+
+    with patch.object(
+        JWTAuthenticationService,
+        'decode_token',
+        autospec=True,
+        side_effect=JWTAuthenticationService.decode_token,
+    ) as decode_token:
+        for _ in range(3):
+            response = client.get(
+                '/api/v1/users?page=1&page_size=10',
+                headers={'Authorization': f'Bearer {token}'},
+            )
+            assert response.status_code == HTTPStatus.OK
+
+    decode_token.assert_called_once()
+    assert token_cache.stats() == {'hits': 2, 'misses': 1, 'size': 1}
+
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_not_cached(client, token_cache):
+
+    response = client.get(
+        '/api/v1/users?page=1&page_size=10',
+        headers={'Authorization': 'Bearer invalid_token'},
+    )
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert len(token_cache) == 0
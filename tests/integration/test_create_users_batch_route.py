@@ -0,0 +1,115 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.fixture
+async def token(make_user_api, make_token_api):
+    await make_user_api(
+        username='admin',
+        email='admin@example.com',
+        password_hash='adminpassword',
+    )
+    return make_token_api('admin@example.com', 'adminpassword')
+
+
+@pytest.mark.asyncio
+async def test_create_users_batch_success(async_session, client, token):
+    response = client.post(
+        '/api/v1/users:batch',
+        json={
+            'items': [
+                {
+                    'username': f'batchuser{i}',
+                    'email': f'batchuser{i}@example.com',
+                    'password': 'testpassword',
+                }
+                for i in range(3)
+            ]
+        },
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    expected_created = 3
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data['created'] == expected_created
+    assert data['failed'] == 0
+    assert [item['status'] for item in data['items']] == ['created'] * 3
+    assert data['items'][2]['user']['username'] == 'batchuser2'
+    assert 'password_hash' not in data['items'][0]['user']
+
+    login = client.post(
+        '/api/v1/auth/token',
+        data={
+            'username': 'batchuser1@example.com',
+            'password': 'testpassword',
+        },
+    )
+    assert login.status_code == HTTPStatus.CREATED
+
+
+@pytest.mark.asyncio
+async def test_create_users_batch_reports_conflicts(
+    async_session, client, token
+):
+    response = client.post(
+        '/api/v1/users:batch',
+        json={
+            'items': [
+                {
+                    'username': 'admin',
+                    'email': 'new@example.com',
+                    'password': 'testpassword',
+                },
+                {
+                    'username': 'newuser',
+                    'email': 'new@example.com',
+                    'password': 'testpassword',
+                },
+            ]
+        },
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data['created'] == 1
+    assert data['failed'] == 1
+    assert data['items'][0] == {
+        'index': 0,
+        'status': 'conflict',
+        'user': None,
+        'detail': 'User with username admin already exists',
+    }
+    assert data['items'][1]['status'] == 'created'
+
+
+@pytest.mark.asyncio
+async def test_create_users_batch_unauthorized(async_session, client):
+    response = client.post(
+        '/api/v1/users:batch',
+        json={
+            'items': [
+                {
+                    'username': 'batchuser',
+                    'email': 'batchuser@example.com',
+                    'password': 'testpassword',
+                }
+            ]
+        },
+    )
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_create_users_batch_empty(async_session, client, token):
+    response = client.post(
+        '/api/v1/users:batch',
+        json={'items': []},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
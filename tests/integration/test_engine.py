@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.engine import (
+    create_engine,
+    engine_options,
+    instrument_engine,
+    sqlite_pragmas,
+)
+from src.infrastructure.metrics import Histogram, Registry
+
+
+async def read_pragmas(engine, *names):
+    async with engine.connect() as conn:
+        return {
+            name: (await conn.execute(text(f'PRAGMA {name}'))).scalar()
+            for name in names
+        }
+
+
+@pytest.mark.asyncio
+async def test_production_profile_applies_pragmas_on_connect(tmp_path):
+    config = settings.model_copy(update={'DATABASE_PROFILE': 'production'})
+    engine = create_engine(f'sqlite+aiosqlite:///{tmp_path / "db"}', config)
+
+    pragmas = await read_pragmas(
+        engine,
+        'journal_mode',
+        'synchronous',
+        'busy_timeout',
+        'cache_size',
+        'mmap_size',
+        'temp_store',
+    )
+    await engine.dispose()
+
+    assert pragmas == {
+        'journal_mode': 'wal',
+        'synchronous': 1,
+        'busy_timeout': config.SQLITE_BUSY_TIMEOUT_MS,
+        'cache_size': -config.SQLITE_CACHE_SIZE_KIB,
+        'mmap_size': config.SQLITE_MMAP_SIZE,
+        'temp_store': 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_default_profile_keeps_sqlite_defaults(tmp_path):
+    config = settings.model_copy(update={'DATABASE_PROFILE': 'default'})
+    engine = create_engine(f'sqlite+aiosqlite:///{tmp_path / "db"}', config)
+
+    pragmas = await read_pragmas(engine, 'journal_mode')
+    await engine.dispose()
+
+    assert sqlite_pragmas(config) == {}
+    assert pragmas == {'journal_mode': 'delete'}
+
+
+def test_engine_options_disable_echo_by_default():
+    assert settings.DATABASE_ECHO is False
+    assert engine_options('sqlite+aiosqlite:///:memory:')['echo'] is False
+
+
+def test_engine_options_size_the_pool_for_file_databases():
+    options = engine_options('sqlite+aiosqlite:///./data/users.db')
+
+    assert options['pool_size'] == settings.DATABASE_POOL_SIZE
+    assert options['max_overflow'] == settings.DATABASE_MAX_OVERFLOW
+    assert options['pool_timeout'] == settings.DATABASE_POOL_TIMEOUT
+
+
+def test_engine_options_skip_pool_sizing_for_memory_databases():
+    options = engine_options('sqlite+aiosqlite:///:memory:')
+
+    assert 'pool_size' not in options
+    assert 'max_overflow' not in options
+
+
+@pytest.mark.asyncio
+async def test_instrumented_engine_times_statements_and_exposes_the_pool(
+    tmp_path,
+):
+    engine = create_engine(f'sqlite+aiosqlite:///{tmp_path / "db"}')
+    histogram = Histogram('statements', 'Statements.', ('operation',))
+    metrics = Registry()
+    instrument_engine(engine, histogram, metrics)
+
+    async with engine.connect() as conn:
+        await conn.execute(text('SELECT 1'))
+        pool = metrics.render().splitlines()
+    await engine.dispose()
+
+    assert 'statements_count{operation="SELECT"} 1' in histogram.render()
+    assert 'db_pool_connections{state="checked_out"} 1' in pool
+    assert 'db_pool_connections{state="overflow"} 0' in pool
@@ -0,0 +1,117 @@
+import csv
+import io
+import json
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.fixture
+async def make_users(make_user_api):
+    async def _make_users(count: int):
+        for i in range(count):
+            await make_user_api(
+                username=f'testuser{i}',
+                email=f'testuser{i}@example.com',
+                password_hash='testpassword',
+            )
+
+    return _make_users
+
+
+@pytest.fixture
+async def auth_headers(make_users, make_token_api):
+    await make_users(3)
+    token = make_token_api('testuser0@example.com', 'testpassword')
+    return {'Authorization': f'Bearer {token}'}
+
+
+@pytest.mark.asyncio
+async def test_export_users_ndjson(client, auth_headers):
+    response = client.get('/api/v1/users/export', headers=auth_headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    assert 'users.ndjson' in response.headers['content-disposition']
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [record['username'] for record in records] == [
+        'testuser0',
+        'testuser1',
+        'testuser2',
+    ]
+    assert 'password_hash' not in records[0]
+
+
+@pytest.mark.asyncio
+async def test_export_users_csv(client, auth_headers):
+    response = client.get(
+        '/api/v1/users/export?format=csv', headers=auth_headers
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'].startswith('text/csv')
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+
+    assert [row['email'] for row in rows] == [
+        'testuser0@example.com',
+        'testuser1@example.com',
+        'testuser2@example.com',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_users_with_filters(client, auth_headers):
+    response = client.get(
+        '/api/v1/users/export?username=testuser1', headers=auth_headers
+    )
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == HTTPStatus.OK
+    assert [record['username'] for record in records] == ['testuser1']
+
+
+@pytest.mark.asyncio
+async def test_export_users_with_query_and_order(client, auth_headers):
+    response = client.get(
+        '/api/v1/users/export?query=testuser&order_by=username'
+        '&order_direction=desc',
+        headers=auth_headers,
+    )
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == HTTPStatus.OK
+    assert [record['username'] for record in records] == [
+        'testuser2',
+        'testuser1',
+        'testuser0',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_users_invalid_order_by(client, auth_headers):
+    response = client.get(
+        '/api/v1/users/export?order_by=password_hash', headers=auth_headers
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_export_users_invalid_format(client, auth_headers):
+    response = client.get(
+        '/api/v1/users/export?format=xml', headers=auth_headers
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_export_users_unauthorized(client):
+    response = client.get('/api/v1/users/export')
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
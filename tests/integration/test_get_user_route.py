@@ -92,3 +92,133 @@ async def test_get_user_internal_server_error(
 
         assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
         assert response.json()['detail'] == 'Database connection failed'
+
+
+@pytest.mark.asyncio
+async def test_get_user_is_served_from_cache_until_invalidated(
+    async_session,
+    client,
+    make_user_api,
+    make_token_api,
+):
+    user = await make_user_api(
+        username='testuser',
+        email='testuser@example.com',
+        password_hash='testpassword',
+    )
+    token = make_token_api('testuser@example.com', 'testpassword')
+    headers = {'Authorization': f'Bearer {token}'}
+
+    client.get(f'/api/v1/users/{user.id}', headers=headers)
+
+    with patch(
+        'src.adapters.repositories.user_loader.UserLoader.load',
+    ) as load:
+        cached = client.get(f'/api/v1/users/{user.id}', headers=headers)
+
+    load.assert_not_called()
+    assert cached.status_code == HTTPStatus.OK
+    assert cached.json()['username'] == 'testuser'
+
+    client.put(
+        f'/api/v1/users/{user.id}',
+        json={'username': 'renamed'},
+        headers=headers,
+    )
+    response = client.get(f'/api/v1/users/{user.id}', headers=headers)
+
+    assert response.json()['username'] == 'renamed'
+
+
+@pytest.mark.asyncio
+async def test_get_user_not_modified(
+    async_session,
+    client,
+    make_user_api,
+    make_token_api,
+):
+    user = await make_user_api(
+        username='testuser',
+        email='testuser@example.com',
+        password_hash='testpassword',
+    )
+    token = make_token_api('testuser@example.com', 'testpassword')
+    headers = {'Authorization': f'Bearer {token}'}
+
+    first = client.get(f'/api/v1/users/{user.id}', headers=headers)
+    etag = first.headers['ETag']
+
+    response = client.get(
+        f'/api/v1/users/{user.id}',
+        headers={**headers, 'If-None-Match': etag},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers['ETag'] == etag
+
+    client.put(
+        f'/api/v1/users/{user.id}',
+        json={'email': 'changed@example.com'},
+        headers=headers,
+    )
+    response = client.get(
+        f'/api/v1/users/{user.id}',
+        headers={**headers, 'If-None-Match': etag},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['ETag'] != etag
+
+
+@pytest.mark.asyncio
+async def test_get_user_with_fields(
+    async_session,
+    client,
+    make_user_api,
+    make_token_api,
+):
+    user = await make_user_api(
+        username='testuser',
+        email='testuser@example.com',
+        password_hash='testpassword',
+    )
+    token = make_token_api('testuser@example.com', 'testpassword')
+    headers = {'Authorization': f'Bearer {token}'}
+
+    full = client.get(f'/api/v1/users/{user.id}', headers=headers)
+    response = client.get(
+        f'/api/v1/users/{user.id}?fields=id,username', headers=headers
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'id': str(user.id), 'username': 'testuser'}
+    assert response.headers['ETag'] != full.headers['ETag']
+
+    not_modified = client.get(
+        f'/api/v1/users/{user.id}?fields=id,username',
+        headers={**headers, 'If-None-Match': response.headers['ETag']},
+    )
+
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.asyncio
+async def test_get_user_with_unknown_fields(
+    async_session,
+    client,
+    make_user_api,
+    make_token_api,
+):
+    user = await make_user_api(
+        username='testuser',
+        email='testuser@example.com',
+        password_hash='testpassword',
+    )
+    token = make_token_api('testuser@example.com', 'testpassword')
+
+    response = client.get(
+        f'/api/v1/users/{user.id}?fields=id,password_hash',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
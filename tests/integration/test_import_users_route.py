@@ -0,0 +1,189 @@
+import json
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+from pwdlib import PasswordHash
+from sqlalchemy.exc import OperationalError
+
+from src.application.use_cases.create_user import CreateUserUseCase
+from src.infrastructure.config.settings import settings
+
+NDJSON = {'Content-Type': 'application/x-ndjson'}
+CSV = {'Content-Type': 'text/csv'}
+
+
+@pytest.fixture
+async def token(make_user_api, make_token_api):
+    await make_user_api(
+        username='admin',
+        email='admin@example.com',
+        password_hash='adminpassword',
+    )
+    return make_token_api('admin@example.com', 'adminpassword')
+
+
+def ndjson(rows: list[dict]) -> str:
+    return ''.join(json.dumps(row) + '\n' for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_import_users_ndjson(client, token):
+    response = client.post(
+        '/api/v1/users:import',
+        content=ndjson([
+            {
+                'username': f'imported{i}',
+                'email': f'imported{i}@example.com',
+                'password': 'testpassword',
+            }
+            for i in range(3)
+        ]),
+        headers={**NDJSON, 'Authorization': f'Bearer {token}'},
+    )
+
+    expected_created = 3
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        'created': expected_created,
+        'failed': 0,
+        'errors': [],
+        'aborted': None,
+    }
+
+    login = client.post(
+        '/api/v1/auth/token',
+        data={'username': 'imported1@example.com', 'password': 'testpassword'},
+    )
+    assert login.status_code == HTTPStatus.CREATED
+
+
+@pytest.mark.asyncio
+async def test_import_users_csv_with_password_hash(client, token):
+    password_hash = PasswordHash.recommended().hash('legacypassword')
+
+    response = client.post(
+        '/api/v1/users:import',
+        content=(
+            'username,email,password,password_hash\r\n'
+            f'legacy,legacy@example.com,,"{password_hash}"\r\n'
+        ),
+        headers={**CSV, 'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['errors'] == []
+    assert response.json()['created'] == 1
+
+    login = client.post(
+        '/api/v1/auth/token',
+        data={'username': 'legacy@example.com', 'password': 'legacypassword'},
+    )
+    assert login.status_code == HTTPStatus.CREATED
+
+
+@pytest.mark.asyncio
+async def test_import_users_reports_row_errors(client, token):
+    body = '\n'.join([
+        json.dumps({
+            'username': 'valid',
+            'email': 'valid@example.com',
+            'password': 'testpassword',
+        }),
+        '{not json',
+        json.dumps({
+            'username': 'bademail',
+            'email': 'not-an-email',
+            'password': 'testpassword',
+        }),
+        json.dumps({
+            'username': 'admin',
+            'email': 'other@example.com',
+            'password': 'testpassword',
+        }),
+        json.dumps({
+            'username': 'nopassword',
+            'email': 'nopassword@example.com',
+        }),
+    ])
+
+    response = client.post(
+        '/api/v1/users:import',
+        content=body,
+        headers={**NDJSON, 'Authorization': f'Bearer {token}'},
+    )
+
+    data = response.json()
+    expected_failed = 4
+
+    assert response.status_code == HTTPStatus.OK
+    assert data['created'] == 1
+    assert data['failed'] == expected_failed
+    assert [error['line'] for error in data['errors']] == [2, 3, 4, 5]
+    assert data['errors'][0]['detail'] == 'Invalid JSON'
+    assert data['errors'][1]['detail'].startswith('email:')
+    assert data['errors'][2]['detail'] == (
+        'User with username admin already exists'
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_users_reports_progress_when_stopped(
+    client, token, monkeypatch
+):
+    monkeypatch.setattr(settings, 'IMPORT_BATCH_SIZE', 1)
+    execute_many = CreateUserUseCase.execute_many
+    calls = []
+
+    async def fail_second_chunk(self, requests):
+        calls.append(requests)
+        if len(calls) > 1:
+            raise OperationalError('INSERT', {}, Exception('disk I/O error'))
+        return await execute_many(self, requests)
+
+    rows = [
+        {
+            'username': f'user{i}',
+            'email': f'user{i}@example.com',
+            'password': 'testpassword',
+        }
+        for i in range(3)
+    ]
+    with patch.object(CreateUserUseCase, 'execute_many', fail_second_chunk):
+        response = client.post(
+            '/api/v1/users:import',
+            content=ndjson(rows),
+            headers={**NDJSON, 'Authorization': f'Bearer {token}'},
+        )
+
+    data = response.json()
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert {key: data[key] for key in ('created', 'failed')} == {
+        'created': 1,
+        'failed': 1,
+    }
+    assert [error['line'] for error in data['errors']] == [2]
+    assert data['aborted'].startswith('Import stopped at line 2:')
+
+
+@pytest.mark.asyncio
+async def test_import_users_unsupported_media_type(client, token):
+    response = client.post(
+        '/api/v1/users:import',
+        content='<users/>',
+        headers={
+            'Content-Type': 'application/xml',
+            'Authorization': f'Bearer {token}',
+        },
+    )
+
+    assert response.status_code == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+
+
+@pytest.mark.asyncio
+async def test_import_users_unauthorized(client):
+    response = client.post('/api/v1/users:import', content='', headers=NDJSON)
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
@@ -747,3 +747,163 @@ async def test_list_users_invalid_filter_error(
 
         assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
         assert response.json()['detail'] == 'Invalid filter'
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_cursor_pagination(
+    async_session,
+    client,
+    make_users,
+    make_token_api,
+):
+    await make_users(5)
+
+    token = make_token_api('testuser0@example.com', 'testpassword')
+    headers = {'Authorization': f'Bearer {token}'}
+
+    usernames = []
+    url = '/api/v1/users?page_size=2&order_by=username&order_direction=asc'
+    response = client.get(url, headers=headers)
+    while True:
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        usernames += [item['username'] for item in data['items']]
+        if data['next_cursor'] is None:
+            break
+        response = client.get(
+            f'{url}&cursor={data["next_cursor"]}', headers=headers
+        )
+
+    assert usernames == [f'testuser{i}' for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_invalid_cursor(
+    async_session,
+    client,
+    make_users,
+    make_token_api,
+):
+    await make_users(1)
+
+    token = make_token_api('testuser0@example.com', 'testpassword')
+
+    response = client.get(
+        '/api/v1/users?page_size=2&cursor=invalid',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()['detail'] == 'Cursor is malformed'
+
+
+@pytest.mark.asyncio
+async def test_list_users_without_total(
+    async_session,
+    client,
+    make_users,
+    make_token_api,
+):
+    await make_users(3)
+
+    token = make_token_api('testuser0@example.com', 'testpassword')
+
+    response = client.get(
+        '/api/v1/users?page=1&page_size=2&include_total=false',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    expected_length = 2
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['total_items'] is None
+    assert len(response.json()['items']) == expected_length
+
+
+@pytest.mark.asyncio
+async def test_list_users_not_modified_until_a_user_changes(
+    async_session,
+    client,
+    make_users,
+    make_token_api,
+):
+    await make_users(3)
+    token = make_token_api('testuser0@example.com', 'testpassword')
+    headers = {'Authorization': f'Bearer {token}'}
+    url = '/api/v1/users?page=1&page_size=10'
+
+    first = client.get(url, headers=headers)
+    etag = first.headers['ETag']
+
+    not_modified = client.get(url, headers={**headers, 'If-None-Match': etag})
+
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert not not_modified.content
+    assert not_modified.headers['ETag'] == etag
+
+    user_id = first.json()['items'][0]['id']
+    client.put(
+        f'/api/v1/users/{user_id}',
+        json={'username': 'renamed'},
+        headers=headers,
+    )
+    changed = client.get(url, headers={**headers, 'If-None-Match': etag})
+
+    assert changed.status_code == HTTPStatus.OK
+    assert changed.headers['ETag'] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_fields(
+    async_session,
+    client,
+    make_users,
+    make_token_api,
+):
+    await make_users(3)
+    token = make_token_api('testuser0@example.com', 'testpassword')
+    page_size = 2
+
+    response = client.get(
+        f'/api/v1/users?page_size={page_size}&fields=username',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    data = response.json()
+    expected_total = 3
+
+    assert response.status_code == HTTPStatus.OK
+    assert data['items'] == [
+        {'username': 'testuser0'},
+        {'username': 'testuser1'},
+    ]
+    assert data['total_items'] == expected_total
+    assert data['page_size'] == page_size
+    assert data['next_cursor'] is not None
+    assert response.headers['ETag']
+
+    next_page = client.get(
+        f'/api/v1/users?page_size={page_size}&fields=username'
+        f'&cursor={data["next_cursor"]}',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert next_page.json()['items'] == [{'username': 'testuser2'}]
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_unknown_fields(
+    async_session,
+    client,
+    make_users,
+    make_token_api,
+):
+    await make_users(1)
+    token = make_token_api('testuser0@example.com', 'testpassword')
+
+    response = client.get(
+        '/api/v1/users?fields=username,password_hash',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,74 @@
+from http import HTTPStatus
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_lookup_users_success(
+    async_session,
+    client,
+    make_user_api,
+    make_token_api,
+):
+    first = await make_user_api(
+        username='first',
+        email='first@example.com',
+        password_hash='testpassword',
+    )
+    second = await make_user_api(
+        username='second',
+        email='second@example.com',
+        password_hash='testpassword',
+    )
+    missing_id = str(uuid4())
+
+    token = make_token_api('first@example.com', 'testpassword')
+
+    response = client.post(
+        '/api/v1/users:lookup',
+        json={'ids': [str(second.id), missing_id, str(first.id)]},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [item['username'] for item in data['items']] == [
+        'second',
+        'first',
+    ]
+    assert data['missing'] == [missing_id]
+    assert 'password_hash' not in data['items'][0]
+
+
+@pytest.mark.asyncio
+async def test_lookup_users_unauthorized(async_session, client):
+    response = client.post(
+        '/api/v1/users:lookup',
+        json={'ids': [str(uuid4())]},
+    )
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_lookup_users_too_many_ids(
+    async_session,
+    client,
+    make_user_api,
+    make_token_api,
+):
+    await make_user_api(
+        username='testuser',
+        email='testuser@example.com',
+        password_hash='testpassword',
+    )
+    token = make_token_api('testuser@example.com', 'testpassword')
+
+    response = client.post(
+        '/api/v1/users:lookup',
+        json={'ids': [str(uuid4()) for _ in range(101)]},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
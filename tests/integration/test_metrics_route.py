@@ -0,0 +1,40 @@
+from http import HTTPStatus
+
+import pytest
+
+from src.infrastructure.metrics import CONTENT_TYPE
+
+
+@pytest.mark.asyncio
+async def test_metrics_expose_routes_and_password_hashing(
+    client, make_user_api, make_token_api
+):
+    user = await make_user_api(
+        username='testuser',
+        email='testuser@example.com',
+        password_hash='testpassword',
+    )
+    token = make_token_api('testuser@example.com', 'testpassword')
+    client.get(
+        f'/api/v1/users/{user.id}',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    response = client.get('/metrics')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == CONTENT_TYPE
+    assert (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="/api/v1/users/{user_id}",status="200"}'
+    ) in response.text
+    assert (
+        'password_hash_duration_seconds_count{operation="hash"}'
+        in response.text
+    )
+    assert (
+        'password_hash_duration_seconds_count{operation="verify"}'
+        in response.text
+    )
+    assert '# TYPE db_statement_duration_seconds histogram' in response.text
+    assert 'jwt_token_cache_misses 1' in response.text
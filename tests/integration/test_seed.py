@@ -0,0 +1,140 @@
+from uuid import UUID
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.adapters.repositories.user_repository_implementation import (
+    UserRepositoryImplementation,
+)
+from src.domain.ports.user_repository import ListUsersConfig
+from src.infrastructure.database.engine import create_engine
+from src.infrastructure.database.seed import (
+    random_ids,
+    seed_users,
+    user_batches,
+    users_table,
+)
+
+UUID_VERSION = 4
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_engine(f'sqlite+aiosqlite:///{tmp_path / "seed.db"}')
+    yield engine
+    await engine.dispose()
+
+
+async def schema_objects(engine) -> set[str]:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text(
+                'SELECT name FROM sqlite_master WHERE type IN '
+                "('index', 'trigger') AND name NOT LIKE 'sqlite_%'"
+            )
+        )
+        return set(result.scalars())
+
+
+def test_random_ids_are_uuid4_that_sqlite_keeps_as_text():
+    ids = random_ids(1_000)
+
+    assert len(set(ids)) == len(ids)
+    for value in ids:
+        assert UUID(value).version == UUID_VERSION
+        assert UUID(value).hex == value
+        assert not value.replace('e', '', 1).isdigit()
+
+
+def test_user_batches_split_the_range():
+    count, batch_size = 5, 2
+
+    batches = list(user_batches(10, count, 'hash', batch_size))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    usernames = [row[1] for batch in batches for row in batch]
+    assert usernames == [f'user{i}' for i in range(10, 10 + count)]
+
+
+@pytest.mark.asyncio
+async def test_seed_users_are_readable_through_the_repository(engine):
+    count = 25
+
+    start = await seed_users(engine, count, 'shared-hash', batch_size=10)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+    async with session_factory() as session:
+        repository = UserRepositoryImplementation(session)
+        user = await repository.get_user_by_email('user7@example.com')
+        same = await repository.get_user_by_id(user.id)
+        users = await repository.list_users(
+            ListUsersConfig(page=1, page_size=count)
+        )
+        matches = await repository.list_users(
+            ListUsersConfig(page=1, page_size=count, query='user12')
+        )
+
+    assert start == 0
+    assert user.username == 'user7'
+    assert user.password_hash == 'shared-hash'
+    assert same == user
+    assert len(users) == count
+    assert [match.username for match in matches] == ['user12']
+
+
+@pytest.mark.asyncio
+async def test_seed_users_restores_indexes_and_analyzes(engine):
+    await seed_users(engine, 10, 'hash')
+
+    objects = await schema_objects(engine)
+    async with engine.connect() as conn:
+        stats = await conn.scalar(text('SELECT count(*) FROM sqlite_stat1'))
+
+    assert {index.name for index in users_table.indexes} <= objects
+    assert 'users_fts_ai' in objects
+    assert stats > 0
+
+
+@pytest.mark.asyncio
+async def test_seed_users_continues_from_the_row_count(engine):
+    first, second = 10, 3
+    await seed_users(engine, first, 'hash')
+
+    # Three rows into ten keeps the indexes and trigger in place.
+    start = await seed_users(engine, second, 'hash')
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+    async with session_factory() as session:
+        repository = UserRepositoryImplementation(session)
+        total = await repository.count_users(
+            ListUsersConfig(page=1, page_size=1)
+        )
+        matches = await repository.list_users(
+            ListUsersConfig(page=1, page_size=10, query='user12')
+        )
+
+    assert start == first
+    assert total == first + second
+    assert [match.username for match in matches] == ['user12']
+
+
+@pytest.mark.asyncio
+async def test_failed_seed_rolls_back_rows_and_schema(engine):
+    first = 10
+    await seed_users(engine, first, 'hash')
+    objects = await schema_objects(engine)
+
+    # Renumbering from 0 repeats every username: the unique indexes
+    # rebuilt at the end of the load reject them.
+    with pytest.raises(IntegrityError):
+        await seed_users(engine, 20, 'hash', start=0)
+
+    async with engine.connect() as conn:
+        total = await conn.scalar(text('SELECT count(*) FROM users'))
+
+    assert total == first
+    assert await schema_objects(engine) == objects
+    assert {index.name for index in users_table.indexes} <= objects
+    assert 'users_fts_ai' in objects
@@ -0,0 +1,56 @@
+import pytest
+
+from src.infrastructure.database.engine import instrument_engine
+from src.infrastructure.metrics import Histogram, Registry
+
+ASK = {'X-Server-Timing': '1'}
+
+
+def phases(response) -> set[str]:
+    return {
+        metric.split(';', 1)[0]
+        for metric in response.headers['server-timing'].split(', ')
+    }
+
+
+@pytest.fixture
+def instrumented(async_session):
+    instrument_engine(
+        async_session.bind, Histogram('statements', 'Statements.'), Registry()
+    )
+
+
+@pytest.mark.asyncio
+async def test_server_timing_breaks_down_a_request(
+    client, make_user_api, instrumented
+):
+    # A user of its own, so the token is not in the verified-token cache.
+    user = await make_user_api(
+        username='timinguser',
+        email='timinguser@example.com',
+        password_hash='testpassword',
+    )
+    token_response = client.post(
+        '/api/v1/auth/token',
+        data={
+            'username': 'timinguser@example.com',
+            'password': 'testpassword',
+        },
+        headers=ASK,
+    )
+    token = token_response.json()['access_token']
+
+    response = client.get(
+        f'/api/v1/users/{user.id}',
+        headers={'Authorization': f'Bearer {token}', **ASK},
+    )
+
+    assert {'db', 'hash', 'jwt', 'total'} <= phases(token_response)
+    assert {'jwt', 'serialize', 'total'} <= phases(response)
+
+
+@pytest.mark.asyncio
+async def test_server_timing_is_opt_in(client):
+    response = client.get('/health')
+
+    assert 'server-timing' not in response.headers
@@ -0,0 +1,63 @@
+import pytest
+
+from src.infrastructure.tracing import InMemorySpanExporter, tracer
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    tracer.configure(exporter)
+    yield exporter
+    tracer.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_token_request_is_traced_down_to_the_hasher(
+    client, make_user_api, make_token_api, exporter
+):
+    await make_user_api(
+        username='testuser',
+        email='testuser@example.com',
+        password_hash='testpassword',
+    )
+    exporter.clear()
+
+    make_token_api('testuser@example.com', 'testpassword')
+
+    spans = {span.name: span for span in exporter.spans}
+    root = spans['POST /api/v1/auth/token']
+    use_case = spans['AuthenticateUserUseCase.execute']
+    assert root.parent_span_id is None
+    assert use_case.parent_span_id == root.span_id
+    for name in (
+        'UserRepositoryImplementation.get_user_by_email',
+        'ExecutorPasswordHasher.verify_password',
+        'JWTAuthenticationService.authenticate',
+    ):
+        assert spans[name].trace_id == root.trace_id
+        assert spans[name].parent_span_id in {
+            span.span_id for span in exporter.spans
+        }
+
+
+@pytest.mark.asyncio
+async def test_authenticated_request_traces_token_validation(
+    client, make_user_api, make_token_api, exporter
+):
+    await make_user_api(
+        username='testuser',
+        email='testuser@example.com',
+        password_hash='testpassword',
+    )
+    token = make_token_api('testuser@example.com', 'testpassword')
+    exporter.clear()
+
+    client.get(
+        '/api/v1/users/?page=1&page_size=10',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    spans = {span.name: span for span in exporter.spans}
+    root = spans['GET /api/v1/users/']
+    validation = spans['JWTAuthenticationService.validate_token']
+    assert validation.parent_span_id == root.span_id
@@ -71,6 +71,32 @@ async def test_update_user_not_found(
     assert response.json()['detail'] == f'User with id {random_id} not found'
 
 
+@pytest.mark.asyncio
+async def test_update_missing_user_to_taken_email_is_not_found(
+    async_session,
+    client,
+    make_user_api,
+    make_token_api,
+):
+    await make_user_api(
+        username='testuser',
+        email='testuser@example.com',
+        password_hash='testpassword',
+    )
+
+    token = make_token_api('testuser@example.com', 'testpassword')
+
+    random_id = uuid4()
+    response = client.put(
+        f'/api/v1/users/{random_id}',
+        json={'email': 'testuser@example.com'},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json()['detail'] == f'User with id {random_id} not found'
+
+
 @pytest.mark.asyncio
 async def test_update_user_duplicate_email(
     async_session,
@@ -0,0 +1,94 @@
+import asyncio
+from contextlib import nullcontext
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.repositories.user_loader import UserLoader
+from src.adapters.repositories.user_repository_implementation import (
+    UserRepositoryImplementation,
+)
+
+
+@pytest.fixture
+def user_loader(async_session):
+    return UserLoader(lambda: nullcontext(async_session))
+
+
+@pytest.mark.asyncio
+async def test_user_loader_coalesces_concurrent_loads(user_loader, make_user):
+    first = await make_user(username='first', email='first@example.com')
+    second = await make_user(username='second', email='second@example.com')
+    missing_id = uuid4()
+
+    original = UserRepositoryImplementation.get_users_by_ids
+    with patch.object(
+        UserRepositoryImplementation,
+        'get_users_by_ids',
+        autospec=True,
+        side_effect=original,
+    ) as get_users_by_ids:
+        users = await asyncio.gather(
+            user_loader.load(first.id),
+            user_loader.load(second.id),
+            user_loader.load(first.id),
+            user_loader.load(missing_id),
+        )
+
+    assert [user.username if user else None for user in users] == [
+        'first',
+        'second',
+        'first',
+        None,
+    ]
+    get_users_by_ids.assert_called_once()
+    assert get_users_by_ids.call_args.args[1] == [
+        first.id,
+        second.id,
+        missing_id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_user_loader_splits_large_batches(async_session, make_user):
+    user_loader = UserLoader(lambda: nullcontext(async_session), 2)
+    users = [
+        await make_user(username=f'user{i}', email=f'user{i}@example.com')
+        for i in range(3)
+    ]
+
+    original = UserRepositoryImplementation.get_users_by_ids
+    with patch.object(
+        UserRepositoryImplementation,
+        'get_users_by_ids',
+        autospec=True,
+        side_effect=original,
+    ) as get_users_by_ids:
+        loaded = await asyncio.gather(
+            *(user_loader.load(user.id) for user in users)
+        )
+
+    expected_calls = 2
+
+    assert [user.id for user in loaded] == [user.id for user in users]
+    assert get_users_by_ids.call_count == expected_calls
+
+
+@pytest.mark.asyncio
+async def test_user_loader_propagates_errors(user_loader):
+    with patch.object(
+        UserRepositoryImplementation,
+        'get_users_by_ids',
+        side_effect=Exception('Database connection failed'),
+    ):
+        results = await asyncio.gather(
+            user_loader.load(uuid4()),
+            user_loader.load(uuid4()),
+            return_exceptions=True,
+        )
+
+    assert [str(result) for result in results] == [
+        'Database connection failed',
+        'Database connection failed',
+    ]
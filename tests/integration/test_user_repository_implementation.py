@@ -7,8 +7,12 @@ from src.adapters.repositories.user_repository_implementation import (
     UserRepositoryImplementation,
 )
 from src.application.use_cases.list_users import ListUsersConfig
-from src.domain.entities.user import User
-from src.domain.errors.domain_exceptions import UserNotFoundError
+from src.domain.entities.user import User, UserSummary
+from src.domain.errors.domain_exceptions import (
+    UserAlreadyExistsError,
+    UserNotFoundError,
+)
+from src.domain.ports.user_repository import UserCursor
 
 
 @pytest.mark.asyncio
@@ -34,6 +38,55 @@ async def test_create_and_get_user_by_id(
     assert created_user.email == 'test@example.com'
 
 
+@pytest.mark.asyncio
+async def test_create_user_duplicate_email(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    await make_user(username='first', email='taken@example.com')
+
+    with pytest.raises(UserAlreadyExistsError) as exc:
+        await user_repository.create_user(
+            User(
+                username='second',
+                email='taken@example.com',
+                password_hash='hashed_password',
+            )
+        )
+
+    assert str(exc.value) == 'User with email taken@example.com already exists'
+    assert await user_repository.get_user_by_username('second') is None
+
+
+@pytest.mark.asyncio
+async def test_create_user_duplicate_username(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    await make_user(username='taken', email='first@example.com')
+
+    with pytest.raises(UserAlreadyExistsError) as exc:
+        await user_repository.create_user(
+            User(
+                username='taken',
+                email='second@example.com',
+                password_hash='hashed_password',
+            )
+        )
+
+    assert str(exc.value) == 'User with username taken already exists'
+
+    # The failed INSERT is rolled back and the session stays usable.
+    created = await user_repository.create_user(
+        User(
+            username='third',
+            email='second@example.com',
+            password_hash='hashed_password',
+        )
+    )
+    assert created.username == 'third'
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_email(
     user_repository: UserRepositoryImplementation,
@@ -95,16 +148,17 @@ async def test_update_user(
 ):
     user = await make_user()
 
-    updated_user = User(
-        id=user.id,
-        username='updateduser',
-        email='updated@example.com',
-        password_hash='new_hash',
-        created_at=user.created_at,
-        updated_at=datetime.now(timezone.utc),
+    result = await user_repository.update_user(
+        user.id,
+        {
+            'username': 'updateduser',
+            'email': 'updated@example.com',
+            'password_hash': 'new_hash',
+            'updated_at': datetime.now(timezone.utc),
+        },
     )
-    result = await user_repository.update_user(updated_user)
 
+    assert result.id == user.id
     assert result.username == 'updateduser'
     assert result.email == 'updated@example.com'
     assert result.password_hash == 'new_hash'
@@ -118,15 +172,46 @@ async def test_update_user(
 async def test_update_user_not_found(
     user_repository: UserRepositoryImplementation,
 ):
-    user = User(
-        id=uuid4(),
-        username='testuser',
-        email='test@example.com',
-        password_hash='hashed_password',
+    with pytest.raises(UserNotFoundError):
+        await user_repository.update_user(uuid4(), {'username': 'testuser'})
+
+
+@pytest.mark.asyncio
+async def test_update_user_to_taken_email_conflicts(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    await make_user(username='first', email='taken@example.com')
+    user = await make_user(username='second', email='second@example.com')
+    # The rollback expires the fixture's ORM object.
+    user_id = user.id
+
+    with pytest.raises(UserAlreadyExistsError) as exc:
+        await user_repository.update_user(
+            user_id, {'email': 'taken@example.com'}
+        )
+
+    assert str(exc.value) == 'User with email taken@example.com already exists'
+    # The failed UPDATE is rolled back and the session stays usable.
+    fetched_user = await user_repository.get_user_by_id(user_id)
+    assert fetched_user.email == 'second@example.com'
+
+
+@pytest.mark.asyncio
+async def test_update_user_only_touches_changed_columns(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    user = await make_user(username='keepme', email='keep@example.com')
+
+    result = await user_repository.update_user(
+        user.id, {'email': 'changed@example.com'}
     )
 
-    with pytest.raises(UserNotFoundError):
-        await user_repository.update_user(user)
+    assert result.username == 'keepme'
+    assert result.email == 'changed@example.com'
+    assert result.password_hash == user.password_hash
+    assert result.created_at == user.created_at
 
 
 @pytest.mark.asyncio
@@ -257,6 +342,48 @@ async def test_list_users_with_order_by_and_order_direction(
     assert result[1].username == 'buser'
 
 
+@pytest.mark.asyncio
+async def test_list_users_with_cursor(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    for name in ['auser', 'buser', 'cuser', 'duser']:
+        await make_user(username=name, email=f'{name}@example.com')
+
+    config = ListUsersConfig(
+        page=1, page_size=2, order_by='username', order_direction='asc'
+    )
+    first_page = await user_repository.list_users(config)
+
+    config.cursor = UserCursor(
+        value=first_page[-1].username, id=first_page[-1].id
+    )
+    second_page = await user_repository.list_users(config)
+
+    assert [user.username for user in first_page] == ['auser', 'buser']
+    assert [user.username for user in second_page] == ['cuser', 'duser']
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_cursor_desc_by_created_at(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    for name in ['auser', 'buser', 'cuser']:
+        await make_user(username=name, email=f'{name}@example.com')
+
+    config = ListUsersConfig(page=1, page_size=2, order_direction='desc')
+    first_page = await user_repository.list_users(config)
+
+    config.cursor = UserCursor(
+        value=first_page[-1].created_at, id=first_page[-1].id
+    )
+    second_page = await user_repository.list_users(config)
+
+    assert [user.username for user in first_page] == ['cuser', 'buser']
+    assert [user.username for user in second_page] == ['auser']
+
+
 @pytest.mark.asyncio
 async def test_count_users_total(
     user_repository: UserRepositoryImplementation,
@@ -333,3 +460,316 @@ async def test_count_users_with_query_and_filters(
 
     # Assert
     assert total == 1
+
+
+@pytest.mark.asyncio
+async def test_count_users_with_query_matching_email(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    await make_user(username='alice', email='alice@corp.com')
+    await make_user(username='bob', email='bob@example.com')
+
+    config = ListUsersConfig(page=1, page_size=10, query='corp')
+    total = await user_repository.count_users(config)
+    result = await user_repository.list_users(config)
+
+    assert total == len(result) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_total(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    for i in range(5):
+        await make_user(username=f'user{i}', email=f'user{i}@example.com')
+
+    config = ListUsersConfig(page=2, page_size=2)
+    users, total = await user_repository.list_users_with_total(config)
+
+    expected_total = 5
+
+    assert [user.username for user in users] == ['user2', 'user3']
+    assert total == expected_total
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_total_past_last_page(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    for i in range(3):
+        await make_user(username=f'user{i}', email=f'user{i}@example.com')
+
+    config = ListUsersConfig(page=5, page_size=2)
+    users, total = await user_repository.list_users_with_total(config)
+
+    expected_total = 3
+
+    assert users == []
+    assert total == expected_total
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_total_and_cursor(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    for i in range(3):
+        await make_user(username=f'user{i}', email=f'user{i}@example.com')
+
+    config = ListUsersConfig(page=1, page_size=2)
+    first_page, _ = await user_repository.list_users_with_total(config)
+
+    config.cursor = UserCursor(
+        value=first_page[-1].created_at, id=first_page[-1].id
+    )
+    users, total = await user_repository.list_users_with_total(config)
+
+    expected_total = 3
+
+    assert [user.username for user in users] == ['user2']
+    assert total == expected_total
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_query_uses_substring_search(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    await make_user(username='johnny', email='johnny@example.com')
+    await make_user(username='mary', email='mary@contoso.org')
+
+    config = ListUsersConfig(page=1, page_size=10, query='ONTOS')
+    result = await user_repository.list_users(config)
+
+    assert [user.username for user in result] == ['mary']
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_query_ranked_by_relevance(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    await make_user(username='zed', email='anna.smith@example.com')
+    await make_user(username='annaanna', email='annaanna@anna.com')
+
+    config = ListUsersConfig(page=1, page_size=10, query='anna')
+    result = await user_repository.list_users(config)
+
+    assert [user.username for user in result] == ['annaanna', 'zed']
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_short_query(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    await make_user(username='alice', email='alice@example.com')
+    await make_user(username='bob', email='bob@example.com')
+
+    config = ListUsersConfig(page=1, page_size=10, query='li')
+    result = await user_repository.list_users(config)
+
+    assert [user.username for user in result] == ['alice']
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_query_containing_quotes(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    await make_user(username='testuser', email='test@example.com')
+
+    config = ListUsersConfig(page=1, page_size=10, query='"test" OR')
+    result = await user_repository.list_users(config)
+
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_updates_and_deletes(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    user = await make_user(username='before', email='before@example.com')
+    other = await make_user(username='other', email='other@example.com')
+
+    await user_repository.update_user(
+        user.id, {'username': 'after', 'email': 'after@example.com'}
+    )
+    await user_repository.delete_user(other.id)
+
+    before = await user_repository.list_users(
+        ListUsersConfig(page=1, page_size=10, query='before')
+    )
+    after = await user_repository.list_users(
+        ListUsersConfig(page=1, page_size=10, query='after')
+    )
+    deleted = await user_repository.count_users(
+        ListUsersConfig(page=1, page_size=10, query='other')
+    )
+
+    assert before == []
+    assert [u.username for u in after] == ['after']
+    assert deleted == 0
+
+
+@pytest.mark.asyncio
+async def test_list_users_returns_summaries_without_password_hash(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    user = await make_user(username='testuser', email='test@example.com')
+
+    result = await user_repository.list_users(
+        ListUsersConfig(page=1, page_size=10)
+    )
+
+    assert result == [
+        UserSummary(
+            id=user.id,
+            username='testuser',
+            email='test@example.com',
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+    ]
+    assert not hasattr(result[0], 'password_hash')
+
+
+@pytest.mark.asyncio
+async def test_create_users(
+    user_repository: UserRepositoryImplementation,
+):
+    users = [
+        User(
+            username=f'user{i}',
+            email=f'user{i}@example.com',
+            password_hash='hashed_password',
+        )
+        for i in range(3)
+    ]
+
+    created = await user_repository.create_users(users)
+    stored = await user_repository.get_user_by_username('user2')
+
+    assert [user.id for user in created] == [user.id for user in users]
+    assert all(user.updated_at is not None for user in created)
+    assert stored.email == 'user2@example.com'
+
+
+@pytest.mark.asyncio
+async def test_create_users_with_existing_user(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    await make_user(username='user0', email='user0@example.com')
+
+    with pytest.raises(UserAlreadyExistsError):
+        await user_repository.create_users([
+            User(
+                username='user0',
+                email='other@example.com',
+                password_hash='hashed_password',
+            )
+        ])
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_emails_or_usernames(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    await make_user(username='alice', email='alice@example.com')
+    await make_user(username='bob', email='bob@example.com')
+    await make_user(username='carol', email='carol@example.com')
+
+    result = await user_repository.get_users_by_emails_or_usernames(
+        ['alice@example.com', 'nobody@example.com'],
+        ['carol'],
+    )
+
+    assert sorted(user.username for user in result) == ['alice', 'carol']
+
+
+@pytest.mark.asyncio
+async def test_list_user_versions_follows_list_users(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    for i in range(5):
+        await make_user(username=f'user{i}', email=f'user{i}@example.com')
+    config = ListUsersConfig(page=2, page_size=2, order_by='username')
+
+    users, total = await user_repository.list_users_with_total(config)
+    versions, version_total = await user_repository.list_user_versions(config)
+    untotalled = await user_repository.list_user_versions(config, False)
+
+    assert versions == [(user.id, user.updated_at) for user in users]
+    assert version_total == total
+    assert untotalled == (versions, None)
+
+
+@pytest.mark.asyncio
+async def test_stream_users_ignores_the_page(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    for i in range(5):
+        await make_user(username=f'user{i}', email=f'user{i}@example.com')
+
+    config = ListUsersConfig(page=2, page_size=2)
+    result = [user async for user in user_repository.stream_users(config)]
+
+    assert [user.username for user in result] == [f'user{i}' for i in range(5)]
+    assert all(isinstance(user, UserSummary) for user in result)
+
+
+@pytest.mark.asyncio
+async def test_stream_users_with_filters_and_order(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    await make_user(username='auser', email='auser@example.com')
+    await make_user(username='buser', email='buser@example.com')
+    await make_user(username='other', email='other@example.com')
+
+    config = ListUsersConfig(
+        page=1,
+        page_size=1,
+        query='user',
+        order_by='username',
+        order_direction='desc',
+    )
+    result = [user async for user in user_repository.stream_users(config)]
+
+    assert [user.username for user in result] == ['buser', 'auser']
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_fields_selects_only_those_columns(
+    user_repository: UserRepositoryImplementation,
+    make_user,
+):
+    user = await make_user(username='user1', email='user1@example.com')
+
+    config = ListUsersConfig(
+        page=1, page_size=10, order_by='username', fields=('username',)
+    )
+    result = await user_repository.list_users(config)
+    with_total, total = await user_repository.list_users_with_total(config)
+
+    # id and updated_at back the ETag, username also sorts the page.
+    assert result == [
+        UserSummary(
+            id=user.id,
+            username='user1',
+            email=None,
+            created_at=None,
+            updated_at=user.updated_at,
+        )
+    ]
+    assert with_total == result
+    assert total == 1
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
@@ -14,7 +14,7 @@ def mock_user_repository():
 
 @pytest.fixture
 def mock_hash_repository():
-    return Mock()
+    return AsyncMock()
 
 
 @pytest.fixture
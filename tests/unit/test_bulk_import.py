@@ -0,0 +1,164 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.adapters.api.bulk_import import (
+    ImportRecord,
+    csv_records,
+    iter_lines,
+    ndjson_records,
+    run_import,
+    validate_records,
+)
+from src.application.use_cases.create_user import CreateUserResult
+from src.domain.errors.domain_exceptions import UserAlreadyExistsError
+
+ARGON2_HASH = '$argon2id$v=19$m=65536,t=3,p=4$c2FsdHNhbHQ$aGFzaGhhc2g'
+
+
+async def iterate(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def row(name: str, **fields) -> dict:
+    return {
+        'username': name,
+        'email': f'{name}@example.com',
+        'password': 'testpassword',
+        **fields,
+    }
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_joins_lines_split_across_chunks():
+    chunks = iterate([b'first\nsec', b'ond\n', b'third'])
+
+    lines = [line async for line in iter_lines(chunks)]
+
+    assert lines == [(1, b'first'), (2, b'second'), (3, b'third')]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_records():
+    chunks = iterate([b'{"username": "a"}\n\n[1]\n{oops\n'])
+
+    records = [record async for record in ndjson_records(chunks)]
+
+    assert records == [
+        ImportRecord(1, data={'username': 'a'}),
+        ImportRecord(3, error='Expected a JSON object'),
+        ImportRecord(4, error='Invalid JSON'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_csv_records_drop_empty_cells():
+    chunks = iterate([
+        b'username,email,password\r\n',
+        b'a,a@example.com,\r\nb,b@example.com\r\n',
+    ])
+
+    records = [record async for record in csv_records(chunks)]
+
+    assert records == [
+        ImportRecord(2, data={'username': 'a', 'email': 'a@example.com'}),
+        ImportRecord(3, error='Expected 3 fields'),
+    ]
+
+
+def test_validate_records():
+    records = [
+        ImportRecord(1, data=row('first')),
+        ImportRecord(2, data=row('second', email='not-an-email')),
+        ImportRecord(3, error='Invalid JSON'),
+        ImportRecord(4, data=row('fourth', password_hash=ARGON2_HASH)),
+        ImportRecord(5, data=row('fifth', password=None)),
+        ImportRecord(6, data=row('sixth', password=None, password_hash='x')),
+    ]
+
+    valid, errors = validate_records(records)
+
+    assert [(line, item.username) for line, item in valid] == [(1, 'first')]
+    assert sorted(error.line for error in errors) == [2, 3, 4, 5, 6]
+
+
+def test_validate_records_accepts_argon2_hashes():
+    records = [
+        ImportRecord(1, data=row('hashed', password=None)),
+    ]
+    records[0].data['password_hash'] = ARGON2_HASH
+
+    valid, errors = validate_records(records)
+
+    assert errors == []
+    assert valid[0][1].password_hash == ARGON2_HASH
+
+
+@pytest.mark.asyncio
+async def test_run_import_batches_rows():
+    create_user = AsyncMock()
+    create_user.execute_many.side_effect = lambda requests: [
+        CreateUserResult(index=i) for i in range(len(requests))
+    ]
+    count, batch_size = 5, 2
+    records = iterate([
+        ImportRecord(i, data=row(f'user{i}')) for i in range(count)
+    ])
+
+    summary = await run_import(records, create_user, batch_size, count)
+
+    assert summary.created == count
+    assert summary.failed == 0
+    assert [
+        len(call.args[0]) for call in create_user.execute_many.call_args_list
+    ] == [batch_size, batch_size, 1]
+
+
+@pytest.mark.asyncio
+async def test_run_import_reports_conflicts_and_caps_errors():
+    create_user = AsyncMock()
+    create_user.execute_many.side_effect = [
+        [CreateUserResult(index=0, error='taken'), CreateUserResult(index=1)],
+        UserAlreadyExistsError('raced'),
+    ]
+    records = iterate([
+        ImportRecord(1, data=row('first')),
+        ImportRecord(2, data=row('second')),
+        ImportRecord(3, data=row('third')),
+        ImportRecord(4, error='Invalid JSON'),
+    ])
+    max_reported_errors = 2
+
+    summary = await run_import(records, create_user, 2, max_reported_errors)
+
+    assert summary.created == 1
+    assert summary.failed == len(['first', 'third', 'invalid'])
+    assert [(error.line, error.detail) for error in summary.errors] == [
+        (1, 'taken'),
+        (3, 'raced'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_import_stops_at_an_unexpected_error():
+    create_user = AsyncMock()
+    create_user.execute_many.side_effect = [
+        [CreateUserResult(index=0), CreateUserResult(index=1)],
+        ConnectionError('database is gone'),
+    ]
+    records = iterate([
+        ImportRecord(i, data=row(f'user{i}')) for i in range(1, 6)
+    ])
+
+    summary = await run_import(records, create_user, 2, 10)
+
+    assert summary.created == len(['user1', 'user2'])
+    assert summary.failed == len(['user3', 'user4'])
+    assert [(error.line, error.detail) for error in summary.errors] == [
+        (3, 'Not imported: database is gone'),
+        (4, 'Not imported: database is gone'),
+    ]
+    assert summary.aborted == 'Import stopped at line 3: database is gone'
+    # The chunk holding line 5 is never read.
+    assert create_user.execute_many.await_count == len(['first', 'second'])
@@ -0,0 +1,282 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.repositories.caching_user_repository import (
+    MISSING,
+    CachingUserRepository,
+    UserCache,
+    user_keys,
+)
+from src.domain.entities.user import User
+from src.domain.errors.domain_exceptions import UserNotFoundError
+from src.domain.ports.invalidation_bus import UserInvalidation
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def user_cache(clock) -> UserCache:
+    return UserCache(max_size=100, ttl=30, negative_ttl=5, clock=clock)
+
+
+@pytest.fixture
+def caching_repository(mock_user_repository, user_cache):
+    return CachingUserRepository(mock_user_repository, user_cache)
+
+
+@pytest.mark.asyncio
+async def test_hit_does_not_reach_the_wrapped_repository(
+    caching_repository,
+    mock_user_repository,
+    create_mock_user,
+):
+    mock_user_repository.get_user_by_id.return_value = create_mock_user
+
+    first = await caching_repository.get_user_by_id(create_mock_user.id)
+    second = await caching_repository.get_user_by_id(create_mock_user.id)
+
+    assert first == second == create_mock_user
+    mock_user_repository.get_user_by_id.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_user_is_cached_under_id_email_and_username(
+    caching_repository,
+    mock_user_repository,
+    create_mock_user,
+):
+    mock_user_repository.get_user_by_email.return_value = create_mock_user
+
+    await caching_repository.get_user_by_email(create_mock_user.email)
+
+    assert (
+        await caching_repository.get_user_by_id(create_mock_user.id)
+        == create_mock_user
+    )
+    assert (
+        await caching_repository.get_user_by_username(
+            create_mock_user.username
+        )
+        == create_mock_user
+    )
+    mock_user_repository.get_user_by_id.assert_not_called()
+    mock_user_repository.get_user_by_username.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_misses_are_cached_with_the_negative_ttl(
+    caching_repository,
+    mock_user_repository,
+    clock,
+):
+    mock_user_repository.get_user_by_username.return_value = None
+
+    assert await caching_repository.get_user_by_username('ghost') is None
+    assert await caching_repository.get_user_by_username('ghost') is None
+    mock_user_repository.get_user_by_username.assert_called_once()
+
+    mock_user_repository.get_user_by_username.reset_mock()
+    clock.now += 5
+
+    assert await caching_repository.get_user_by_username('ghost') is None
+    mock_user_repository.get_user_by_username.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_the_ttl(
+    caching_repository,
+    mock_user_repository,
+    create_mock_user,
+    clock,
+):
+    mock_user_repository.get_user_by_id.return_value = create_mock_user
+
+    await caching_repository.get_user_by_id(create_mock_user.id)
+    mock_user_repository.get_user_by_id.reset_mock()
+    clock.now += 30
+    await caching_repository.get_user_by_id(create_mock_user.id)
+
+    mock_user_repository.get_user_by_id.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_user_drops_cached_misses(
+    caching_repository,
+    mock_user_repository,
+    create_mock_user,
+):
+    mock_user_repository.get_user_by_email.return_value = None
+    await caching_repository.get_user_by_email(create_mock_user.email)
+
+    mock_user_repository.create_user.return_value = create_mock_user
+    await caching_repository.create_user(create_mock_user)
+
+    mock_user_repository.get_user_by_email.return_value = create_mock_user
+    assert (
+        await caching_repository.get_user_by_email(create_mock_user.email)
+        == create_mock_user
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_user_invalidates_old_and_new_keys(
+    caching_repository,
+    mock_user_repository,
+    create_mock_user,
+):
+    mock_user_repository.get_user_by_id.return_value = create_mock_user
+    mock_user_repository.get_user_by_email.return_value = None
+    await caching_repository.get_user_by_id(create_mock_user.id)
+    await caching_repository.get_user_by_email('new@example.com')
+
+    updated = create_mock_user.model_copy(update={'email': 'new@example.com'})
+    mock_user_repository.update_user.return_value = updated
+    await caching_repository.update_user(
+        create_mock_user.id, {'email': 'new@example.com'}
+    )
+
+    mock_user_repository.get_user_by_email.side_effect = lambda email: (
+        updated if email == 'new@example.com' else None
+    )
+    assert (
+        await caching_repository.get_user_by_email(create_mock_user.email)
+        is None
+    )
+    assert (
+        await caching_repository.get_user_by_email('new@example.com')
+        == updated
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_users_publishes_one_invalidation(
+    mock_user_repository,
+    user_cache,
+    create_mock_user,
+):
+    bus = AsyncMock()
+    repository = CachingUserRepository(mock_user_repository, user_cache, bus)
+    users = [
+        create_mock_user,
+        create_mock_user.model_copy(
+            update={
+                'id': uuid4(),
+                'username': 'other',
+                'email': 'other@example.com',
+            }
+        ),
+    ]
+    mock_user_repository.create_users.return_value = users
+
+    await repository.create_users(users)
+
+    bus.publish.assert_awaited_once_with(
+        UserInvalidation(
+            user_ids=tuple(user.id for user in users),
+            keys=tuple(key for user in users for key in user_keys(user)),
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_user_invalidates_even_when_not_found(
+    caching_repository,
+    mock_user_repository,
+    create_mock_user,
+):
+    mock_user_repository.get_user_by_id.return_value = create_mock_user
+    await caching_repository.get_user_by_id(create_mock_user.id)
+
+    mock_user_repository.delete_user.side_effect = UserNotFoundError()
+    with pytest.raises(UserNotFoundError):
+        await caching_repository.delete_user(create_mock_user.id)
+
+    mock_user_repository.get_user_by_id.return_value = None
+    assert await caching_repository.get_user_by_id(create_mock_user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_read_racing_a_write_is_not_cached(
+    caching_repository,
+    mock_user_repository,
+    user_cache,
+    create_mock_user,
+):
+    async def load_then_write(user_id):
+        # A write lands while the read is waiting on the database.
+        user_cache.invalidate([user_id])
+        return create_mock_user
+
+    mock_user_repository.get_user_by_id.side_effect = load_then_write
+
+    await caching_repository.get_user_by_id(create_mock_user.id)
+
+    assert len(user_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids_only_loads_uncached_ids(
+    caching_repository,
+    mock_user_repository,
+    create_mock_user,
+):
+    other = User(
+        username='otheruser',
+        email='other@example.com',
+        password_hash='hashed_password',
+    )
+    unknown_id = uuid4()
+    mock_user_repository.get_user_by_id.return_value = create_mock_user
+    await caching_repository.get_user_by_id(create_mock_user.id)
+
+    mock_user_repository.get_users_by_ids.return_value = [other]
+    users = await caching_repository.get_users_by_ids([
+        create_mock_user.id,
+        other.id,
+        unknown_id,
+    ])
+
+    assert users == [create_mock_user, other]
+    mock_user_repository.get_users_by_ids.assert_called_once_with([
+        other.id,
+        unknown_id,
+    ])
+
+    mock_user_repository.get_users_by_ids.reset_mock()
+    await caching_repository.get_users_by_ids([other.id, unknown_id])
+    mock_user_repository.get_users_by_ids.assert_not_called()
+
+
+def test_least_recently_used_entries_are_evicted(clock):
+    # Room for exactly one user under its three keys.
+    cache = UserCache(max_size=3, clock=clock)
+    first = User(username='first', email='a@example.com', password_hash='h')
+    second = User(username='second', email='b@example.com', password_hash='h')
+
+    cache.put(('id', first.id), first, cache.version)
+    cache.put(('id', second.id), second, cache.version)
+
+    assert len(cache) == cache.max_size
+    assert cache.get(('id', second.id)) == second
+    assert cache.get(('id', first.id)) is MISSING
+
+
+def test_zero_size_disables_the_cache(clock, create_mock_user):
+    cache = UserCache(max_size=0, clock=clock)
+
+    cache.put(('id', create_mock_user.id), create_mock_user, cache.version)
+
+    assert len(cache) == 0
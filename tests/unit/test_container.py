@@ -0,0 +1,108 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.adapters.auth.executor_password_hasher import ExecutorPasswordHasher
+from src.adapters.auth.jwt_auth_service import JWTAuthenticationService
+from src.adapters.auth.token_cache import VerifiedTokenCache
+from src.adapters.cache.null_invalidation_bus import NullInvalidationBus
+from src.adapters.cache.redis_invalidation_bus import RedisInvalidationBus
+from src.adapters.cache.unix_socket_invalidation_bus import (
+    UnixSocketInvalidationBus,
+)
+from src.adapters.repositories.caching_user_repository import (
+    CachingUserRepository,
+    UserCache,
+)
+from src.adapters.repositories.user_loader import UserLoader
+from src.adapters.repositories.user_repository_implementation import (
+    UserRepositoryImplementation,
+)
+from src.factories.authenticate_user_factory import authenticate_user_factory
+from src.factories.container import (
+    Container,
+    create_container,
+    create_invalidation_bus,
+)
+from src.factories.create_user_factory import create_user_factory
+from src.infrastructure.config.settings import settings
+
+
+@pytest.fixture
+def container() -> Container:
+    return Container(
+        hash_executor=MagicMock(),
+        hash_service=MagicMock(),
+        auth_service=MagicMock(),
+        token_cache=VerifiedTokenCache(),
+        user_cache=UserCache(),
+        user_loader=MagicMock(),
+        invalidation_bus=AsyncMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_container_builds_shared_services():
+    container = create_container()
+
+    try:
+        assert isinstance(container.hash_service, ExecutorPasswordHasher)
+        assert container.hash_service.executor is container.hash_executor
+        assert isinstance(container.auth_service, JWTAuthenticationService)
+        assert container.auth_service.token_cache is container.token_cache
+        assert isinstance(container.user_loader, UserLoader)
+    finally:
+        await container.close()
+
+
+@pytest.mark.asyncio
+async def test_start_subscribes_the_cache_to_the_bus(container):
+    await container.start()
+
+    container.invalidation_bus.start.assert_awaited_once_with(
+        container.user_cache.apply
+    )
+
+
+@pytest.mark.asyncio
+async def test_close_stops_the_bus_and_the_hash_executor(container):
+    await container.close()
+
+    container.invalidation_bus.close.assert_awaited_once()
+    container.hash_executor.shutdown.assert_called_once_with()
+
+
+def test_factories_reuse_container_services(container):
+    session = MagicMock()
+
+    first = authenticate_user_factory(session, container)
+    second = authenticate_user_factory(session, container)
+    create_user = create_user_factory(session, container)
+
+    assert first.hash_service is second.hash_service is container.hash_service
+    assert first.auth_service is container.auth_service
+    assert create_user.hash_repository is container.hash_service
+    assert first.user_repository is not second.user_repository
+
+
+def test_user_repository_reads_through_the_shared_cache(container):
+    repository = container.user_repository(MagicMock())
+
+    assert isinstance(repository, CachingUserRepository)
+    assert isinstance(repository.repository, UserRepositoryImplementation)
+    assert repository.cache is container.user_cache
+    assert repository.bus is container.invalidation_bus
+
+
+@pytest.mark.parametrize(
+    ('kind', 'bus_class'),
+    [
+        ('unix', UnixSocketInvalidationBus),
+        ('redis', RedisInvalidationBus),
+        ('none', NullInvalidationBus),
+    ],
+)
+def test_create_invalidation_bus(kind, bus_class, monkeypatch):
+    monkeypatch.setattr(settings, 'CACHE_INVALIDATION_REDIS_URL', 'memory://')
+
+    assert isinstance(create_invalidation_bus(kind), bus_class)
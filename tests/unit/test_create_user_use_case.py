@@ -1,10 +1,13 @@
 from datetime import datetime
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
-from src.application.use_cases.create_user import CreateUserUseCase
+from src.application.use_cases.create_user import (
+    CreateUserRequest,
+    CreateUserUseCase,
+)
 from src.domain.entities.user import User
 from src.domain.errors.domain_exceptions import UserAlreadyExistsError
 
@@ -12,7 +15,7 @@ from src.domain.errors.domain_exceptions import UserAlreadyExistsError
 @pytest.fixture
 def create_user_use_case(
     mock_user_repository: AsyncMock,
-    mock_hash_repository: Mock,
+    mock_hash_repository: AsyncMock,
 ) -> CreateUserUseCase:
     return CreateUserUseCase(
         user_repository=mock_user_repository,
@@ -26,8 +29,6 @@ async def test_create_user_success(
     mock_user_repository,
     mock_hash_repository,
 ):
-    mock_user_repository.get_user_by_email.return_value = None
-    mock_user_repository.get_user_by_username.return_value = None
     mock_hash_repository.hash_password.return_value = 'hashed_password'
 
     mock_user_repository.create_user.return_value = User(
@@ -49,6 +50,8 @@ async def test_create_user_success(
     assert user.password_hash == 'hashed_password'
     mock_hash_repository.hash_password.assert_called_once_with('password')
     mock_user_repository.create_user.assert_called_once()
+    mock_user_repository.get_user_by_email.assert_not_called()
+    mock_user_repository.get_user_by_username.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -57,8 +60,6 @@ async def test_create_user_password_being_hashed(
     mock_user_repository,
     mock_hash_repository,
 ):
-    mock_user_repository.get_user_by_email.return_value = None
-    mock_user_repository.get_user_by_username.return_value = None
     mock_hash_repository.hash_password.return_value = 'hashed_password'
 
     mock_user_repository.create_user.return_value = User(
@@ -84,10 +85,13 @@ async def test_create_user_password_being_hashed(
 async def test_create_user_duplicate_email(
     create_user_use_case,
     mock_user_repository,
-    create_mock_user,
+    mock_hash_repository,
 ):
     # Arrange
-    mock_user_repository.get_user_by_email.return_value = create_mock_user
+    mock_hash_repository.hash_password.return_value = 'hashed_password'
+    mock_user_repository.create_user.side_effect = UserAlreadyExistsError(
+        'User with email test@example.com already exists'
+    )
 
     with pytest.raises(UserAlreadyExistsError) as exc:
         await create_user_use_case.execute(
@@ -104,11 +108,13 @@ async def test_create_user_duplicate_email(
 async def test_create_user_duplicate_username(
     create_user_use_case,
     mock_user_repository,
-    create_mock_user,
+    mock_hash_repository,
 ):
     # Arrange
-    mock_user_repository.get_user_by_email.return_value = None
-    mock_user_repository.get_user_by_username.return_value = create_mock_user
+    mock_hash_repository.hash_password.return_value = 'hashed_password'
+    mock_user_repository.create_user.side_effect = UserAlreadyExistsError(
+        'User with username testuser already exists'
+    )
 
     with pytest.raises(UserAlreadyExistsError) as exc:
         await create_user_use_case.execute(
@@ -117,3 +123,84 @@ async def test_create_user_duplicate_username(
             password='password',
         )
     assert str(exc.value) == ('User with username testuser already exists')
+
+
+@pytest.mark.asyncio
+async def test_create_users_batch(
+    create_user_use_case,
+    mock_user_repository,
+    mock_hash_repository,
+):
+    mock_user_repository.get_users_by_emails_or_usernames.return_value = []
+    mock_hash_repository.hash_passwords.return_value = ['hash1', 'hash2']
+    mock_user_repository.create_users.side_effect = lambda users: users
+
+    results = await create_user_use_case.execute_many([
+        CreateUserRequest('user1', 'user1@example.com', 'password1'),
+        CreateUserRequest('user2', 'user2@example.com', 'password2'),
+    ])
+
+    assert [result.user.username for result in results] == ['user1', 'user2']
+    assert [result.user.password_hash for result in results] == [
+        'hash1',
+        'hash2',
+    ]
+    assert all(result.error is None for result in results)
+    mock_user_repository.get_users_by_emails_or_usernames.assert_called_once_with(
+        ['user1@example.com', 'user2@example.com'],
+        ['user1', 'user2'],
+    )
+    mock_hash_repository.hash_passwords.assert_called_once_with([
+        'password1',
+        'password2',
+    ])
+    mock_user_repository.create_users.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_users_batch_reports_conflicts(
+    create_user_use_case,
+    mock_user_repository,
+    mock_hash_repository,
+    create_mock_user,
+):
+    mock_user_repository.get_users_by_emails_or_usernames.return_value = [
+        create_mock_user
+    ]
+    mock_hash_repository.hash_passwords.return_value = ['hash']
+    mock_user_repository.create_users.side_effect = lambda users: users
+
+    results = await create_user_use_case.execute_many([
+        CreateUserRequest('testuser', 'new@example.com', 'password'),
+        CreateUserRequest('newuser', 'new@example.com', 'password'),
+        CreateUserRequest('newuser', 'other@example.com', 'password'),
+    ])
+
+    assert results[0].user is None
+    assert results[0].error == 'User with username testuser already exists'
+    assert results[1].user.username == 'newuser'
+    assert results[2].user is None
+    assert results[2].error == 'User with username newuser already exists'
+    mock_hash_repository.hash_passwords.assert_called_once_with(['password'])
+
+
+@pytest.mark.asyncio
+async def test_create_users_batch_keeps_given_password_hashes(
+    create_user_use_case,
+    mock_user_repository,
+    mock_hash_repository,
+):
+    mock_user_repository.get_users_by_emails_or_usernames.return_value = []
+    mock_hash_repository.hash_passwords.return_value = ['hash2']
+    mock_user_repository.create_users.side_effect = lambda users: users
+
+    results = await create_user_use_case.execute_many([
+        CreateUserRequest('user1', 'user1@example.com', None, 'given-hash'),
+        CreateUserRequest('user2', 'user2@example.com', 'password2'),
+    ])
+
+    assert [result.user.password_hash for result in results] == [
+        'given-hash',
+        'hash2',
+    ]
+    mock_hash_repository.hash_passwords.assert_called_once_with(['password2'])
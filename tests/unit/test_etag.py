@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.api.etag import (
+    ConditionalGet,
+    collection_etag,
+    etag_matches,
+    user_etag,
+)
+from src.application.use_cases.list_users import ListUsersRequest
+from src.domain.entities.user import User, UserSummary, UserVersion
+
+
+@pytest.fixture
+def summary() -> UserSummary:
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    return UserSummary(uuid4(), 'testuser', 'test@example.com', now, now)
+
+
+def test_user_etag_changes_with_updated_at():
+    user = User(
+        username='testuser',
+        email='test@example.com',
+        password_hash='hashed_password',
+        updated_at=datetime(2025, 1, 1, 12, 0, 0),
+    )
+    updated = user.model_copy(
+        update={'updated_at': user.updated_at + timedelta(microseconds=1)}
+    )
+
+    assert user_etag(user) == user_etag(user.model_copy())
+    assert user_etag(user) != user_etag(updated)
+    assert user_etag(user).startswith('"')
+    assert user_etag(user).endswith('"')
+
+
+def test_user_etag_depends_on_fields():
+    user = User(
+        username='testuser',
+        email='test@example.com',
+        password_hash='hashed_password',
+    )
+
+    sparse = user_etag(user, ['id', 'username'])
+
+    assert sparse != user_etag(user)
+    assert sparse != user_etag(user, ['id'])
+    assert etag_matches(sparse, sparse)
+
+
+def test_collection_etag_is_the_same_from_versions_and_summaries(summary):
+    request = ListUsersRequest(page=1, page_size=10)
+    version = UserVersion(summary.id, summary.updated_at)
+
+    assert collection_etag(request, [summary], 1) == collection_etag(
+        request, [version], 1
+    )
+
+
+def test_collection_etag_depends_on_request_total_and_versions(summary):
+    request = ListUsersRequest(page=1, page_size=10)
+    etag = collection_etag(request, [summary], 1)
+    touched = summary._replace(
+        updated_at=summary.updated_at + timedelta(seconds=1)
+    )
+
+    assert etag != collection_etag(ListUsersRequest(2, 10), [summary], 1)
+    assert etag != collection_etag(request, [summary], 2)
+    assert etag != collection_etag(request, [touched], 1)
+    assert etag != collection_etag(request, [], 1)
+
+
+@pytest.mark.parametrize(
+    ('if_none_match', 'expected'),
+    [
+        (None, False),
+        ('', False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", "abc"', True),
+        ('*', True),
+        ('"other"', False),
+    ],
+)
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, '"abc"') is expected
+
+
+def test_conditional_get_builds_not_modified():
+    conditional = ConditionalGet(if_none_match='"abc"')
+
+    not_modified = conditional.not_modified('"abc"')
+
+    assert conditional.matches('"abc"')
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert not_modified.headers['ETag'] == '"abc"'
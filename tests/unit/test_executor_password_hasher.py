@@ -0,0 +1,126 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+import pytest
+from typing_extensions import override
+
+from src.adapters.auth.executor_password_hasher import (
+    ExecutorPasswordHasher,
+    HashExecutor,
+    create_hash_executor,
+)
+from src.infrastructure.metrics import password_hash_duration
+
+
+@pytest.fixture
+def thread_hasher():
+    executor = HashExecutor(create_hash_executor('thread', max_workers=2))
+    yield ExecutorPasswordHasher(executor)
+    executor.shutdown()
+
+
+@pytest.fixture
+def process_hasher():
+    executor = HashExecutor(create_hash_executor('process', max_workers=1))
+    yield ExecutorPasswordHasher(executor)
+    executor.shutdown()
+
+
+def test_create_hash_executor_thread():
+    executor = create_hash_executor('thread')
+
+    assert isinstance(executor, ThreadPoolExecutor)
+    executor.shutdown()
+
+
+def test_create_hash_executor_process_does_not_fork():
+    with patch(
+        'src.adapters.auth.executor_password_hasher.ProcessPoolExecutor'
+    ) as pool:
+        create_hash_executor('process', max_workers=1)
+
+    context = pool.call_args.kwargs['mp_context']
+    assert context.get_start_method() in {'forkserver', 'spawn'}
+
+
+@pytest.mark.asyncio
+async def test_executor_password_hasher_hash_and_verify(thread_hasher):
+    password = 'test_password'
+    hashed_password = await thread_hasher.hash_password(password)
+
+    assert hashed_password != password
+    assert await thread_hasher.verify_password(password, hashed_password)
+    assert not await thread_hasher.verify_password('wrong', hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_executor_password_hasher_process_pool(process_hasher):
+    password = 'test_password'
+    hashed_password = await process_hasher.hash_password(password)
+
+    assert await process_hasher.verify_password(password, hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_executor_password_hasher_hash_passwords(thread_hasher):
+    passwords = ['first_password', 'second_password']
+    hashed_passwords = await thread_hasher.hash_passwords(passwords)
+
+    assert len(hashed_passwords) == len(passwords)
+    for password, hashed_password in zip(passwords, hashed_passwords):
+        assert await thread_hasher.verify_password(password, hashed_password)
+
+
+class BrokenPool(ThreadPoolExecutor):
+    """A process pool whose workers died: every submit fails."""
+
+    shut_down = False
+
+    @override
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool
+
+    @override
+    def shutdown(self, *args, **kwargs):
+        self.shut_down = True
+        super().shutdown(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_is_replaced_once_by_threads():
+    broken = BrokenPool(max_workers=1)
+    executor = HashExecutor(broken)
+    hasher = ExecutorPasswordHasher(executor)
+
+    try:
+        hashed_passwords = await hasher.hash_passwords(['first', 'second'])
+        replacement = executor.current
+
+        assert await hasher.verify_password('first', hashed_passwords[0])
+        assert isinstance(replacement, ThreadPoolExecutor)
+        assert replacement is not broken
+        # Later failures of the old pool keep the first replacement.
+        assert executor.replace_broken(broken) is replacement
+        assert broken.shut_down
+    finally:
+        executor.shutdown()
+
+
+def hash_timings(operation: str) -> int:
+    series = f'password_hash_duration_seconds_count{{operation="{operation}"}}'
+    for line in password_hash_duration.render():
+        if line.startswith(series + ' '):
+            return int(line.rpartition(' ')[2])
+    return 0
+
+
+@pytest.mark.asyncio
+async def test_executor_password_hasher_records_timings(process_hasher):
+    hashes, verifies = hash_timings('hash'), hash_timings('verify')
+
+    hashed_password = await process_hasher.hash_password('test_password')
+    await process_hasher.verify_password('test_password', hashed_password)
+
+    assert hash_timings('hash') == hashes + 1
+    assert hash_timings('verify') == verifies + 1
@@ -0,0 +1,96 @@
+import csv
+import io
+import json
+import math
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.api import export
+from src.adapters.api.export import (
+    EXPORT_FORMATS,
+    csv_chunks,
+    export_body,
+    ndjson_chunks,
+)
+from src.domain.entities.user import UserSummary
+
+CHUNK_ROWS = 2
+
+
+def make_summaries(count: int) -> list[UserSummary]:
+    return [
+        UserSummary(
+            id=uuid4(),
+            username=f'user{i}',
+            email=f'user{i}@example.com',
+            created_at=datetime(2024, 1, 1),
+            updated_at=None,
+        )
+        for i in range(count)
+    ]
+
+
+async def iterate(users):
+    for user in users:
+        yield user
+
+
+@pytest.mark.asyncio
+async def test_ndjson_chunks():
+    users = make_summaries(3)
+
+    with patch.object(export, 'EXPORT_CHUNK_ROWS', CHUNK_ROWS):
+        chunks = [chunk async for chunk in ndjson_chunks(iterate(users))]
+
+    assert [chunk.count('\n') for chunk in chunks] == [CHUNK_ROWS, 1]
+
+    records = [json.loads(line) for line in ''.join(chunks).splitlines()]
+    assert records[0] == {
+        'id': str(users[0].id),
+        'username': 'user0',
+        'email': 'user0@example.com',
+        'created_at': '2024-01-01T00:00:00',
+        'updated_at': None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_ndjson_chunks_without_users():
+    assert [chunk async for chunk in ndjson_chunks(iterate([]))] == []
+
+
+@pytest.mark.asyncio
+async def test_csv_chunks():
+    users = make_summaries(3)
+
+    with patch.object(export, 'EXPORT_CHUNK_ROWS', CHUNK_ROWS):
+        chunks = [chunk async for chunk in csv_chunks(iterate(users))]
+
+    rows = list(csv.DictReader(io.StringIO(''.join(chunks))))
+
+    assert len(chunks) == math.ceil(len(users) / CHUNK_ROWS)
+    assert [row['username'] for row in rows] == ['user0', 'user1', 'user2']
+    assert not rows[0]['updated_at']
+
+
+@pytest.mark.asyncio
+async def test_csv_chunks_without_users_has_a_header():
+    chunks = [chunk async for chunk in csv_chunks(iterate([]))]
+
+    assert chunks == [','.join(UserSummary._fields) + '\r\n']
+
+
+@pytest.mark.asyncio
+async def test_export_body_closes_when_the_client_goes_away():
+    close = AsyncMock()
+    body = export_body(
+        iterate(make_summaries(1)), EXPORT_FORMATS['csv'], close
+    )
+
+    await anext(body)
+    await body.aclose()
+
+    close.assert_awaited_once()
@@ -0,0 +1,35 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from src.adapters.api.fields import get_fields, sparse_user, split_fields
+from src.domain.entities.user import UserSummary
+
+
+def test_split_fields():
+    assert split_fields(None) is None
+    assert split_fields(' , ') is None
+    assert split_fields('username, id,username') == ['username', 'id']
+
+
+def test_get_fields_rejects_unknown_fields():
+    with pytest.raises(HTTPException):
+        get_fields('id,password_hash')
+
+
+def test_sparse_user():
+    user = UserSummary(
+        id=uuid4(),
+        username='testuser',
+        email='test@example.com',
+        created_at=datetime(2025, 1, 1),
+        updated_at=None,
+    )
+
+    assert sparse_user(user, ['id', 'created_at', 'updated_at']) == {
+        'id': str(user.id),
+        'created_at': '2025-01-01T00:00:00',
+        'updated_at': None,
+    }
@@ -55,3 +55,36 @@ async def test_get_user_not_found(
         await get_user_use_case.execute(user_id=user_id)
 
     mock_user_repository.get_user_by_id.assert_called_once_with(user_id)
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids_keeps_request_order(
+    get_user_use_case,
+    mock_user_repository,
+):
+    first = User(
+        username='first',
+        email='first@example.com',
+        password_hash='hashed_password',
+    )
+    second = User(
+        username='second',
+        email='second@example.com',
+        password_hash='hashed_password',
+    )
+    missing_id = uuid4()
+    mock_user_repository.get_users_by_ids.return_value = [first, second]
+
+    users = await get_user_use_case.execute_many([
+        second.id,
+        missing_id,
+        first.id,
+        second.id,
+    ])
+
+    assert users == [second, first]
+    mock_user_repository.get_users_by_ids.assert_called_once_with([
+        second.id,
+        missing_id,
+        first.id,
+    ])
@@ -0,0 +1,196 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.cache.redis_invalidation_bus import (
+    InMemoryRedis,
+    RedisInvalidationBus,
+)
+from src.adapters.cache.unix_socket_invalidation_bus import (
+    MAX_DATAGRAM_BYTES,
+    UnixSocketInvalidationBus,
+)
+from src.adapters.repositories.caching_user_repository import (
+    CachingUserRepository,
+    UserCache,
+)
+from src.domain.ports.invalidation_bus import UserInvalidation
+
+
+async def wait_for(predicate, timeout: float = 1.0) -> None:
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_invalidation_round_trips_through_json():
+    user_id = uuid4()
+    invalidation = UserInvalidation(
+        user_ids=(user_id,),
+        keys=(('id', user_id), ('email', 'test@example.com')),
+        origin='worker-1',
+    )
+
+    assert UserInvalidation.loads(invalidation.dumps()) == invalidation
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_bus_delivers_to_other_processes_only(tmp_path):
+    first = UnixSocketInvalidationBus(tmp_path)
+    second = UnixSocketInvalidationBus(tmp_path)
+    received = {'first': [], 'second': []}
+    await first.start(received['first'].append)
+    await second.start(received['second'].append)
+
+    invalidation = UserInvalidation(user_ids=(uuid4(),))
+    await first.publish(invalidation)
+    await wait_for(lambda: received['second'])
+
+    assert received == {'first': [], 'second': [invalidation]}
+
+    await first.close()
+    await second.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_bus_removes_stale_sockets(tmp_path):
+    bus = UnixSocketInvalidationBus(tmp_path)
+    await bus.start(lambda invalidation: None)
+    stale = tmp_path / 'dead-worker.sock'
+    stale.touch()
+
+    await bus.publish(UserInvalidation(user_ids=(uuid4(),)))
+
+    assert not stale.exists()
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_bus_splits_large_invalidations(tmp_path):
+    first = UnixSocketInvalidationBus(tmp_path)
+    second = UnixSocketInvalidationBus(tmp_path)
+    received = []
+    await first.start(lambda invalidation: None)
+    await second.start(received.append)
+
+    user_ids = tuple(uuid4() for _ in range(3000))
+    invalidation = UserInvalidation(
+        user_ids=user_ids, keys=tuple(('id', user_id) for user_id in user_ids)
+    )
+    assert len(invalidation.dumps()) > MAX_DATAGRAM_BYTES
+
+    await first.publish(invalidation)
+    await wait_for(
+        lambda: sum(len(part.user_ids) for part in received) == len(user_ids)
+    )
+
+    assert len(received) > 1
+    assert [key for part in received for key in part.keys] == list(
+        invalidation.keys
+    )
+
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_bus_retries_a_full_peer(tmp_path):
+    first = UnixSocketInvalidationBus(tmp_path)
+    second = UnixSocketInvalidationBus(tmp_path)
+    received = []
+    await first.start(lambda invalidation: None)
+    await second.start(received.append)
+
+    class FullOnce:
+        def __init__(self, sender):
+            self.sender = sender
+            self.attempts = []
+
+        def sendto(self, data, address):
+            self.attempts.append(address)
+            if len(self.attempts) == 1:
+                raise BlockingIOError
+            return self.sender.sendto(data, address)
+
+    sender = FullOnce(first._sender)
+    first._sender = sender
+    invalidation = UserInvalidation(user_ids=(uuid4(),))
+    await first.publish(invalidation)
+    await wait_for(lambda: received)
+
+    assert received == [invalidation]
+    assert sender.attempts == [str(second.path)] * 2
+
+    first._sender = sender.sender
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_bus_lists_peers_again_when_one_starts(tmp_path):
+    first = UnixSocketInvalidationBus(tmp_path)
+    await first.start(lambda invalidation: None)
+    assert first.peers() == []
+
+    second = UnixSocketInvalidationBus(tmp_path)
+    received = []
+    await second.start(received.append)
+
+    invalidation = UserInvalidation(user_ids=(uuid4(),))
+    await first.publish(invalidation)
+    await wait_for(lambda: received)
+
+    assert first.peers() == [second.path]
+    assert received == [invalidation]
+
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_bus_skips_its_own_messages():
+    client = InMemoryRedis()
+    first = RedisInvalidationBus(client, 'users')
+    second = RedisInvalidationBus(client, 'users')
+    received = {'first': [], 'second': []}
+    await first.start(received['first'].append)
+    await second.start(received['second'].append)
+
+    user_id = uuid4()
+    await first.publish(UserInvalidation(user_ids=(user_id,)))
+    await wait_for(lambda: received['second'])
+
+    assert received['first'] == []
+    assert received['second'][0].user_ids == (user_id,)
+
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_write_in_one_worker_invalidates_the_others(
+    mock_user_repository,
+    create_mock_user,
+):
+    client = InMemoryRedis()
+    workers = []
+    for _ in range(2):
+        cache = UserCache()
+        bus = RedisInvalidationBus(client, 'users')
+        await bus.start(cache.apply)
+        workers.append(CachingUserRepository(mock_user_repository, cache, bus))
+    writer, reader = workers
+
+    mock_user_repository.get_user_by_id.return_value = create_mock_user
+    await reader.get_user_by_id(create_mock_user.id)
+    assert len(reader.cache) > 0
+
+    await writer.delete_user(create_mock_user.id)
+    await wait_for(lambda: len(reader.cache) == 0)
+
+    for worker in workers:
+        await worker.bus.close()
@@ -5,6 +5,7 @@ import pytest
 from jose import jwt
 
 from src.adapters.auth.jwt_auth_service import JWTAuthenticationService
+from src.adapters.auth.token_cache import VerifiedTokenCache
 
 
 @pytest.fixture
@@ -93,3 +94,47 @@ async def test_validate_token_wrong_secret(mock_settings):
         result = await service.validate_token(token)
 
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_decode_token_returns_claims(mock_settings):
+    service = JWTAuthenticationService()
+
+    token = await service.authenticate('test@example.com', 'password123')
+
+    payload = service.decode_token(token)
+
+    assert payload['sub'] == 'test@example.com'
+    assert isinstance(payload['exp'], int)
+
+
+def test_decode_token_invalid_token(mock_settings):
+    service = JWTAuthenticationService()
+
+    assert service.decode_token('invalid_token') is None
+
+
+@pytest.mark.asyncio
+async def test_validate_token_verifies_each_token_once(mock_settings):
+    cache = VerifiedTokenCache()
+    service = JWTAuthenticationService(cache)
+    token = await service.authenticate('test@example.com', 'password')
+
+    with patch.object(
+        service, 'decode_token', wraps=service.decode_token
+    ) as decode_token:
+        first = await service.validate_token(token)
+        second = await service.validate_token(token)
+
+    assert first == second == 'test@example.com'
+    decode_token.assert_called_once()
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+
+@pytest.mark.asyncio
+async def test_validate_token_does_not_cache_invalid_tokens(mock_settings):
+    cache = VerifiedTokenCache()
+    service = JWTAuthenticationService(cache)
+
+    assert await service.validate_token('invalid_token') is None
+    assert len(cache) == 0
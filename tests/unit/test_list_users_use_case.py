@@ -1,22 +1,25 @@
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
 
 from src.application.use_cases.list_users import (
+    ExportUsersRequest,
     ListUsersRequest,
     ListUsersUseCase,
 )
-from src.domain.entities.user import User
+from src.domain.entities.user import User, UserVersion
 from src.domain.errors.domain_exceptions import (
+    InvalidCursorError,
+    InvalidFieldsError,
     InvalidFilterError,
     InvalidOrderByError,
     InvalidOrderDirectionError,
     InvalidPageError,
     InvalidPageSizeError,
 )
-from src.domain.ports.user_repository import ListUsersConfig
+from src.domain.ports.user_repository import ListUsersConfig, UserCursor
 
 
 @pytest.fixture
@@ -36,8 +39,10 @@ async def test_list_users_success(
 ):
     mock_user = create_mock_user
 
-    mock_user_repository.list_users.return_value = [mock_user]
-    mock_user_repository.count_users.return_value = 1
+    mock_user_repository.list_users_with_total.return_value = (
+        [mock_user],
+        1,
+    )
 
     response = await list_users_use_case.execute(
         ListUsersRequest(
@@ -51,10 +56,11 @@ async def test_list_users_success(
         'page': 1,
         'page_size': 10,
         'total_items': 1,
+        'next_cursor': None,
     }
 
     assert response == expected_response
-    mock_user_repository.list_users.assert_called_once_with(
+    mock_user_repository.list_users_with_total.assert_called_once_with(
         ListUsersConfig(
             page=1,
             page_size=10,
@@ -67,8 +73,10 @@ async def test_list_users_empty(
     list_users_use_case,
     mock_user_repository,
 ):
-    mock_user_repository.list_users.return_value = []
-    mock_user_repository.count_users.return_value = 0
+    mock_user_repository.list_users_with_total.return_value = (
+        [],
+        0,
+    )
 
     response = await list_users_use_case.execute(
         ListUsersRequest(
@@ -82,10 +90,11 @@ async def test_list_users_empty(
         'page': 1,
         'page_size': 10,
         'total_items': 0,
+        'next_cursor': None,
     }
 
     assert response == expected_response
-    mock_user_repository.list_users.assert_called_once_with(
+    mock_user_repository.list_users_with_total.assert_called_once_with(
         ListUsersConfig(
             page=1,
             page_size=10,
@@ -106,7 +115,7 @@ async def test_list_users_invalid_page(
             )
         )
 
-    mock_user_repository.list_users.assert_not_called()
+    mock_user_repository.list_users_with_total.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -122,7 +131,7 @@ async def test_list_users_invalid_page_size(
             )
         )
 
-    mock_user_repository.list_users.assert_not_called()
+    mock_user_repository.list_users_with_total.assert_not_called()
 
     assert str(exc.value) == 'Page size must be greater than 0'
 
@@ -140,7 +149,7 @@ async def test_list_users_invalid_page_and_page_size_negative(
             )
         )
 
-    mock_user_repository.list_users.assert_not_called()
+    mock_user_repository.list_users_with_total.assert_not_called()
 
     assert str(exc.value) == 'Page must be greater than 0'
 
@@ -192,11 +201,13 @@ async def test_list_users_with_order_by(
         created_at=datetime.now(timezone.utc) + timedelta(days=1),
     )
 
-    mock_user_repository.list_users.return_value = [
-        first_mock_user,
-        second_mock_user,
-    ]
-    mock_user_repository.count_users.return_value = 2
+    mock_user_repository.list_users_with_total.return_value = (
+        [
+            first_mock_user,
+            second_mock_user,
+        ],
+        2,
+    )
 
     response = await list_users_use_case.execute(
         ListUsersRequest(
@@ -210,7 +221,7 @@ async def test_list_users_with_order_by(
     assert response['items'][0].created_at == first_mock_user.created_at
     assert response['items'][1].created_at == second_mock_user.created_at
 
-    mock_user_repository.list_users.assert_called_once_with(
+    mock_user_repository.list_users_with_total.assert_called_once_with(
         ListUsersConfig(
             page=1,
             page_size=10,
@@ -235,11 +246,13 @@ async def test_list_users_with_order_by_and_order_direction(
         created_at=datetime.now(timezone.utc) + timedelta(days=1),
     )
 
-    mock_user_repository.list_users.return_value = [
-        second_mock_user,
-        first_mock_user,
-    ]
-    mock_user_repository.count_users.return_value = 2
+    mock_user_repository.list_users_with_total.return_value = (
+        [
+            second_mock_user,
+            first_mock_user,
+        ],
+        2,
+    )
 
     response = await list_users_use_case.execute(
         ListUsersRequest(
@@ -253,7 +266,7 @@ async def test_list_users_with_order_by_and_order_direction(
     assert response['items'][0].created_at == second_mock_user.created_at
     assert response['items'][1].created_at == first_mock_user.created_at
 
-    mock_user_repository.list_users.assert_called_once_with(
+    mock_user_repository.list_users_with_total.assert_called_once_with(
         ListUsersConfig(
             page=1,
             page_size=10,
@@ -278,7 +291,7 @@ async def test_list_users_with_invalid_order_by(
             )
         )
 
-    mock_user_repository.list_users.assert_not_called()
+    mock_user_repository.list_users_with_total.assert_not_called()
 
     assert str(exc.value) == (
         "Order by must be ['username', 'email', 'created_at']"
@@ -300,7 +313,7 @@ async def test_list_users_with_invalid_order_direction(
             )
         )
 
-    mock_user_repository.list_users.assert_not_called()
+    mock_user_repository.list_users_with_total.assert_not_called()
 
     assert str(exc.value) == "Order direction must be ['asc', 'desc']"
 
@@ -319,8 +332,10 @@ async def test_list_users_with_query(
         created_at=datetime.now(timezone.utc) + timedelta(days=1),
     )
 
-    mock_user_repository.list_users.return_value = [second_mock_user]
-    mock_user_repository.count_users.return_value = 1
+    mock_user_repository.list_users_with_total.return_value = (
+        [second_mock_user],
+        1,
+    )
 
     response = await list_users_use_case.execute(
         ListUsersRequest(
@@ -333,7 +348,7 @@ async def test_list_users_with_query(
     assert response['items'] == [second_mock_user]
     assert response['total_items'] == 1
 
-    mock_user_repository.list_users.assert_called_once_with(
+    mock_user_repository.list_users_with_total.assert_called_once_with(
         ListUsersConfig(
             page=1,
             page_size=10,
@@ -356,10 +371,12 @@ async def test_list_users_with_filters(
         created_at=datetime.now(timezone.utc) + timedelta(days=1),
     )
 
-    mock_user_repository.list_users.return_value = [
-        second_mock_user,
-    ]
-    mock_user_repository.count_users.return_value = 1
+    mock_user_repository.list_users_with_total.return_value = (
+        [
+            second_mock_user,
+        ],
+        1,
+    )
 
     response = await list_users_use_case.execute(
         ListUsersRequest(
@@ -374,7 +391,7 @@ async def test_list_users_with_filters(
     assert response['items'] == [second_mock_user]
     assert response['total_items'] == 1
 
-    mock_user_repository.list_users.assert_called_once_with(
+    mock_user_repository.list_users_with_total.assert_called_once_with(
         ListUsersConfig(
             page=1,
             page_size=10,
@@ -399,6 +416,244 @@ async def test_list_users_with_invalid_filter(
             )
         )
 
-    mock_user_repository.list_users.assert_not_called()
+    mock_user_repository.list_users_with_total.assert_not_called()
 
     assert str(exc.value) == "Filter must be ['username', 'email']"
+
+
+@pytest.mark.asyncio
+async def test_list_users_next_cursor_round_trip(
+    list_users_use_case,
+    mock_user_repository,
+    create_mock_user,
+):
+    mock_user_repository.list_users_with_total.return_value = (
+        [create_mock_user],
+        2,
+    )
+
+    response = await list_users_use_case.execute(
+        ListUsersRequest(page=1, page_size=1, order_by='username')
+    )
+
+    assert response['next_cursor'] is not None
+
+    await list_users_use_case.execute(
+        ListUsersRequest(
+            page=1,
+            page_size=1,
+            order_by='username',
+            cursor=response['next_cursor'],
+        )
+    )
+
+    config = mock_user_repository.list_users_with_total.call_args.args[0]
+    assert config.cursor == UserCursor(
+        value=create_mock_user.username,
+        id=create_mock_user.id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_users_next_cursor_decodes_created_at(
+    list_users_use_case,
+    mock_user_repository,
+    create_mock_user,
+):
+    mock_user_repository.list_users_with_total.return_value = (
+        [create_mock_user],
+        2,
+    )
+
+    response = await list_users_use_case.execute(
+        ListUsersRequest(page=1, page_size=1)
+    )
+    await list_users_use_case.execute(
+        ListUsersRequest(page=1, page_size=1, cursor=response['next_cursor'])
+    )
+
+    config = mock_user_repository.list_users_with_total.call_args.args[0]
+    assert config.cursor.value == create_mock_user.created_at
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_malformed_cursor(
+    list_users_use_case,
+    mock_user_repository,
+):
+    with pytest.raises(InvalidCursorError) as exc:
+        await list_users_use_case.execute(
+            ListUsersRequest(page=1, page_size=10, cursor='not-a-cursor')
+        )
+
+    assert str(exc.value) == 'Cursor is malformed'
+    mock_user_repository.list_users_with_total.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_cursor_for_another_ordering(
+    list_users_use_case,
+    mock_user_repository,
+    create_mock_user,
+):
+    mock_user_repository.list_users_with_total.return_value = (
+        [create_mock_user],
+        2,
+    )
+
+    response = await list_users_use_case.execute(
+        ListUsersRequest(page=1, page_size=1, order_by='username')
+    )
+
+    with pytest.raises(InvalidCursorError) as exc:
+        await list_users_use_case.execute(
+            ListUsersRequest(
+                page=1,
+                page_size=1,
+                order_by='email',
+                cursor=response['next_cursor'],
+            )
+        )
+
+    assert str(exc.value) == 'Cursor does not match the requested ordering'
+
+
+@pytest.mark.asyncio
+async def test_list_users_without_total(
+    list_users_use_case,
+    mock_user_repository,
+    create_mock_user,
+):
+    mock_user_repository.list_users.return_value = [create_mock_user]
+
+    response = await list_users_use_case.execute(
+        ListUsersRequest(page=1, page_size=10, include_total=False)
+    )
+
+    assert response['items'] == [create_mock_user]
+    assert response['total_items'] is None
+    mock_user_repository.list_users.assert_called_once_with(
+        ListUsersConfig(page=1, page_size=10)
+    )
+    mock_user_repository.list_users_with_total.assert_not_called()
+    mock_user_repository.count_users.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_users_relevance_ranked_search_has_no_cursor(
+    list_users_use_case,
+    mock_user_repository,
+    create_mock_user,
+):
+    mock_user_repository.list_users_with_total.return_value = (
+        [create_mock_user],
+        2,
+    )
+
+    response = await list_users_use_case.execute(
+        ListUsersRequest(page=1, page_size=1, query='test')
+    )
+
+    assert response['next_cursor'] is None
+
+
+@pytest.mark.asyncio
+async def test_list_users_versions(
+    list_users_use_case,
+    mock_user_repository,
+    create_mock_user,
+):
+    version = UserVersion(create_mock_user.id, create_mock_user.updated_at)
+    mock_user_repository.list_user_versions.return_value = ([version], 1)
+
+    response = await list_users_use_case.execute_versions(
+        ListUsersRequest(page=1, page_size=10, include_total=False)
+    )
+
+    assert response == {
+        'items': [version],
+        'total_items': 1,
+        'page': 1,
+        'page_size': 10,
+    }
+    mock_user_repository.list_user_versions.assert_called_once_with(
+        ListUsersConfig(page=1, page_size=10), False
+    )
+    mock_user_repository.list_users.assert_not_called()
+    mock_user_repository.list_users_with_total.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_users_versions_validates_the_request(
+    list_users_use_case,
+    mock_user_repository,
+):
+    with pytest.raises(InvalidPageError):
+        await list_users_use_case.execute_versions(
+            ListUsersRequest(page=0, page_size=10)
+        )
+
+    mock_user_repository.list_user_versions.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_users(
+    list_users_use_case,
+    mock_user_repository,
+):
+    users = object()
+    mock_user_repository.stream_users = Mock(return_value=users)
+
+    result = list_users_use_case.stream(
+        ExportUsersRequest(query='test', filters={'username': 'test'})
+    )
+
+    assert result is users
+    mock_user_repository.stream_users.assert_called_once()
+    config = mock_user_repository.stream_users.call_args.args[0]
+    assert config.query == 'test'
+    assert config.filters == {'username': 'test'}
+
+
+@pytest.mark.asyncio
+async def test_stream_users_validates_the_request(
+    list_users_use_case,
+    mock_user_repository,
+):
+    with pytest.raises(InvalidOrderByError):
+        list_users_use_case.stream(ExportUsersRequest(order_by='password'))
+
+    with pytest.raises(InvalidFilterError):
+        list_users_use_case.stream(
+            ExportUsersRequest(filters={'password_hash': 'x'})
+        )
+
+    mock_user_repository.stream_users.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_users_with_fields(
+    list_users_use_case,
+    mock_user_repository,
+):
+    mock_user_repository.list_users_with_total.return_value = ([], 0)
+
+    await list_users_use_case.execute(
+        ListUsersRequest(page=1, page_size=10, fields=['id', 'username'])
+    )
+
+    config = mock_user_repository.list_users_with_total.call_args.args[0]
+    assert config.fields == ('id', 'username')
+
+
+@pytest.mark.asyncio
+async def test_list_users_invalid_fields(
+    list_users_use_case,
+    mock_user_repository,
+):
+    with pytest.raises(InvalidFieldsError):
+        await list_users_use_case.execute(
+            ListUsersRequest(page=1, page_size=10, fields=['password_hash'])
+        )
+
+    mock_user_repository.list_users_with_total.assert_not_called()
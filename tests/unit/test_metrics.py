@@ -0,0 +1,172 @@
+from http import HTTPStatus
+from types import SimpleNamespace
+
+import pytest
+
+from src.adapters.api.metrics import UNMATCHED_ROUTE, MetricsMiddleware
+from src.infrastructure.metrics import Gauge, Histogram, Registry
+
+
+def samples(lines: list[str]) -> dict[str, float]:
+    """Rendered series by name and labels, without comments."""
+    return {
+        series: float(value)
+        for series, _, value in (
+            line.rpartition(' ') for line in lines if not line.startswith('#')
+        )
+    }
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram('latency_seconds', 'Latency.', ('route',), (0.1, 1))
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.observe(value, '/users')
+
+    lines = histogram.render()
+
+    assert lines[:2] == [
+        '# HELP latency_seconds Latency.',
+        '# TYPE latency_seconds histogram',
+    ]
+    assert samples(lines) == {
+        'latency_seconds_bucket{route="/users",le="0.1"}': 2,
+        'latency_seconds_bucket{route="/users",le="1"}': 3,
+        'latency_seconds_bucket{route="/users",le="+Inf"}': 4,
+        'latency_seconds_sum{route="/users"}': 3.65,
+        'latency_seconds_count{route="/users"}': 4,
+    }
+
+
+def test_histogram_keeps_a_series_per_label_values():
+    histogram = Histogram('latency_seconds', 'Latency.', ('status',), (1,))
+    histogram.observe(0.5, '200')
+    histogram.observe(0.5, '404')
+
+    rendered = samples(histogram.render())
+
+    assert rendered['latency_seconds_count{status="200"}'] == 1
+    assert rendered['latency_seconds_count{status="404"}'] == 1
+
+
+def test_labels_are_escaped():
+    histogram = Histogram('latency_seconds', 'Latency.', ('route',), (1,))
+    histogram.observe(0.5, 'a"b\\c\nd')
+
+    assert (
+        'latency_seconds_count{route="a\\"b\\\\c\\nd"} 1' in histogram.render()
+    )
+
+
+def test_gauge_reads_its_values_when_rendered():
+    values = {('idle',): 1}
+    gauge = Gauge('pool', 'Pool.', lambda: values, ('state',))
+
+    first = gauge.render()
+    values[('idle',)] = 3
+
+    assert first[-1] == 'pool{state="idle"} 1'
+    assert gauge.render()[-1] == 'pool{state="idle"} 3'
+
+
+def test_registry_renders_every_metric():
+    registry = Registry()
+    registry.register(Histogram('first_seconds', 'First.'))
+    registry.register(Gauge('second', 'Second.', lambda: {(): 2}))
+
+    text = registry.render()
+
+    assert '# TYPE first_seconds histogram' in text
+    assert text.endswith('second 2\n')
+
+
+@pytest.fixture
+def histogram():
+    return Histogram('requests', 'Requests.', ('method', 'route', 'status'))
+
+
+async def call(middleware, scope):
+    sent = []
+
+    async def receive():
+        return {'type': 'http.request'}
+
+    async def send(message):
+        sent.append(message)
+
+    await middleware(scope, receive, send)
+    return sent
+
+
+def responding(status, route=None):
+    async def app(scope, receive, send):
+        if route is not None:
+            scope['route'] = SimpleNamespace(path=route)
+        await send({'type': 'http.response.start', 'status': status})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_middleware_records_route_template_and_status(histogram):
+    middleware = MetricsMiddleware(
+        responding(HTTPStatus.OK, '/users/{user_id}'), histogram
+    )
+
+    sent = await call(middleware, {'type': 'http', 'method': 'GET'})
+
+    assert sent[0]['status'] == HTTPStatus.OK
+    assert (
+        samples(histogram.render())[
+            'requests_count{method="GET",route="/users/{user_id}",status="200"}'
+        ]
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_middleware_groups_unmatched_paths(histogram):
+    middleware = MetricsMiddleware(responding(HTTPStatus.NOT_FOUND), histogram)
+
+    await call(middleware, {'type': 'http', 'method': 'GET'})
+
+    assert (
+        samples(histogram.render())[
+            f'requests_count{{method="GET",route="{UNMATCHED_ROUTE}",'
+            'status="404"}'
+        ]
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_middleware_records_failures_as_server_errors(histogram):
+    async def failing(scope, receive, send):
+        raise RuntimeError
+
+    middleware = MetricsMiddleware(failing, histogram)
+
+    with pytest.raises(RuntimeError):
+        await call(middleware, {'type': 'http', 'method': 'POST'})
+
+    assert (
+        samples(histogram.render())[
+            f'requests_count{{method="POST",route="{UNMATCHED_ROUTE}",'
+            'status="500"}'
+        ]
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_middleware_passes_other_scopes_through(histogram):
+    scopes = []
+
+    async def app(scope, receive, send):
+        scopes.append(scope)
+
+    middleware = MetricsMiddleware(app, histogram)
+    await call(middleware, {'type': 'lifespan'})
+
+    assert scopes == [{'type': 'lifespan'}]
+    assert samples(histogram.render()) == {}
@@ -0,0 +1,64 @@
+import json
+from datetime import datetime
+from uuid import uuid4
+
+from src.adapters.api.responses import (
+    UserListPayload,
+    UserPayload,
+    json_response,
+    user_list_serializer,
+    user_serializer,
+)
+from src.adapters.api.schemas.user import UserListResponse, UserResponse
+from src.domain.entities.user import UserSummary
+
+
+def test_payloads_mirror_the_response_models():
+    assert list(UserPayload.__annotations__) == list(UserResponse.model_fields)
+    assert list(UserListPayload.__annotations__) == list(
+        UserListResponse.model_fields
+    )
+
+
+def test_json_response_matches_the_response_model():
+    user = UserSummary(
+        id=uuid4(),
+        username='testuser',
+        email='test@example.com',
+        created_at=datetime(2025, 1, 1, 12, 30),
+        updated_at=None,
+    )
+    content = {
+        'items': [user._asdict()],
+        'total_items': 1,
+        'page': 1,
+        'page_size': 10,
+        'next_cursor': None,
+    }
+
+    response = json_response(user_list_serializer, content, {'ETag': '"x"'})
+
+    expected = UserListResponse.model_validate(content).model_dump(mode='json')
+    assert json.loads(response.body) == expected
+    assert response.media_type == 'application/json'
+    assert response.headers['ETag'] == '"x"'
+
+
+def test_user_serializer():
+    user = UserSummary(
+        id=uuid4(),
+        username='testuser',
+        email='test@example.com',
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 2),
+    )
+
+    body = json_response(user_serializer, user._asdict()).body
+
+    assert json.loads(body) == {
+        'id': str(user.id),
+        'username': 'testuser',
+        'email': 'test@example.com',
+        'created_at': '2025-01-01T00:00:00',
+        'updated_at': '2025-01-02T00:00:00',
+    }
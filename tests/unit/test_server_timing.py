@@ -0,0 +1,106 @@
+from http import HTTPStatus
+
+import pytest
+
+from src.adapters.api.server_timing import ServerTimingMiddleware
+from src.infrastructure import server_timing
+
+
+def parse(header: str) -> dict[str, dict[str, str]]:
+    """Server-Timing metrics by name, with their parameters."""
+    metrics = {}
+    for metric in header.split(', '):
+        name, *params = metric.split(';')
+        metrics[name] = dict(param.split('=', 1) for param in params)
+    return metrics
+
+
+def test_phases_accumulate_time_and_count():
+    timing = server_timing.ServerTiming()
+    timing.record(server_timing.DB, 0.001)
+    timing.record(server_timing.DB, 0.002)
+    timing.record(server_timing.HASH, 0.05)
+
+    metrics = parse(timing.header_value())
+
+    assert list(metrics) == ['db', 'hash', 'total']
+    assert metrics['db'] == {'desc': '"2 statements"', 'dur': '3.000'}
+    assert metrics['hash'] == {'desc': '"1 hashes"', 'dur': '50.000'}
+
+
+def test_recording_outside_a_request_is_ignored():
+    server_timing.record(server_timing.DB, 1.0)
+    with server_timing.timed(server_timing.JWT):
+        pass
+
+    timing, token = server_timing.start()
+    server_timing.stop(token)
+
+    assert timing.phases == {}
+
+
+def test_timed_records_into_the_current_request():
+    timing, token = server_timing.start()
+    try:
+        with server_timing.timed(server_timing.SERIALIZE):
+            pass
+        server_timing.record(server_timing.DB, 0.5)
+    finally:
+        server_timing.stop(token)
+
+    assert set(timing.phases) == {'serialize', 'db'}
+    assert timing.phases['db'] == [0.5, 1]
+
+
+async def call(middleware, headers=()):
+    sent = []
+
+    async def receive():
+        return {'type': 'http.request'}
+
+    async def send(message):
+        sent.append(message)
+
+    await middleware(
+        {'type': 'http', 'method': 'GET', 'headers': list(headers)},
+        receive,
+        send,
+    )
+    return dict(sent[0]['headers'])
+
+
+async def app(scope, receive, send):
+    server_timing.record(server_timing.DB, 0.001)
+    await send({
+        'type': 'http.response.start',
+        'status': HTTPStatus.OK,
+        'headers': [(b'content-type', b'application/json')],
+    })
+    await send({'type': 'http.response.body', 'body': b'{}'})
+
+
+@pytest.mark.asyncio
+async def test_header_mode_answers_requests_that_ask():
+    middleware = ServerTimingMiddleware(app, 'header')
+
+    headers = await call(middleware, [(b'x-server-timing', b'1')])
+
+    assert headers[b'content-type'] == b'application/json'
+    assert set(parse(headers[b'server-timing'].decode())) == {'db', 'total'}
+
+
+@pytest.mark.asyncio
+async def test_header_mode_leaves_other_requests_alone():
+    middleware = ServerTimingMiddleware(app, 'header')
+
+    assert b'server-timing' not in await call(middleware)
+
+
+@pytest.mark.asyncio
+async def test_always_and_off_modes():
+    always = ServerTimingMiddleware(app, 'always')
+    off = ServerTimingMiddleware(app, 'off')
+    asking = [(b'x-server-timing', b'1')]
+
+    assert b'server-timing' in await call(always)
+    assert b'server-timing' not in await call(off, asking)
@@ -0,0 +1,100 @@
+import pytest
+
+from src.adapters.auth.token_cache import (
+    VerifiedTokenCache,
+    instrument_token_cache,
+)
+from src.infrastructure.metrics import Registry
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def test_get_returns_cached_subject_and_counts_hits(clock):
+    cache = VerifiedTokenCache(clock=clock)
+    cache.put('token', 'test@example.com', clock.now + 60)
+
+    assert cache.get('token') == 'test@example.com'
+    assert cache.get('other') is None
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+
+def test_entries_expire_at_token_exp(clock):
+    cache = VerifiedTokenCache(clock=clock)
+    cache.put('token', 'test@example.com', clock.now + 60)
+
+    clock.now += 60
+
+    assert cache.get('token') is None
+    assert len(cache) == 0
+    assert cache.misses == 1
+
+
+def test_expired_tokens_are_not_cached(clock):
+    cache = VerifiedTokenCache(clock=clock)
+
+    cache.put('token', 'test@example.com', clock.now)
+
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = VerifiedTokenCache(max_size=2, clock=clock)
+    cache.put('first', 'first@example.com', clock.now + 60)
+    cache.put('second', 'second@example.com', clock.now + 60)
+
+    cache.get('first')
+    cache.put('third', 'third@example.com', clock.now + 60)
+
+    assert cache.get('second') is None
+    assert cache.get('first') == 'first@example.com'
+    assert cache.get('third') == 'third@example.com'
+
+
+def test_zero_size_disables_the_cache(clock):
+    cache = VerifiedTokenCache(max_size=0, clock=clock)
+
+    cache.put('token', 'test@example.com', clock.now + 60)
+
+    assert cache.get('token') is None
+
+
+def test_clear_drops_entries_and_counters(clock):
+    cache = VerifiedTokenCache(clock=clock)
+    cache.put('token', 'test@example.com', clock.now + 60)
+    cache.get('token')
+
+    cache.clear()
+
+    assert cache.stats() == {'hits': 0, 'misses': 0, 'size': 0}
+
+
+def test_instrument_token_cache_exposes_its_counters(clock):
+    cache = VerifiedTokenCache(clock=clock)
+    metrics = Registry()
+    instrument_token_cache(cache, metrics)
+
+    cache.put('token', 'user@example.com', clock.now + 60)
+    cache.get('token')
+    cache.get('other')
+
+    samples = {
+        line
+        for line in metrics.render().splitlines()
+        if not line.startswith('#')
+    }
+    assert samples == {
+        'jwt_token_cache_hits 1',
+        'jwt_token_cache_misses 1',
+        'jwt_token_cache_size 1',
+    }
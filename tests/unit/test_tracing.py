@@ -0,0 +1,273 @@
+import json
+from http import HTTPStatus
+from types import SimpleNamespace
+
+import pytest
+
+from src.adapters.api.tracing import TracingMiddleware
+from src.infrastructure.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    Tracer,
+    current_span,
+    parse_traceparent,
+    trace_methods,
+    traced,
+    tracer,
+)
+
+TRACE_ID = '4bf92f3577b34da6a3ce929d0e0e4736'
+PARENT_ID = '00f067aa0ba902b7'
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def global_exporter(exporter):
+    tracer.configure(exporter)
+    yield exporter
+    tracer.shutdown()
+
+
+def test_nested_spans_share_the_trace(exporter):
+    spans = Tracer(exporter)
+
+    with spans.span('outer') as outer, spans.span('inner') as inner:
+        assert current_span() is inner
+
+    assert current_span() is None
+    assert [span.name for span in exporter.spans] == ['inner', 'outer']
+    assert inner.trace_id == outer.trace_id
+    assert inner.parent_span_id == outer.span_id
+    assert outer.parent_span_id is None
+    assert {inner.status, outer.status} == {'OK'}
+
+
+def test_span_records_attributes_and_errors(exporter):
+    spans = Tracer(exporter)
+
+    with (
+        pytest.raises(LookupError),
+        spans.span('failing', key='value'),
+    ):
+        raise LookupError
+
+    (span,) = exporter.spans
+    assert span.attributes == {'key': 'value'}
+    assert span.to_dict()['status'] == {
+        'code': 'ERROR',
+        'message': 'LookupError',
+    }
+    assert span.end_time_unix_nano >= span.start_time_unix_nano
+
+
+def test_disabled_tracer_records_nothing():
+    with Tracer().span('root') as span:
+        assert span is None
+        assert current_span() is None
+
+
+def test_unsampled_traces_are_dropped_with_their_children(exporter):
+    spans = Tracer(exporter, sample_ratio=0.0)
+
+    with spans.span('root') as root, spans.span('child') as child:
+        assert root is None
+        assert child is None
+
+    assert exporter.spans == []
+
+
+def test_remote_parent_decides_sampling(exporter):
+    spans = Tracer(exporter, sample_ratio=0.0)
+
+    with spans.span(
+        'root', parse_traceparent(f'00-{TRACE_ID}-{PARENT_ID}-01')
+    ):
+        pass
+
+    (span,) = exporter.spans
+    assert span.trace_id == TRACE_ID
+    assert span.parent_span_id == PARENT_ID
+
+
+@pytest.mark.parametrize(
+    'header',
+    [
+        None,
+        'garbage',
+        f'01-{TRACE_ID}-{PARENT_ID}-01',
+        f'00-{"0" * 32}-{PARENT_ID}-01',
+        f'00-{TRACE_ID}-{"0" * 16}-01',
+    ],
+)
+def test_invalid_traceparent_is_ignored(header):
+    assert parse_traceparent(header) is None
+
+
+def test_traceparent_flags():
+    sampled = parse_traceparent(f'00-{TRACE_ID}-{PARENT_ID}-01')
+    unsampled = parse_traceparent(f'00-{TRACE_ID}-{PARENT_ID}-00')
+
+    assert sampled.sampled
+    assert not unsampled.sampled
+
+
+def test_in_memory_exporter_keeps_the_latest_spans():
+    spans = Tracer(InMemorySpanExporter(max_spans=1))
+    for name in ('first', 'second'):
+        with spans.span(name):
+            pass
+
+    assert [span.name for span in spans.exporter.spans] == ['second']
+
+
+def test_file_exporter_writes_json_lines(tmp_path):
+    path = tmp_path / 'traces.jsonl'
+    spans = Tracer(FileSpanExporter(str(path)))
+
+    with spans.span('root'), spans.span('child'):
+        pass
+    spans.shutdown()
+
+    child, root = (json.loads(line) for line in path.read_text().splitlines())
+    assert child['name'] == 'child'
+    assert child['parentSpanId'] == root['spanId']
+    assert not root['parentSpanId']
+    assert root['status'] == {'code': 'OK'}
+
+
+class Service:
+    def __init__(self):
+        self.calls = 0
+
+    async def run(self, value):
+        self.calls += 1
+        return value
+
+
+@pytest.mark.asyncio
+async def test_traced_records_nothing_when_disabled():
+    @traced()
+    async def echo(value):
+        return current_span()
+
+    assert await echo('value') is None
+
+
+@pytest.mark.asyncio
+async def test_traced_names_the_span_after_the_function(global_exporter):
+    @traced()
+    async def echo(value):
+        return value
+
+    assert await echo('value') == 'value'
+    assert [span.name for span in global_exporter.spans] == [echo.__qualname__]
+
+
+@pytest.mark.asyncio
+async def test_trace_methods_names_spans_after_the_class(global_exporter):
+    service = trace_methods(Service(), 'run')
+
+    assert await service.run('value') == 'value'
+    assert [span.name for span in global_exporter.spans] == ['Service.run']
+
+
+async def call(middleware, scope):
+    sent = []
+
+    async def receive():
+        return {'type': 'http.request'}
+
+    async def send(message):
+        sent.append(message)
+
+    await middleware(scope, receive, send)
+    return sent
+
+
+def http_scope(method='GET', path='/users/1', headers=()):
+    return {
+        'type': 'http',
+        'method': method,
+        'path': path,
+        'headers': list(headers),
+    }
+
+
+def responding(status, route=None):
+    async def app(scope, receive, send):
+        if route is not None:
+            scope['route'] = SimpleNamespace(path=route)
+        with tracer.span('child'):
+            pass
+        await send({'type': 'http.response.start', 'status': status})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_middleware_names_the_root_span_after_the_route(
+    global_exporter,
+):
+    middleware = TracingMiddleware(
+        responding(HTTPStatus.OK, '/users/{user_id}')
+    )
+
+    await call(middleware, http_scope())
+
+    child, root = global_exporter.spans
+    assert root.name == 'GET /users/{user_id}'
+    assert root.attributes == {
+        'http.request.method': 'GET',
+        'url.path': '/users/1',
+        'http.route': '/users/{user_id}',
+        'http.response.status_code': HTTPStatus.OK,
+    }
+    assert root.status == 'OK'
+    assert child.parent_span_id == root.span_id
+
+
+@pytest.mark.asyncio
+async def test_middleware_joins_the_callers_trace(global_exporter):
+    middleware = TracingMiddleware(responding(HTTPStatus.NOT_FOUND))
+    traceparent = f'00-{TRACE_ID}-{PARENT_ID}-01'.encode()
+
+    await call(middleware, http_scope(headers=[(b'traceparent', traceparent)]))
+
+    root = global_exporter.spans[-1]
+    assert root.name == 'GET <unmatched>'
+    assert root.trace_id == TRACE_ID
+    assert root.parent_span_id == PARENT_ID
+
+
+@pytest.mark.asyncio
+async def test_middleware_marks_failures_as_errors(global_exporter):
+    async def failing(scope, receive, send):
+        raise RuntimeError
+
+    middleware = TracingMiddleware(failing)
+
+    with pytest.raises(RuntimeError):
+        await call(middleware, http_scope('POST'))
+
+    (root,) = global_exporter.spans
+    assert root.status == 'ERROR'
+    assert root.attributes['http.response.status_code'] == (
+        HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+
+
+@pytest.mark.asyncio
+async def test_middleware_marks_server_error_responses(global_exporter):
+    middleware = TracingMiddleware(
+        responding(HTTPStatus.SERVICE_UNAVAILABLE, '/users')
+    )
+
+    await call(middleware, http_scope())
+
+    root = global_exporter.spans[-1]
+    assert root.to_dict()['status'] == {'code': 'ERROR', 'message': 'HTTP 503'}
@@ -31,10 +31,6 @@ async def test_update_user_success(
     existing_user = create_mock_user
     existing_user.id = user_id
 
-    mock_user_repository.get_user_by_id.return_value = existing_user
-    mock_user_repository.get_user_by_email.return_value = None
-    mock_user_repository.get_user_by_username.return_value = None
-
     updated_user = User(
         id=user_id,
         username='newusername',
@@ -55,14 +51,15 @@ async def test_update_user_success(
     assert result.email == 'newemail@example.com'
     assert result.id == user_id
 
-    mock_user_repository.get_user_by_id.assert_called_once_with(user_id)
-    mock_user_repository.get_user_by_email.assert_called_once_with(
-        'newemail@example.com'
-    )
-    mock_user_repository.get_user_by_username.assert_called_once_with(
-        'newusername'
-    )
+    mock_user_repository.get_user_by_email.assert_not_called()
+    mock_user_repository.get_user_by_username.assert_not_called()
+    mock_user_repository.get_user_by_id.assert_not_called()
     mock_user_repository.update_user.assert_called_once()
+    called_id, changes = mock_user_repository.update_user.call_args.args
+    assert called_id == user_id
+    assert changes['username'] == 'newusername'
+    assert changes['email'] == 'newemail@example.com'
+    assert 'updated_at' in changes
 
 
 @pytest.mark.asyncio
@@ -75,10 +72,6 @@ async def test_update_user_partial_update(
     existing_user = create_mock_user
     existing_user.id = user_id
 
-    mock_user_repository.get_user_by_id.return_value = existing_user
-    mock_user_repository.get_user_by_email.return_value = None
-    mock_user_repository.get_user_by_username.return_value = None
-
     updated_user = User(
         id=user_id,
         username='newusername',
@@ -97,12 +90,9 @@ async def test_update_user_partial_update(
     assert result.username == 'newusername'
     assert result.email == existing_user.email
 
-    mock_user_repository.get_user_by_id.assert_called_once_with(user_id)
-    mock_user_repository.get_user_by_username.assert_called_once_with(
-        'newusername'
-    )
-    mock_user_repository.get_user_by_email.assert_not_called()
     mock_user_repository.update_user.assert_called_once()
+    _, changes = mock_user_repository.update_user.call_args.args
+    assert set(changes) == {'username', 'updated_at'}
 
 
 @pytest.mark.asyncio
@@ -111,7 +101,9 @@ async def test_update_user_not_found(
     mock_user_repository,
 ):
     user_id = uuid4()
-    mock_user_repository.get_user_by_id.return_value = None
+    mock_user_repository.update_user.side_effect = UserNotFoundError(
+        f'User with id {user_id} not found'
+    )
 
     with pytest.raises(UserNotFoundError) as exc:
         await update_user_use_case.execute(
@@ -120,8 +112,8 @@ async def test_update_user_not_found(
         )
 
     assert str(exc.value) == f'User with id {user_id} not found'
-    mock_user_repository.get_user_by_id.assert_called_once_with(user_id)
-    mock_user_repository.update_user.assert_not_called()
+    mock_user_repository.get_user_by_id.assert_not_called()
+    mock_user_repository.update_user.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -136,8 +128,9 @@ async def test_update_user_duplicate_email(
 
     existing_user.email = 'old@example.com'
 
-    mock_user_repository.get_user_by_id.return_value = existing_user
-    mock_user_repository.get_user_by_email.return_value = create_mock_user
+    mock_user_repository.update_user.side_effect = UserAlreadyExistsError(
+        'User with email newemail@example.com already exists'
+    )
 
     with pytest.raises(UserAlreadyExistsError) as exc:
         await update_user_use_case.execute(
@@ -148,11 +141,8 @@ async def test_update_user_duplicate_email(
     assert str(exc.value) == (
         'User with email newemail@example.com already exists'
     )
-    mock_user_repository.get_user_by_id.assert_called_once_with(user_id)
-    mock_user_repository.get_user_by_email.assert_called_once_with(
-        'newemail@example.com'
-    )
-    mock_user_repository.update_user.assert_not_called()
+    mock_user_repository.get_user_by_email.assert_not_called()
+    mock_user_repository.update_user.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -167,9 +157,9 @@ async def test_update_user_duplicate_username(
 
     existing_user.username = 'oldusername'
 
-    mock_user_repository.get_user_by_id.return_value = existing_user
-    mock_user_repository.get_user_by_email.return_value = None
-    mock_user_repository.get_user_by_username.return_value = create_mock_user
+    mock_user_repository.update_user.side_effect = UserAlreadyExistsError(
+        'User with username newusername already exists'
+    )
 
     with pytest.raises(UserAlreadyExistsError) as exc:
         await update_user_use_case.execute(
@@ -178,11 +168,8 @@ async def test_update_user_duplicate_username(
         )
 
     assert str(exc.value) == 'User with username newusername already exists'
-    mock_user_repository.get_user_by_id.assert_called_once_with(user_id)
-    mock_user_repository.get_user_by_username.assert_called_once_with(
-        'newusername'
-    )
-    mock_user_repository.update_user.assert_not_called()
+    mock_user_repository.get_user_by_username.assert_not_called()
+    mock_user_repository.update_user.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -195,8 +182,6 @@ async def test_update_user_no_changes(
     existing_user = create_mock_user
     existing_user.id = user_id
 
-    mock_user_repository.get_user_by_id.return_value = existing_user
-
     updated_user = User(
         id=user_id,
         username=existing_user.username,
@@ -216,7 +201,4 @@ async def test_update_user_no_changes(
     assert result.username == existing_user.username
     assert result.email == existing_user.email
 
-    mock_user_repository.get_user_by_id.assert_called_once_with(user_id)
-    mock_user_repository.get_user_by_email.assert_not_called()
-    mock_user_repository.get_user_by_username.assert_not_called()
     mock_user_repository.update_user.assert_called_once()
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
@@ -59,7 +60,9 @@ async def test_get_user_by_username_abstract_method(mock_repository):
 @pytest.mark.asyncio
 async def test_update_user_abstract_method(mock_repository, sample_user):
     mock_repository.update_user.return_value = sample_user
-    result = await mock_repository.update_user(sample_user)
+    result = await mock_repository.update_user(
+        sample_user.id, {'username': sample_user.username}
+    )
     assert result == sample_user
 
 
@@ -119,3 +122,22 @@ def test_list_users_config_with_optional_fields():
 def test_user_repository_is_abstract():
     with pytest.raises(TypeError):
         UserRepository()
+
+
+def test_user_from_row(sample_user):
+    row = SimpleNamespace(
+        **sample_user.model_dump(), _sa_instance_state=object()
+    )
+
+    user = User.from_row(row)
+
+    assert user == sample_user
+    assert user.model_fields_set == set(User.model_fields)
+    assert not hasattr(user, '_sa_instance_state')
+
+
+def test_user_from_row_trusts_stored_data(sample_user):
+    # Stored rows were validated on write; reads do not check them again.
+    row = SimpleNamespace(**{**sample_user.model_dump(), 'email': 'legacy'})
+
+    assert User.from_row(row).email == 'legacy'